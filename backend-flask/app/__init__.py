@@ -1,4 +1,5 @@
 import datetime
+import json
 import logging
 import os
 
@@ -10,10 +11,16 @@ from flask_migrate import Migrate
 from flask_swagger_ui import get_swaggerui_blueprint
 
 from .config import get_config
-from .extensions import db
+from .extensions import db, init_sqlite_pragmas, query_profiler
 from .routes import register_blueprints
+from .services.response_cache import get_response_cache
 from .swagger import swagger_config
+from .utils.http_cache import get_api_cache
+from .utils.json_provider import init_json_provider
+from .utils.metrics import init_metrics
 from .utils.middleware import handle_errors
+from .utils.moderation_cache import get_moderation_cache
+from .utils.single_flight import single_flight_stats
 
 # Add logger configuration
 logger = logging.getLogger(__name__)
@@ -21,25 +28,34 @@ logger = logging.getLogger(__name__)
 # Create extensions
 migrate = Migrate()
 
-# Create a limiter instance
+# Create a limiter instance; storage and strategy come from the
+# RATELIMIT_* settings
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://",
 )
 
 
+def _json_serializer(value):
+    """Store JSON columns as UTF-8 text, so full-text search sees real words."""
+    return json.dumps(value, ensure_ascii=False)
+
+
 def create_app(config_name="development"):
     app = Flask(__name__)
     app.config.from_object(get_config(config_name))
+    init_json_provider(app)
 
     # Configure SQLAlchemy engine options based on environment
     if config_name == "testing":
         # No pooling for testing
-        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {}
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "json_serializer": _json_serializer,
+        }
     else:
         # Use connection pooling for development/production
         app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "json_serializer": _json_serializer,
             "pool_size": 10,
             "pool_recycle": 3600,
             "pool_pre_ping": True,
@@ -48,19 +64,20 @@ def create_app(config_name="development"):
 
     # Initialize extensions
     db.init_app(app)
+    init_sqlite_pragmas(app)
     migrate.init_app(app, db)
+    init_metrics(app)
+    query_profiler.init_app(app)
     limiter.init_app(app)
+    # Prometheus scrapes more often than the default limits allow
+    limiter.exempt(app.view_functions["metrics"])
 
     # Update CORS configuration
     CORS(
         app,
         resources={
             r"/*": {
-                "origins": [
-                    "http://localhost:5173",  # Vite dev server
-                    "http://localhost:5000",  # Flask backend
-                    "http://localhost",  # Production
-                ],
+                "origins": app.config["CORS_ORIGINS"],
                 "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
                 "allow_headers": ["Content-Type", "Authorization"],
                 "supports_credentials": True,
@@ -116,6 +133,14 @@ def create_app(config_name="development"):
         except Exception as e:
             raise e
 
+    def _response_cache_stats():
+        cache = get_response_cache()
+        return cache.stats() if cache is not None else None
+
+    def _api_cache_stats():
+        cache = get_api_cache()
+        return cache.stats() if cache is not None else None
+
     @app.route("/api/health")
     @handle_errors
     def health_check():
@@ -125,6 +150,10 @@ def create_app(config_name="development"):
                     "status": "healthy",
                     "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
                     "version": "1.0.0",
+                    "moderationCache": get_moderation_cache().stats(),
+                    "responseCache": _response_cache_stats(),
+                    "apiCache": _api_cache_stats(),
+                    "coalescing": single_flight_stats(),
                 }
             )
         except Exception as e:
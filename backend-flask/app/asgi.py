@@ -0,0 +1,313 @@
+"""ASGI entry point.
+
+Serves ``POST /api/vocabulary/generate`` natively on the event loop and
+hands every other request to the Flask app through ``WsgiToAsgi``. While a
+completion is in progress the request only holds an awaiting task, not a
+worker thread, so one worker can keep many generate calls in flight. If the
+client disconnects, the OpenAI call is cancelled. Requests that accept
+``text/event-stream`` (or pass ``?stream=true``) get the output as
+Server-Sent Events while it is generated.
+
+The app's rate limits apply to the endpoint as they do to Flask routes.
+
+Run with any ASGI server, e.g. ``uvicorn asgi:app``.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi
+from werkzeug.exceptions import HTTPException
+from werkzeug.test import EnvironBuilder
+
+from . import create_app
+from .services.generation import (
+    GenerationTimeout,
+    get_generation_runner,
+    sse_event,
+    wants_stream,
+)
+from .utils.langchain_guardrails import get_guardrails
+from .utils.metrics import REQUESTS_IN_PROGRESS, record_request
+
+logger = logging.getLogger(__name__)
+
+GENERATE_PATH = "/api/vocabulary/generate"
+
+
+class _Disconnected(Exception):
+    """The client went away before the response was sent."""
+
+
+async def _read_body(receive) -> bytes:
+    body = b""
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise _Disconnected()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            return body
+
+
+async def _wait_for_disconnect(receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _unless_disconnected(task: asyncio.Future, receive) -> bool:
+    """Wait for ``task``, cancelling it if the client disconnects first.
+
+    Returns:
+        bool: False if the client went away
+    """
+    disconnect = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        await asyncio.wait({task, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        disconnect.cancel()
+    if not task.done():
+        task.cancel()
+        logger.info("Client disconnected, generation cancelled")
+        return False
+    return True
+
+
+class GenerateApp:
+    """ASGI app for the Flask app with an async generate endpoint.
+
+    Args:
+        flask_app: Application whose config, guardrails and generation
+            runner the endpoint uses
+    """
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http" and self._is_generate(scope):
+            await self._timed_generate(scope, receive, send)
+        else:
+            await self.wsgi(scope, receive, send)
+
+    async def _timed_generate(self, scope, receive, send) -> None:
+        """Serve a generate call, recording the request metrics Flask would."""
+        status = 499  # the client went away before a response was started
+
+        async def send_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with REQUESTS_IN_PROGRESS.track_inprogress():
+            try:
+                await self._generate(scope, receive, send_status)
+            finally:
+                record_request(
+                    scope["method"],
+                    GENERATE_PATH,
+                    status,
+                    time.perf_counter() - started,
+                )
+
+    @staticmethod
+    def _is_generate(scope) -> bool:
+        return scope["method"] == "POST" and scope["path"].rstrip("/") == GENERATE_PATH
+
+    @staticmethod
+    def _wants_stream(scope) -> bool:
+        accept = dict(scope.get("headers") or []).get(b"accept", b"")
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        return wants_stream(accept.decode("latin-1"), query.get("stream", [None])[0])
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                runner = self.flask_app.extensions.pop("generation_runner", None)
+                if runner is not None:
+                    runner.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _error_message(self, error: Exception) -> str:
+        config = self.flask_app.config
+        if config.get("TESTING") or config.get("DEBUG"):
+            return str(error)
+        return "Invalid input provided."
+
+    def _check_rate_limit(self, scope):
+        """Run the Flask app's ``before_request`` hooks for a generate call.
+
+        One of them is flask-limiter's check, so the call counts against the
+        same limits and storage as requests served by Flask.
+
+        Returns:
+            Response: What Flask would answer instead of calling the view
+            (a 429 when the client is over its limit), or None
+        """
+        client = scope.get("client")
+        builder = EnvironBuilder(
+            path=scope["path"],
+            method=scope["method"],
+            query_string=scope.get("query_string", b"").decode("latin-1"),
+            headers=[
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in scope.get("headers") or []
+            ],
+            environ_base={"REMOTE_ADDR": client[0] if client else ""},
+        )
+        app = self.flask_app
+        # A fresh app context, so concurrent checks never share ``g``
+        with app.app_context(), app.request_context(builder.get_environ()):
+            try:
+                rv = app.preprocess_request()
+            except HTTPException as e:
+                rv = app.handle_user_exception(e)
+            return app.make_response(rv) if rv is not None else None
+
+    async def _send_response(self, scope, send, response) -> None:
+        headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in response.headers.items()
+            if name.lower() not in ("content-type", "content-length")
+        ]
+        await self._start(
+            scope, send, response.status_code, response.content_type.encode(), headers
+        )
+        await send({"type": "http.response.body", "body": response.get_data()})
+
+    async def _generate(self, scope, receive, send) -> None:
+        # Rate limit storage may be remote, so check off the event loop
+        refused = await sync_to_async(self._check_rate_limit, thread_sensitive=False)(
+            scope
+        )
+        if refused is not None:
+            return await self._send_response(scope, send, refused)
+
+        try:
+            body = await _read_body(receive)
+        except _Disconnected:
+            return
+
+        try:
+            data = json.loads(body or b"null")
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return await self._respond(
+                scope, send, 400, {"error": "No JSON data provided."}
+            )
+        text = data.get("text")
+        if not text:
+            return await self._respond(scope, send, 400, {"error": "Text is required"})
+        prompt = data.get("prompt")
+        if not prompt:
+            return await self._respond(
+                scope, send, 400, {"error": "Prompt is required"}
+            )
+        formal = data.get("formal", True)
+
+        with self.flask_app.app_context():
+            guardrails = get_guardrails()
+            runner = get_generation_runner()
+
+        try:
+            # Guardrail chains are synchronous; run them off the event loop
+            await sync_to_async(guardrails.validate_input, thread_sensitive=False)(text)
+
+            if self._wants_stream(scope):
+                stream = runner.astream(prompt, formal, guardrails)
+                pump = asyncio.ensure_future(self._send_events(scope, send, stream))
+                await _unless_disconnected(pump, receive)
+                return
+
+            generation = asyncio.ensure_future(runner.agenerate_cached(prompt, formal))
+            if not await _unless_disconnected(generation, receive):
+                return
+            result, cache_status = generation.result()
+
+            if "response" in result:
+                result["response"] = await sync_to_async(
+                    guardrails.process_output, thread_sensitive=False
+                )(result["response"], formal)
+        except ValueError as e:
+            logger.error(f"Validation error in generate: {e}")
+            return await self._respond(
+                scope, send, 400, {"error": self._error_message(e)}
+            )
+        except GenerationTimeout as e:
+            logger.error(f"Timeout in generate: {e}")
+            return await self._respond(
+                scope, send, 504, {"error": "Generation timed out."}
+            )
+        except Exception as e:
+            logger.error(f"Error in generate: {e}")
+            return await self._respond(
+                scope, send, 500, {"error": "An internal error occurred."}
+            )
+
+        await self._respond(
+            scope, send, 200, result, [(b"x-cache", cache_status.encode())]
+        )
+
+    async def _send_events(self, scope, send, stream) -> None:
+        """Send processed output chunks as Server-Sent Events."""
+        await self._start(scope, send, 200, b"text/event-stream")
+        try:
+            async for chunk in stream:
+                event = sse_event("token", {"token": chunk})
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": event.encode(),
+                        "more_body": True,
+                    }
+                )
+            event = sse_event("done", {"status": "success"})
+        except GenerationTimeout as e:
+            logger.error(f"Timeout in generate stream: {e}")
+            event = sse_event("error", {"error": "Generation timed out."})
+        except Exception as e:
+            logger.error(f"Error in generate stream: {e}")
+            event = sse_event("error", {"error": "An internal error occurred."})
+        await send({"type": "http.response.body", "body": event.encode()})
+
+    async def _start(
+        self, scope, send, status: int, content_type: bytes, headers=()
+    ) -> None:
+        headers = [(b"content-type", content_type), *headers]
+        if content_type == b"text/event-stream":
+            headers += [(b"cache-control", b"no-cache"), (b"x-accel-buffering", b"no")]
+        origin = dict(scope.get("headers") or []).get(b"origin")
+        if origin and origin.decode("latin-1") in self.flask_app.config.get(
+            "CORS_ORIGINS", []
+        ):
+            headers += [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+
+    async def _respond(self, scope, send, status: int, payload, headers=()) -> None:
+        await self._start(scope, send, status, b"application/json", headers)
+        await send({"type": "http.response.body", "body": json.dumps(payload).encode()})
+
+
+def create_asgi_app(config_name="development"):
+    """Create the ASGI app around a new Flask app."""
+    return GenerateApp(create_app(config_name))
@@ -23,12 +23,38 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL", "sqlite:///app.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # PRAGMAs run on every new SQLite connection. WAL lets readers work
+    # while an import is writing; NORMAL sync is durable across app crashes
+    # in WAL mode. cache_size is in KiB when negative.
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "foreign_keys": "ON",
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        "cache_size": -int(os.getenv("SQLITE_CACHE_KB", "65536")),
+        "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+        "temp_store": "MEMORY",
+    }
+
     # JWT configuration
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "dev-secret-key")
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
 
+    # Origins allowed to call the API from a browser
+    CORS_ORIGINS = [
+        "http://localhost:5173",  # Vite dev server
+        "http://localhost:5000",  # Flask backend
+        "http://localhost",  # Production
+    ]
+
     # Rate limiting (example: 200 requests per day; 50 per hour)
     RATELIMIT_DEFAULT = "200 per day;50 per hour"
+    # Counters live in memory per process by default; point every worker (and
+    # the vocab-importer's RATE_LIMIT_STORAGE_URI) at one Redis-compatible
+    # store, e.g. redis://redis:6379/0, so limits hold across processes
+    RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
+    RATELIMIT_STRATEGY = os.getenv("RATELIMIT_STRATEGY", "moving-window")
+    RATELIMIT_KEY_PREFIX = "backend-flask"
 
     # Logging configuration
     LOGGING_CONFIG = {
@@ -58,6 +84,55 @@ class Config:
         "enable_profanity_filter": True,
     }
 
+    # Model behind the guardrail chains; cached verdicts are keyed by it
+    MODERATION_MODEL = os.getenv("MODERATION_MODEL", "gpt-3.5-turbo")
+
+    # Moderation verdict cache (entries, seconds, optional SQLite file)
+    MODERATION_CACHE_SIZE = int(os.getenv("MODERATION_CACHE_SIZE", "1024"))
+    MODERATION_CACHE_TTL = int(os.getenv("MODERATION_CACHE_TTL", str(24 * 60 * 60)))
+    MODERATION_CACHE_DB = os.getenv("MODERATION_CACHE_DB")
+
+    # Batch moderation: estimated prompt tokens and texts per LLM call, LLM
+    # calls in flight at once, and texts accepted per request
+    MODERATION_BATCH_TOKENS = int(os.getenv("MODERATION_BATCH_TOKENS", "2000"))
+    MODERATION_BATCH_SIZE = int(os.getenv("MODERATION_BATCH_SIZE", "50"))
+    MODERATION_BATCH_CONCURRENCY = int(os.getenv("MODERATION_BATCH_CONCURRENCY", "4"))
+    MODERATION_BATCH_MAX_TEXTS = int(os.getenv("MODERATION_BATCH_MAX_TEXTS", "1000"))
+
+    # OpenAI generation: concurrent calls per process and per-call timeout
+    OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "32"))
+    OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))
+
+    # Generated vocabulary cache (entries, 0 disables; seconds; SQLite file).
+    # With an embedding service URL, prompts whose embedding is at least
+    # RESPONSE_CACHE_SIMILARITY similar to a cached one reuse its response.
+    RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+    RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", str(60 * 60)))
+    RESPONSE_CACHE_DB = os.getenv("RESPONSE_CACHE_DB")
+    RESPONSE_CACHE_EMBEDDING_URL = os.getenv("RESPONSE_CACHE_EMBEDDING_URL")
+    RESPONSE_CACHE_SIMILARITY = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.95"))
+
+    # JSON encoder for responses: auto (orjson when installed), orjson or stdlib
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "auto")
+
+    # Serialized responses of /api/words, /api/groups and /api/dashboard kept
+    # per process (entries, 0 disables); ETags work either way
+    API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "256"))
+
+    # Opt-in SQL profiling per request: query count and DB time, slow
+    # statements and statements repeated often enough to be N+1 queries
+    SQL_PROFILING = os.getenv("SQL_PROFILING", "false").lower() == "true"
+    SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "100"))
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+
+    # Romanian word list used to restore missing diacritics in AI output
+    DIACRITICS_VOCAB_PATH = os.getenv(
+        "DIACRITICS_VOCAB_PATH",
+        path.join(
+            BASE_DIR, "..", "..", "sentence-constructor", "utils", "core-vocab.txt"
+        ),
+    )
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
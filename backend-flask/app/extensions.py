@@ -1,5 +1,159 @@
 """Flask extensions module."""
 
+import logging
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from flask import Flask, current_app, g, has_request_context
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .utils.metrics import (
+    DB_N_PLUS_ONE,
+    DB_QUERIES_PER_REQUEST,
+    DB_SLOW_QUERIES,
+    DB_TIME_PER_REQUEST,
+    request_endpoint,
+)
+
+logger = logging.getLogger(__name__)
 
 db = SQLAlchemy()
+
+
+def init_sqlite_pragmas(app: Flask) -> None:
+    """Apply ``SQLITE_PRAGMAS`` to each new connection of the app's engine."""
+    pragmas = app.config.get("SQLITE_PRAGMAS")
+    with app.app_context():
+        engine = db.engine
+    if not pragmas or engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+
+class QueryProfile:
+    """Statements executed while handling one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.statements: Counter = Counter()
+        self.slow: List[Tuple[str, float]] = []
+
+    def record(self, statement: str, seconds: float, slow_threshold: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.statements[statement] += 1
+        if seconds >= slow_threshold:
+            self.slow.append((statement, seconds))
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """Statements run at least ``threshold`` times: N+1 candidates.
+
+        Statements are compared with their parameters left out, so loading
+        a relationship once per row shows up as one repeated statement.
+        """
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+
+class QueryProfiler:
+    """Opt-in SQL profiling per request, enabled with ``SQL_PROFILING``.
+
+    Counts the statements a request executes and the time spent in them,
+    logs statements slower than ``SQL_SLOW_QUERY_MS`` and statements run
+    ``SQL_N_PLUS_ONE_THRESHOLD`` times or more as N+1 candidates. The totals
+    go to the Prometheus metrics; in debug mode they are also returned as
+    ``X-DB-*`` response headers.
+    """
+
+    def init_app(self, app: Flask) -> None:
+        if not app.config.get("SQL_PROFILING"):
+            return
+        _listen_once()
+
+        @app.before_request
+        def _start_profile():
+            g.query_profile = QueryProfile()
+
+        @app.after_request
+        def _report_profile(response):
+            profile = g.pop("query_profile", None)
+            if profile is not None:
+                self._report(profile, response)
+            return response
+
+    @staticmethod
+    def _report(profile: QueryProfile, response) -> None:
+        config = current_app.config
+        endpoint = request_endpoint()
+        repeated = profile.repeated(config["SQL_N_PLUS_ONE_THRESHOLD"])
+
+        DB_QUERIES_PER_REQUEST.labels(endpoint=endpoint).observe(profile.count)
+        DB_TIME_PER_REQUEST.labels(endpoint=endpoint).observe(profile.total)
+        if profile.slow:
+            DB_SLOW_QUERIES.labels(endpoint=endpoint).inc(len(profile.slow))
+        if repeated:
+            DB_N_PLUS_ONE.labels(endpoint=endpoint).inc(len(repeated))
+
+        for statement, seconds in profile.slow:
+            logger.warning(
+                f"Slow query in {endpoint} ({seconds * 1000:.1f} ms): {statement}"
+            )
+        for statement, count in repeated.items():
+            logger.warning(
+                f"Possible N+1 in {endpoint}: statement run {count} times: "
+                f"{statement}"
+            )
+
+        if current_app.debug:
+            response.headers["X-DB-Query-Count"] = str(profile.count)
+            response.headers["X-DB-Time-Ms"] = f"{profile.total * 1000:.2f}"
+            response.headers["X-DB-Slow-Queries"] = str(len(profile.slow))
+            response.headers["X-DB-N-Plus-One"] = str(len(repeated))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    conn.info.setdefault("profile_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    started = conn.info["profile_start"].pop()
+    if has_request_context():
+        profile = g.get("query_profile")
+        if profile is not None:
+            profile.record(
+                statement,
+                time.perf_counter() - started,
+                current_app.config["SQL_SLOW_QUERY_MS"] / 1000,
+            )
+
+
+def _handle_error(context) -> None:
+    connection = context.connection
+    starts = connection.info.get("profile_start") if connection else None
+    if starts:
+        starts.pop()
+
+
+def _listen_once() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+query_profiler = QueryProfiler()
@@ -1,5 +1,18 @@
+from . import word_search  # noqa: F401 (registers the search index DDL)
+from .dashboard_stats import DashboardStats
 from .group import Group
+from .study_session import StudySession
+from .table_version import TableVersion
 from .word import Word
 from .word_group import WordGroup
+from .word_review_item import WordReviewItem
 
-__all__ = ["Word", "Group", "WordGroup"]
+__all__ = [
+    "Word",
+    "Group",
+    "WordGroup",
+    "StudySession",
+    "WordReviewItem",
+    "DashboardStats",
+    "TableVersion",
+]
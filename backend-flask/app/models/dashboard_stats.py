@@ -0,0 +1,179 @@
+"""
+Dashboard Stats Model
+
+Single-row summary table behind the dashboard. The counters are kept up to
+date by SQLite triggers on words, groups, study sessions and review items,
+so reading the dashboard is a primary key lookup however large the review
+history grows. Writes that bypass the ORM (bulk imports, raw SQL) are
+counted as well, since the triggers live in the database.
+"""
+
+from sqlalchemy import DDL, event
+
+from ..extensions import db
+
+STATS_ROW_ID = 1
+
+_SET_STATS = "UPDATE dashboard_stats SET {} WHERE id = 1;"
+
+# (name, event, body) for every trigger that maintains dashboard_stats
+TRIGGERS = [
+    (
+        "dashboard_stats_word_insert",
+        "AFTER INSERT ON words",
+        _SET_STATS.format(
+            "total_words = total_words + 1, "
+            "learned_words = learned_words + COALESCE(NEW.learned, 0)"
+        ),
+    ),
+    (
+        "dashboard_stats_word_delete",
+        "AFTER DELETE ON words",
+        _SET_STATS.format(
+            "total_words = total_words - 1, "
+            "learned_words = learned_words - COALESCE(OLD.learned, 0)"
+        ),
+    ),
+    (
+        "dashboard_stats_word_learned",
+        "AFTER UPDATE OF learned ON words",
+        _SET_STATS.format(
+            "learned_words = learned_words "
+            "+ COALESCE(NEW.learned, 0) - COALESCE(OLD.learned, 0)"
+        ),
+    ),
+    (
+        "dashboard_stats_group_insert",
+        "AFTER INSERT ON groups",
+        _SET_STATS.format("total_groups = total_groups + 1"),
+    ),
+    (
+        "dashboard_stats_group_delete",
+        "AFTER DELETE ON groups",
+        _SET_STATS.format("total_groups = total_groups - 1"),
+    ),
+    (
+        # A session on the day after the last one extends the streak, a
+        # session after a gap starts a new one. Sessions are recorded in
+        # order, so a backdated session only updates the counters.
+        "dashboard_stats_session_insert",
+        "AFTER INSERT ON study_sessions",
+        _SET_STATS.format(
+            "total_sessions = total_sessions + 1, "
+            "completed_sessions = completed_sessions + (NEW.end_time IS NOT NULL), "
+            "current_streak = CASE "
+            "WHEN last_session_date IS NULL THEN 1 "
+            "WHEN date(NEW.start_time) <= last_session_date THEN current_streak "
+            "WHEN date(NEW.start_time) = date(last_session_date, '+1 day') "
+            "THEN current_streak + 1 "
+            "ELSE 1 END, "
+            "last_session_id = CASE "
+            "WHEN last_session_date IS NULL "
+            "OR date(NEW.start_time) >= last_session_date THEN NEW.id "
+            "ELSE last_session_id END, "
+            "last_session_date = CASE "
+            "WHEN last_session_date IS NULL "
+            "OR date(NEW.start_time) > last_session_date "
+            "THEN date(NEW.start_time) "
+            "ELSE last_session_date END"
+        ),
+    ),
+    (
+        "dashboard_stats_session_end",
+        "AFTER UPDATE OF end_time ON study_sessions",
+        _SET_STATS.format(
+            "completed_sessions = completed_sessions "
+            "+ (NEW.end_time IS NOT NULL) - (OLD.end_time IS NOT NULL)"
+        ),
+    ),
+    (
+        # The streak cannot be recomputed inside a trigger; deleting session
+        # history should be followed by rebuild_dashboard_stats()
+        "dashboard_stats_session_delete",
+        "AFTER DELETE ON study_sessions",
+        _SET_STATS.format(
+            "total_sessions = total_sessions - 1, "
+            "completed_sessions = completed_sessions - (OLD.end_time IS NOT NULL), "
+            "last_session_id = CASE WHEN last_session_id = OLD.id THEN ("
+            "SELECT id FROM study_sessions "
+            "ORDER BY start_time DESC, id DESC LIMIT 1"
+            ") ELSE last_session_id END"
+        ),
+    ),
+    (
+        "dashboard_stats_review_insert",
+        "AFTER INSERT ON word_review_items",
+        _SET_STATS.format(
+            "total_reviews = total_reviews + 1, "
+            "correct_reviews = correct_reviews + COALESCE(NEW.correct, 0)"
+        ),
+    ),
+    (
+        "dashboard_stats_review_delete",
+        "AFTER DELETE ON word_review_items",
+        _SET_STATS.format(
+            "total_reviews = total_reviews - 1, "
+            "correct_reviews = correct_reviews - COALESCE(OLD.correct, 0)"
+        ),
+    ),
+]
+
+# Seeds the summary row from the current contents of the tables, so adding
+# the table to an existing database starts from the right totals
+SEED_STATS = """
+INSERT OR IGNORE INTO dashboard_stats (
+    id, total_words, learned_words, total_groups, total_sessions,
+    completed_sessions, total_reviews, correct_reviews,
+    last_session_id, last_session_date, current_streak
+)
+SELECT
+    1,
+    (SELECT COUNT(*) FROM words),
+    (SELECT COUNT(*) FROM words WHERE learned),
+    (SELECT COUNT(*) FROM groups),
+    (SELECT COUNT(*) FROM study_sessions),
+    (SELECT COUNT(*) FROM study_sessions WHERE end_time IS NOT NULL),
+    (SELECT COUNT(*) FROM word_review_items),
+    (SELECT COUNT(*) FROM word_review_items WHERE correct),
+    last.id,
+    date(last.start_time),
+    CASE WHEN last.id IS NULL THEN 0 ELSE 1 END
+FROM (SELECT 1) LEFT JOIN (
+    SELECT id, start_time FROM study_sessions
+    ORDER BY start_time DESC, id DESC LIMIT 1
+) AS last
+"""
+
+
+def trigger_statements():
+    """SQL for creating every dashboard_stats trigger."""
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {name} {when} BEGIN {body} END"
+        for name, when, body in TRIGGERS
+    ]
+
+
+class DashboardStats(db.Model):
+    __tablename__ = "dashboard_stats"
+    id = db.Column(db.Integer, primary_key=True)
+    total_words = db.Column(db.Integer, nullable=False, default=0)
+    learned_words = db.Column(db.Integer, nullable=False, default=0)
+    total_groups = db.Column(db.Integer, nullable=False, default=0)
+    total_sessions = db.Column(db.Integer, nullable=False, default=0)
+    completed_sessions = db.Column(db.Integer, nullable=False, default=0)
+    total_reviews = db.Column(db.Integer, nullable=False, default=0)
+    correct_reviews = db.Column(db.Integer, nullable=False, default=0)
+    last_session_id = db.Column(db.Integer)
+    last_session_date = db.Column(db.String(10))
+    current_streak = db.Column(db.Integer, nullable=False, default=0)
+
+
+def _create_triggers(metadata, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in trigger_statements():
+        connection.execute(DDL(statement))
+    connection.execute(DDL(SEED_STATS))
+
+
+event.listen(db.metadata, "after_create", _create_triggers)
@@ -1,10 +1,13 @@
 from datetime import datetime
 
+from sqlalchemy import func, literal
+
 from ..extensions import db
 
 
 class Group(db.Model):
     __tablename__ = "groups"
+    __table_args__ = (db.Index("ix_groups_name", "name"),)
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
@@ -19,3 +22,17 @@ class Group(db.Model):
             "description": self.description,
             "wordCount": self.word_count,
         }
+
+    @classmethod
+    def json_object(cls):
+        """SQL expression encoding a group as a JSON object, like ``to_dict``."""
+        return func.json_object(
+            literal("id"),
+            cls.id,
+            literal("name"),
+            cls.name,
+            literal("description"),
+            cls.description,
+            literal("wordCount"),
+            cls.word_count,
+        )
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from ..extensions import db
+
+
+class StudySession(db.Model):
+    __tablename__ = "study_sessions"
+    __table_args__ = (
+        db.Index("ix_study_sessions_group_id_start_time", "group_id", "start_time"),
+        db.Index("ix_study_sessions_start_time", "start_time"),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    activity_id = db.Column(db.Text, nullable=False)
+    group_id = db.Column(db.Integer, db.ForeignKey("groups.id"))
+    start_time = db.Column(db.DateTime, default=datetime.utcnow)
+    end_time = db.Column(db.DateTime)
+    score = db.Column(db.Float, default=0)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "activityId": self.activity_id,
+            "groupId": self.group_id,
+            "startTime": self.start_time.isoformat() if self.start_time else None,
+            "endTime": self.end_time.isoformat() if self.end_time else None,
+            "score": self.score,
+        }
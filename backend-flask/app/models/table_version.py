@@ -0,0 +1,71 @@
+"""
+Table Version Model
+
+One counter per table that the cached API routes read. SQLite triggers bump
+a table's counter on every insert, update and delete, so the counters change
+whenever the data behind a response does, whichever process or code path
+wrote it. Reading them is a lookup on a handful of rows, which makes them
+cheap to turn into ETags.
+"""
+
+from sqlalchemy import DDL, event
+
+from ..extensions import db
+
+# Tables whose writes change a cached API response
+TRACKED_TABLES = (
+    "words",
+    "groups",
+    "words_groups",
+    "study_sessions",
+    "dashboard_stats",
+)
+
+_BUMP = "UPDATE table_versions SET version = version + 1 WHERE table_name = '{}';"
+
+
+def seed_statement():
+    """``INSERT`` that adds a zero counter for every tracked table."""
+    values = ", ".join(f"('{table}', 0)" for table in TRACKED_TABLES)
+    return f"INSERT OR IGNORE INTO table_versions (table_name, version) VALUES {values}"
+
+
+def trigger_statements():
+    """``CREATE TRIGGER`` statements bumping the counters on writes."""
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS table_versions_{table}_{action.lower()} "
+        f"AFTER {action} ON {table} BEGIN {_BUMP.format(table)} END"
+        for table in TRACKED_TABLES
+        for action in ("INSERT", "UPDATE", "DELETE")
+    ]
+
+
+class TableVersion(db.Model):
+    __tablename__ = "table_versions"
+    table_name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    @staticmethod
+    def current(tables):
+        """Read the counters of ``tables`` with a single query.
+
+        Returns:
+            tuple: ``(table, version)`` pairs in the order of ``tables``
+        """
+        rows = dict(
+            db.session.query(TableVersion.table_name, TableVersion.version).filter(
+                TableVersion.table_name.in_(tables)
+            )
+        )
+        return tuple((table, rows.get(table, 0)) for table in tables)
+
+
+def _create_triggers(metadata, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    connection.execute(DDL(seed_statement()))
+    for statement in trigger_statements():
+        connection.execute(DDL(statement))
+
+
+event.listen(db.metadata, "after_create", _create_triggers)
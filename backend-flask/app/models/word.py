@@ -10,13 +10,21 @@ Each word has:
 - Group associations
 """
 
+from collections import defaultdict
 from datetime import datetime
 
+from sqlalchemy import case, func, literal, select
+
 from ..extensions import db
+from .word_group import WordGroup
 
 
 class Word(db.Model):
     __tablename__ = "words"
+    __table_args__ = (
+        db.Index("ix_words_romanian", "romanian"),
+        db.Index("ix_words_english", "english"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     romanian = db.Column(db.String(100), nullable=False)
     english = db.Column(db.String(100), nullable=False)
@@ -28,7 +36,7 @@ class Word(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     groups = db.relationship(
-        "Group", secondary="word_groups", backref=db.backref("words", lazy="dynamic")
+        "Group", secondary="words_groups", backref=db.backref("words", lazy="dynamic")
     )
 
     def to_dict(self):
@@ -49,3 +57,116 @@ class Word(db.Model):
             "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
             "groupIds": [g.id for g in self.groups],
         }
+
+    @classmethod
+    def api_columns(cls):
+        """Map API field names to the columns that back them.
+
+        ``groupIds`` is not a column on ``words`` and is resolved separately
+        via :meth:`group_ids_for`.
+        """
+        return {
+            "id": cls.id,
+            "romanian": cls.romanian,
+            "english": cls.english,
+            "pronunciation": cls.pronunciation,
+            "part_of_speech": cls.part_of_speech,
+            "parts": cls.parts,
+            "learned": cls.learned,
+            "createdAt": cls.created_at,
+            "updatedAt": cls.updated_at,
+        }
+
+    @classmethod
+    def json_columns(cls):
+        """Map API field names to SQL expressions for their JSON values.
+
+        Used by :meth:`json_object`. Timestamps come out in the format of
+        ``isoformat()`` and ``groupIds`` is a correlated subquery, ordered
+        by the ``words_groups`` primary key.
+        """
+
+        def timestamp(column):
+            # Stored as "YYYY-MM-DD HH:MM:SS.ffffff"; isoformat() drops zero
+            # microseconds
+            return func.replace(func.replace(column, " ", "T"), ".000000", "")
+
+        group_ids = (
+            select(func.json_group_array(WordGroup.group_id))
+            .where(WordGroup.word_id == cls.id)
+            .scalar_subquery()
+        )
+        return {
+            "id": cls.id,
+            "romanian": cls.romanian,
+            "english": cls.english,
+            "pronunciation": cls.pronunciation,
+            "part_of_speech": cls.part_of_speech,
+            "parts": func.json(cls.parts),
+            "learned": func.json(case((cls.learned, "true"), (~cls.learned, "false"))),
+            "createdAt": timestamp(cls.created_at),
+            "updatedAt": timestamp(cls.updated_at),
+            # JSON values lose their type when they leave a subquery
+            "groupIds": func.json(group_ids),
+        }
+
+    @classmethod
+    def json_object(cls, fields):
+        """SQL expression encoding a word as a JSON object, like ``to_dict``.
+
+        SQLite builds the JSON text, so rows go from the database into a
+        response without Python dicts or type conversions.
+
+        Args:
+            fields: API field names to include, in output order
+        """
+        columns = cls.json_columns()
+        return func.json_object(
+            *[part for field in fields for part in (literal(field), columns[field])]
+        )
+
+    @staticmethod
+    def group_ids_for(word_ids):
+        """Load group ids for many words with a single query.
+
+        Args:
+            word_ids: Ids of the words to look up
+
+        Returns:
+            dict: word id -> list of group ids
+        """
+        group_ids = defaultdict(list)
+        if not word_ids:
+            return group_ids
+
+        rows = (
+            db.session.query(WordGroup.word_id, WordGroup.group_id)
+            .filter(WordGroup.word_id.in_(word_ids))
+            .order_by(WordGroup.word_id, WordGroup.group_id)
+        )
+        for word_id, group_id in rows:
+            group_ids[word_id].append(group_id)
+        return group_ids
+
+    @staticmethod
+    def serialize_row(row, fields, group_ids=None):
+        """Serialize a projected result row in the same format as ``to_dict``.
+
+        Args:
+            row: Result row selected with the columns from :meth:`api_columns`
+            fields: API field names to include, in output order
+            group_ids: Optional mapping from :meth:`group_ids_for`
+
+        Returns:
+            dict: Word data restricted to ``fields``
+        """
+        data = {}
+        for field in fields:
+            if field == "groupIds":
+                data[field] = list(group_ids.get(row.id, [])) if group_ids else []
+                continue
+            value = getattr(row, field)
+            if field in ("createdAt", "updatedAt"):
+                value = value.isoformat() if value else None
+            data[field] = value
+        return data
@@ -2,6 +2,10 @@ from ..extensions import db
 
 
 class WordGroup(db.Model):
-    __tablename__ = "word_groups"
+    __tablename__ = "words_groups"
+    __table_args__ = (
+        db.Index("ix_words_groups_group_id_word_id", "group_id", "word_id"),
+        {"sqlite_with_rowid": False},
+    )
     word_id = db.Column(db.Integer, db.ForeignKey("words.id"), primary_key=True)
     group_id = db.Column(db.Integer, db.ForeignKey("groups.id"), primary_key=True)
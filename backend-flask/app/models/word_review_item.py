@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from ..extensions import db
+
+
+class WordReviewItem(db.Model):
+    __tablename__ = "word_review_items"
+    __table_args__ = (
+        db.Index("ix_word_review_items_word_id_created_at", "word_id", "created_at"),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    word_id = db.Column(db.Integer, db.ForeignKey("words.id"), nullable=False)
+    session_id = db.Column(
+        db.Integer, db.ForeignKey("study_sessions.id"), nullable=False
+    )
+    correct = db.Column(db.Boolean, nullable=False)
+    user_answer = db.Column(db.Text)
+    correct_answer = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,78 @@
+"""
+Word Search Index
+
+FTS5 index over the romanian, english and parts columns of ``words``. It is
+an external content table: the text stays in ``words`` and SQLite triggers
+keep the index in step with every insert, update and delete, including bulk
+imports and raw SQL. The ``unicode61`` tokenizer with ``remove_diacritics 2``
+folds Romanian diacritics, so "tara" matches "țară" and "şcoala" matches
+"școală". Prefixes of up to six characters are indexed for typeahead.
+"""
+
+from sqlalchemy import DDL, event
+
+from ..extensions import db
+
+FTS_TABLE = "words_fts"
+
+CREATE_FTS_TABLE = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "romanian, english, parts, "
+    "content='words', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='1 2 3 4 5 6')"
+)
+
+# Column weights for bm25: a match on the Romanian word ranks first
+RANK = "bm25(10.0, 5.0, 1.0)"
+
+SET_RANK = f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', '{RANK}')"
+
+REBUILD = f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+
+_INDEX_NEW = (
+    f"INSERT INTO {FTS_TABLE}(rowid, romanian, english, parts) "
+    "VALUES (NEW.id, NEW.romanian, NEW.english, NEW.parts);"
+)
+_REMOVE_OLD = (
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, romanian, english, parts) "
+    "VALUES ('delete', OLD.id, OLD.romanian, OLD.english, OLD.parts);"
+)
+
+# (name, event, body) for every trigger that maintains words_fts
+TRIGGERS = [
+    ("words_fts_insert", "AFTER INSERT ON words", _INDEX_NEW),
+    ("words_fts_delete", "AFTER DELETE ON words", _REMOVE_OLD),
+    (
+        "words_fts_update",
+        "AFTER UPDATE OF romanian, english, parts ON words",
+        _REMOVE_OLD + " " + _INDEX_NEW,
+    ),
+]
+
+
+def trigger_statements():
+    """``CREATE TRIGGER`` statements for the search index."""
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {name} {when} BEGIN {body} END"
+        for name, when, body in TRIGGERS
+    ]
+
+
+def _create_index(metadata, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    connection.execute(DDL(CREATE_FTS_TABLE))
+    connection.execute(DDL(SET_RANK))
+    for statement in trigger_statements():
+        connection.execute(DDL(statement))
+    connection.execute(DDL(REBUILD))
+
+
+def _drop_index(metadata, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    connection.execute(DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+
+
+event.listen(db.metadata, "after_create", _create_index)
+event.listen(db.metadata, "before_drop", _drop_index)
@@ -7,6 +7,7 @@ def register_blueprints(app: Flask):
     """Register all blueprints with the app."""
     from .dashboard import dashboard_bp
     from .groups import groups_bp
+    from .moderation import moderation_bp
     from .vocabulary import vocabulary_bp
     from .words import words_bp
 
@@ -14,7 +15,8 @@ def register_blueprints(app: Flask):
     app.register_blueprint(words_bp, url_prefix="/api/words")
     app.register_blueprint(groups_bp, url_prefix="/api/groups")
     app.register_blueprint(vocabulary_bp, url_prefix="/api/vocabulary")
+    app.register_blueprint(moderation_bp, url_prefix="/api/moderation")
 
 
 # Export the blueprints
-__all__ = ["dashboard_bp", "groups_bp", "vocabulary_bp", "words_bp"]
+__all__ = ["dashboard_bp", "groups_bp", "moderation_bp", "vocabulary_bp", "words_bp"]
@@ -7,9 +7,12 @@ Provides statistics and overview of:
 - Study sessions
 """
 
+from datetime import datetime, timezone
+
 from flask import Blueprint, jsonify
 
-from ..models import Group, Word
+from ..services.dashboard_stats import get_dashboard_stats
+from ..utils.http_cache import cached_response
 from ..utils.middleware import handle_errors
 
 dashboard_bp = Blueprint("dashboard", __name__)
@@ -17,6 +20,12 @@ dashboard_bp = Blueprint("dashboard", __name__)
 
 @dashboard_bp.route("/", methods=["GET"])
 @handle_errors
+# The streak is measured against the current UTC date
+@cached_response(
+    "dashboard_stats",
+    "study_sessions",
+    vary=lambda: datetime.now(timezone.utc).date().isoformat(),
+)
 def get_dashboard():
     """Get dashboard overview.
 
@@ -26,27 +35,9 @@ def get_dashboard():
         - Learning progress
         - Overall statistics
     """
-    # Clear section comments
-    # Last session info
-    last_session = {"date": None, "score": 0, "duration": 0, "activity": None}
-
-    # Progress tracking
-    progress = {
-        "totalWordsLearned": Word.query.filter(Word.learned.is_(True)).count(),
-        "completionRate": 0,
-        "streak": 0,
-    }
-
-    # Overall statistics
-    stats = {
-        "totalWords": Word.query.count(),
-        "totalGroups": Group.query.count(),
-        "completedSessions": 0,
-    }
-
     return jsonify(
         {
             "success": True,
-            "data": {"lastSession": last_session, "progress": progress, "stats": stats},
+            "data": get_dashboard_stats(),
         }
     )
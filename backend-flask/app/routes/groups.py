@@ -1,7 +1,10 @@
 from flask import Blueprint, jsonify, request
+from sqlalchemy import select
 
 from ..extensions import db
 from ..models import Group
+from ..utils.http_cache import cached_response
+from ..utils.json_provider import json_array
 from ..utils.middleware import handle_errors
 from ..utils.validators import validate_request_data
 
@@ -10,10 +13,11 @@ groups_bp = Blueprint("groups", __name__)
 
 @groups_bp.route("/", methods=["GET"])
 @handle_errors
+@cached_response("groups")
 def get_groups():
     """Get all groups."""
-    groups = Group.query.all()
-    return jsonify({"success": True, "data": [group.to_dict() for group in groups]})
+    groups = db.session.scalars(select(Group.json_object()).order_by(Group.id))
+    return jsonify({"success": True, "data": json_array(groups)})
 
 
 @groups_bp.route("/", methods=["POST"])
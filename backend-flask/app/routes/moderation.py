@@ -0,0 +1,63 @@
+from flask import Blueprint, current_app, jsonify, request
+
+from ..utils.langchain_guardrails import get_guardrails
+from ..utils.middleware import handle_errors
+
+moderation_bp = Blueprint("moderation", __name__)
+
+
+@moderation_bp.route("/batch", methods=["POST"])
+@handle_errors
+def moderate_batch():
+    """Moderate many texts at once, e.g. imported vocabulary or sentences.
+
+    Expects ``{"texts": [str]}`` and returns one verdict per text, in order.
+    """
+    try:
+        data = request.get_json(silent=True)
+        if not data:
+            raise ValueError("No JSON data provided")
+
+        texts = data.get("texts")
+        if not isinstance(texts, list) or not texts:
+            raise ValueError("Texts must be a non-empty list")
+        if not all(isinstance(text, str) and text.strip() for text in texts):
+            raise ValueError("Every text must be a non-empty string")
+        max_texts = current_app.config.get("MODERATION_BATCH_MAX_TEXTS", 1000)
+        if len(texts) > max_texts:
+            raise ValueError(f"At most {max_texts} texts can be moderated at once")
+
+        verdicts = get_guardrails().moderate_batch(texts)
+
+        results = []
+        for verdict in verdicts:
+            safe = not verdict.startswith("UNSAFE")
+            reason = None
+            if not safe:
+                reason = (
+                    verdict.split(":", 1)[1].strip()
+                    if ":" in verdict
+                    else "inappropriate content"
+                )
+            results.append({"safe": safe, "reason": reason})
+
+        unsafe = sum(not result["safe"] for result in results)
+        return jsonify(
+            {
+                "success": True,
+                "data": results,
+                "summary": {"total": len(results), "unsafe": unsafe},
+            }
+        )
+
+    except ValueError as e:
+        current_app.logger.error(f"Validation error in moderate_batch: {e}")
+        if current_app.config.get("TESTING") or current_app.config.get("DEBUG"):
+            return jsonify({"error": str(e)}), 400
+        return jsonify({"error": "Invalid input provided."}), 400
+    except Exception as e:
+        current_app.logger.error(f"Unexpected error in moderate_batch: {e}")
+        return (
+            jsonify({"error": "An internal error occurred. Please try again later."}),
+            500,
+        )
@@ -1,17 +1,62 @@
-from asgiref.sync import async_to_sync
-from flask import Blueprint, current_app, jsonify, request
-
-from ..services.openai_service import generate_vocabulary
-from ..utils.langchain_guardrails import LangChainRomanianGuardrails
+import json
+from datetime import datetime
+
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context,
+)
+from sqlalchemy import select
+
+from ..extensions import db
+from ..models import Group, Word
+from ..services.generation import (
+    GenerationTimeout,
+    get_generation_runner,
+    sse_event,
+    wants_stream,
+)
+from ..services.vocabulary_import import import_vocabulary
+from ..utils.langchain_guardrails import get_guardrails
 from ..utils.middleware import handle_errors
 
 vocabulary_bp = Blueprint("vocabulary", __name__)
 
+# Rows fetched from the database cursor per round trip during export
+EXPORT_BATCH_SIZE = 500
+
+
+def _sse_events(chunks):
+    """Turn processed output chunks into Server-Sent Events.
+
+    Sends a ``token`` event per chunk, then ``done``, or ``error`` if the
+    generation fails part way through.
+    """
+    try:
+        for chunk in chunks:
+            yield sse_event("token", {"token": chunk})
+    except GenerationTimeout as e:
+        current_app.logger.error(f"Timeout in generate stream: {e}")
+        yield sse_event("error", {"error": "Generation timed out."})
+        return
+    except Exception as e:
+        current_app.logger.error(f"Error in generate stream: {e}")
+        yield sse_event("error", {"error": "An internal error occurred."})
+        return
+    yield sse_event("done", {"status": "success"})
+
 
 @vocabulary_bp.route("/generate", methods=["POST"])
 @handle_errors
 def generate_vocab():
-    """Generate vocabulary using OpenAI with LangChain guardrails."""
+    """Generate vocabulary using OpenAI with LangChain guardrails.
+
+    With ``Accept: text/event-stream`` or ``?stream=true`` the output is
+    streamed as Server-Sent Events while it is generated.
+    """
     try:
         data = request.get_json()
 
@@ -26,17 +71,28 @@ def generate_vocab():
         formal = data.get("formal", True)
 
         # Apply input guardrails using LangChain
-        guardrails = LangChainRomanianGuardrails()
+        guardrails = get_guardrails()
         guardrails.validate_input(text)
 
-        # Use async_to_sync to call the async function
-        result = async_to_sync(generate_vocabulary)(prompt, formal)
+        if wants_stream(request.headers.get("Accept"), request.args.get("stream")):
+            chunks = get_generation_runner().iter_stream(prompt, formal, guardrails)
+            return Response(
+                stream_with_context(_sse_events(chunks)),
+                mimetype="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
+        # Hand the call to the generation runner's event loop; repeated
+        # prompts are answered from the response cache
+        result, cache_status = get_generation_runner().generate_cached(prompt, formal)
 
         # Apply output guardrails using LangChain
         if "response" in result:
             result["response"] = guardrails.process_output(result["response"], formal)
 
-        return jsonify(result)
+        response = jsonify(result)
+        response.headers["X-Cache"] = cache_status
+        return response
 
     except ValueError as e:
         current_app.logger.error(f"Validation error in generate_vocab: {e}")
@@ -45,6 +101,9 @@ def generate_vocab():
             return jsonify({"error": str(e)}), 400
         else:
             return jsonify({"error": "Invalid input provided."}), 400
+    except GenerationTimeout as e:
+        current_app.logger.error(f"Timeout in generate_vocab: {e}")
+        return jsonify({"error": "Generation timed out."}), 504
     except Exception as e:
         current_app.logger.error(f"Error in generate_vocab: {e}")
         return jsonify({"error": "An internal error occurred."}), 500
@@ -53,19 +112,26 @@ def generate_vocab():
 @vocabulary_bp.route("/", methods=["POST"])
 @handle_errors
 def create_vocabulary():
+    """Bulk import vocabulary in the vocab-importer document format.
+
+    Expects ``{"groups": [{"group": str, "words": [str | dict]}]}``.
+    """
     try:
         data = request.get_json()
         if not data:
             raise ValueError("No JSON data provided")
 
-        prompt = data.get("prompt")
-        if not prompt:
-            raise ValueError("Prompt is required")
+        groups = data.get("groups")
+        if not groups:
+            raise ValueError("Groups are required")
 
-        # ... rest of the function logic ...
+        summary = import_vocabulary(groups)
+        return jsonify({"success": True, "data": summary}), 201
 
     except ValueError as e:
         current_app.logger.error(f"Validation error in create_vocabulary: {e}")
+        if current_app.config.get("TESTING") or current_app.config.get("DEBUG"):
+            return jsonify({"error": str(e)}), 400
         return jsonify({"error": "Invalid input provided."}), 400
     except Exception as e:
         current_app.logger.error(f"Unexpected error in create_vocabulary: {e}")
@@ -73,3 +139,53 @@ def create_vocabulary():
             jsonify({"error": "An internal error occurred. Please try again later."}),
             500,
         )
+
+
+def _ndjson_line(record_type, data):
+    """Encode a single export record as one NDJSON line."""
+    return json.dumps({"type": record_type, "data": data}, ensure_ascii=False) + "\n"
+
+
+def _export_records():
+    """Yield NDJSON lines for every group followed by every word.
+
+    Rows are read through a server-side cursor in batches of
+    ``EXPORT_BATCH_SIZE`` so memory use does not depend on table size.
+    """
+    groups = db.session.execute(
+        select(Group).order_by(Group.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    for group in groups.scalars():
+        yield _ndjson_line("group", group.to_dict())
+
+    columns = Word.api_columns()
+    fields = list(columns) + ["groupIds"]
+    words = db.session.execute(
+        select(*[column.label(name) for name, column in columns.items()])
+        .order_by(Word.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    for rows in words.partitions():
+        group_ids = Word.group_ids_for([row.id for row in rows])
+        for row in rows:
+            yield _ndjson_line("word", Word.serialize_row(row, fields, group_ids))
+
+
+@vocabulary_bp.route("/export", methods=["GET"])
+@handle_errors
+def export_vocabulary():
+    """Stream all groups and words as newline-delimited JSON.
+
+    Each line is an object of the form ``{"type": "group"|"word", "data": {...}}``.
+    Groups are emitted before words so consumers can resolve ``groupIds``.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return Response(
+        stream_with_context(_export_records()),
+        mimetype="application/x-ndjson",
+        headers={
+            "Content-Disposition": (
+                f"attachment; filename=vocabulary_export_{timestamp}.ndjson"
+            )
+        },
+    )
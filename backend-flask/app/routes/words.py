@@ -1,17 +1,134 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
+from ..extensions import db
 from ..models import Word
+from ..services.word_search import search_words
+from ..utils.http_cache import cached_response
+from ..utils.json_provider import json_array
 from ..utils.middleware import handle_errors
 
 words_bp = Blueprint("words", __name__)
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+
+def _parse_limit(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Parse the ``limit`` query parameter into a bounded page size."""
+    if value is None:
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, maximum)
+
+
+def _parse_cursor(value):
+    """Parse the ``cursor`` query parameter (the last id of the previous page)."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError("cursor must be an integer")
+
+
+def _parse_fields(value):
+    """Parse the ``fields`` query parameter into a list of API field names."""
+    available = list(Word.api_columns()) + ["groupIds"]
+    if not value:
+        return available
+
+    fields = [f.strip() for f in value.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in available]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+
+    # The id is always selected because it drives the cursor
+    if "id" not in fields:
+        fields.insert(0, "id")
+    return fields
+
 
 @words_bp.route("/", methods=["GET"])
 @handle_errors
+@cached_response("words", "words_groups")
 def get_words():
-    """Get all words."""
-    words = Word.query.all()
-    return jsonify({"success": True, "data": [word.to_dict() for word in words]})
+    """Get a page of words ordered by id.
+
+    Query params:
+        cursor: Only return words with an id greater than this value
+        limit: Page size (default 50, max 500)
+        fields: Comma separated list of fields to include
+
+    Returns:
+        JSON with the page of words and the cursor for the next page
+    """
+    try:
+        limit = _parse_limit(request.args.get("limit"))
+        cursor = _parse_cursor(request.args.get("cursor"))
+        fields = _parse_fields(request.args.get("fields"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    encoded = Word.json_object(fields).label("json")
+    query = db.session.query(Word.id, encoded).order_by(Word.id)
+    if cursor is not None:
+        query = query.filter(Word.id > cursor)
+
+    # Fetch one extra row to find out whether there is a next page
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return jsonify(
+        {
+            "success": True,
+            "data": json_array(row.json for row in rows),
+            "pagination": {
+                "limit": limit,
+                "nextCursor": rows[-1].id if has_more else None,
+            },
+        }
+    )
+
+
+@words_bp.route("/search", methods=["GET"])
+@handle_errors
+def search():
+    """Search words by Romanian text, English translation or parts.
+
+    Diacritics are ignored ("tara" finds "țară") and the last word of the
+    query matches as a prefix, for typeahead.
+
+    Query params:
+        q: Text to search for
+        limit: Maximum number of results (default 20, max 100)
+        fields: Comma separated list of fields to include
+        prefix: Set to "false" to match the last word exactly
+
+    Returns:
+        JSON with the matching words, best match first
+    """
+    try:
+        query = request.args.get("q", "").strip()
+        if not query:
+            raise ValueError("q is required")
+        limit = _parse_limit(
+            request.args.get("limit"), DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT
+        )
+        fields = _parse_fields(request.args.get("fields"))
+        prefix = request.args.get("prefix", "true").lower() != "false"
+        words = search_words(query, fields, limit, prefix)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"success": True, "data": json_array(words)})
 
 
 @words_bp.route("/<int:word_id>", methods=["GET"])
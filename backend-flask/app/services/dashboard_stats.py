@@ -0,0 +1,122 @@
+"""Dashboard statistics.
+
+Reads the trigger-maintained ``dashboard_stats`` row together with the last
+study session in a single query, so the dashboard does not scan words,
+sessions or review items on every page load.
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import delete, select, text
+
+from ..extensions import db
+from ..models import DashboardStats, StudySession
+from ..models.dashboard_stats import SEED_STATS, STATS_ROW_ID
+
+logger = logging.getLogger(__name__)
+
+
+def _study_streak(session_dates) -> int:
+    """Count consecutive days ending at the most recent session date.
+
+    Args:
+        session_dates: Distinct ``YYYY-MM-DD`` strings, newest first
+    """
+    streak = 0
+    expected = None
+    for value in session_dates:
+        day = date.fromisoformat(value)
+        if expected is not None and day != expected:
+            break
+        streak += 1
+        expected = day - timedelta(days=1)
+    return streak
+
+
+def rebuild_dashboard_stats() -> DashboardStats:
+    """Recompute the summary row from scratch.
+
+    The triggers keep the row current for normal writes; this is for
+    databases created before the table existed and after deleting study
+    session history, which the triggers cannot fully account for.
+    """
+    db.session.execute(delete(DashboardStats))
+    db.session.execute(text(SEED_STATS))
+
+    session_dates = db.session.scalars(
+        select(db.func.date(StudySession.start_time))
+        .distinct()
+        .order_by(db.func.date(StudySession.start_time).desc())
+    )
+    stats = db.session.get(DashboardStats, STATS_ROW_ID, populate_existing=True)
+    stats.current_streak = _study_streak(session_dates)
+    db.session.commit()
+    logger.info("Rebuilt dashboard stats")
+    return stats
+
+
+def _last_session(session: Optional[StudySession]) -> Dict:
+    if session is None:
+        return {"date": None, "score": 0, "duration": 0, "activity": None}
+
+    duration = 0
+    if session.start_time and session.end_time:
+        duration = int((session.end_time - session.start_time).total_seconds())
+    return {
+        "date": session.start_time.isoformat() if session.start_time else None,
+        "score": session.score or 0,
+        "duration": duration,
+        "activity": session.activity_id,
+    }
+
+
+def get_dashboard_stats(today: Optional[date] = None) -> Dict:
+    """Build the dashboard payload.
+
+    Args:
+        today: Date the streak is measured against, defaults to the current
+            UTC date (session times are stored in UTC)
+
+    Returns:
+        dict: ``lastSession``, ``progress`` and ``stats`` sections
+    """
+    row = db.session.execute(
+        select(DashboardStats, StudySession)
+        .outerjoin(StudySession, StudySession.id == DashboardStats.last_session_id)
+        .where(DashboardStats.id == STATS_ROW_ID)
+    ).first()
+    if row is None:
+        rebuild_dashboard_stats()
+        return get_dashboard_stats(today)
+
+    stats, last_session = row
+    today = today or datetime.now(timezone.utc).date()
+
+    # A streak is only current if the last session was today or yesterday
+    streak = 0
+    if stats.last_session_date:
+        last_date = date.fromisoformat(stats.last_session_date)
+        if last_date >= today - timedelta(days=1):
+            streak = stats.current_streak
+
+    completion_rate = 0
+    if stats.total_words:
+        completion_rate = round(stats.learned_words / stats.total_words * 100, 1)
+
+    return {
+        "lastSession": _last_session(last_session),
+        "progress": {
+            "totalWordsLearned": stats.learned_words,
+            "completionRate": completion_rate,
+            "streak": streak,
+        },
+        "stats": {
+            "totalWords": stats.total_words,
+            "totalGroups": stats.total_groups,
+            "completedSessions": stats.completed_sessions,
+            "totalReviews": stats.total_reviews,
+            "correctReviews": stats.correct_reviews,
+        },
+    }
@@ -0,0 +1,295 @@
+"""Vocabulary generation runner.
+
+All OpenAI generation calls run on one long-lived event loop in a background
+thread. A single loop lets every request share the ``AsyncOpenAI``
+connection pool and one concurrency limit, and lets both the WSGI route and
+the ASGI endpoint (``app/asgi.py``) hand work to it:
+
+- WSGI request threads submit a call and wait for the result;
+- the ASGI endpoint awaits it, so a slow completion holds no worker thread,
+  and cancels it if the client disconnects.
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import logging
+import threading
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from flask import current_app
+
+from ..utils.single_flight import SingleFlight, get_single_flight
+from ..utils.text_cache import normalize_text
+from . import openai_service
+from .response_cache import MISS, ResponseCache, get_response_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_TIMEOUT = 30.0  # seconds
+
+_runner_lock = threading.Lock()
+
+# Returned by the runner loop when a stream is exhausted; StopAsyncIteration
+# cannot be passed through a future
+_END = object()
+
+
+class GenerationTimeout(Exception):
+    """Raised when a generation call does not finish within its timeout."""
+
+
+class GenerationRunner:
+    """Runs generation coroutines on a dedicated event loop.
+
+    Args:
+        max_concurrency: Calls allowed to talk to OpenAI at the same time;
+            further calls wait for a slot
+        timeout: Seconds a call may take, including time spent waiting for
+            a slot, before it is cancelled
+        cache: Optional response cache consulted by :meth:`generate_cached`
+            and :meth:`agenerate_cached`
+        flight: Coalescing group shared by identical calls in flight at the
+            same time; each runner gets its own by default
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache: Optional[ResponseCache] = None,
+        flight: Optional[SingleFlight] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cache = cache
+        self.flight = flight or SingleFlight("generate")
+        self.in_flight = 0
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="generation-runner", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _generate(
+        self, prompt: str, formal: bool, timeout: Optional[float]
+    ) -> Dict:
+        try:
+            async with asyncio.timeout(timeout or self.timeout):
+                # Identical calls share one upstream call and one slot
+                return await self.flight.ado(
+                    (normalize_text(prompt), formal), self._call, prompt, formal
+                )
+        except TimeoutError:
+            raise GenerationTimeout(
+                f"Generation timed out after {timeout or self.timeout:g}s"
+            ) from None
+
+    async def _call(self, prompt: str, formal: bool) -> Dict:
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                return await openai_service.generate_vocabulary(prompt, formal)
+            finally:
+                self.in_flight -= 1
+
+    async def _generate_cached(
+        self, prompt: str, formal: bool, timeout: Optional[float]
+    ) -> Tuple[Dict, str]:
+        if self.cache is None:
+            return await self._generate(prompt, formal, timeout), MISS
+        result, status, vector = await self.cache.lookup(prompt, formal)
+        if result is not None:
+            return result, status
+        result = await self._generate(prompt, formal, timeout)
+        if result.get("status") == "success":
+            self.cache.store(prompt, formal, result, vector)
+        return result, MISS
+
+    def submit(
+        self, prompt: str, formal: bool = True, timeout: Optional[float] = None
+    ) -> concurrent.futures.Future:
+        """Schedule a generation call; cancelling the future cancels the call."""
+        return asyncio.run_coroutine_threadsafe(
+            self._generate(prompt, formal, timeout), self._loop
+        )
+
+    def generate(
+        self, prompt: str, formal: bool = True, timeout: Optional[float] = None
+    ) -> Dict:
+        """Run a generation call and block the calling thread for the result."""
+        future = self.submit(prompt, formal, timeout)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def agenerate(
+        self, prompt: str, formal: bool = True, timeout: Optional[float] = None
+    ) -> Dict:
+        """Await a generation call from another event loop.
+
+        Cancelling the awaiting task cancels the call on the runner loop.
+        """
+        return await asyncio.wrap_future(self.submit(prompt, formal, timeout))
+
+    def generate_cached(
+        self, prompt: str, formal: bool = True, timeout: Optional[float] = None
+    ) -> Tuple[Dict, str]:
+        """Like :meth:`generate`, answering from the response cache if possible.
+
+        Returns:
+            tuple: ``(result, cache status)``, the status being ``HIT``,
+            ``HIT-SIMILAR`` or ``MISS``
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._generate_cached(prompt, formal, timeout), self._loop
+        )
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def agenerate_cached(
+        self, prompt: str, formal: bool = True, timeout: Optional[float] = None
+    ) -> Tuple[Dict, str]:
+        """Like :meth:`agenerate`, answering from the response cache if possible."""
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                self._generate_cached(prompt, formal, timeout), self._loop
+            )
+        )
+
+    async def _stream(
+        self, prompt: str, formal: bool, guardrails
+    ) -> AsyncIterator[str]:
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                tokens = openai_service.stream_vocabulary(prompt, formal)
+                async for chunk in guardrails.aprocess_output_stream(tokens, formal):
+                    yield chunk
+            finally:
+                self.in_flight -= 1
+
+    async def _next(self, stream: AsyncIterator[str], timeout: Optional[float]):
+        timeout = timeout or self.timeout
+        try:
+            async with asyncio.timeout(timeout):
+                return await stream.__anext__()
+        except StopAsyncIteration:
+            return _END
+        except TimeoutError:
+            raise GenerationTimeout(
+                f"No output from generation for {timeout:g}s"
+            ) from None
+
+    @staticmethod
+    async def _close(stream) -> None:
+        # A cancelled __anext__ may still be unwinding on the loop
+        while stream.ag_running:
+            await asyncio.sleep(0)
+        await stream.aclose()
+
+    def iter_stream(
+        self, prompt: str, formal: bool, guardrails, timeout: Optional[float] = None
+    ) -> Iterator[str]:
+        """Stream processed output to the calling thread.
+
+        The output passes through ``guardrails.aprocess_output_stream``. The
+        timeout applies to the wait for each chunk, and closing the iterator
+        cancels the call.
+        """
+        stream = self._stream(prompt, formal, guardrails)
+        try:
+            while True:
+                future = asyncio.run_coroutine_threadsafe(
+                    self._next(stream, timeout), self._loop
+                )
+                try:
+                    chunk = future.result()
+                except BaseException:
+                    future.cancel()
+                    raise
+                if chunk is _END:
+                    return
+                yield chunk
+        finally:
+            asyncio.run_coroutine_threadsafe(self._close(stream), self._loop).result()
+
+    async def astream(
+        self, prompt: str, formal: bool, guardrails, timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """Like :meth:`iter_stream`, for consumers on another event loop."""
+        stream = self._stream(prompt, formal, guardrails)
+        try:
+            while True:
+                chunk = await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(
+                        self._next(stream, timeout), self._loop
+                    )
+                )
+                if chunk is _END:
+                    return
+                yield chunk
+        finally:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self._close(stream), self._loop)
+            )
+
+    def close(self) -> None:
+        """Stop the runner loop; pending calls are cancelled."""
+
+        def _shutdown():
+            for task in asyncio.all_tasks(self._loop):
+                task.cancel()
+            self._loop.stop()
+
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(_shutdown)
+            self._thread.join()
+        self._loop.close()
+
+
+def get_generation_runner() -> GenerationRunner:
+    """Get the generation runner of the current app, starting it on first use."""
+    app = current_app._get_current_object()
+    runner = app.extensions.get("generation_runner")
+    if runner is None:
+        with _runner_lock:
+            runner = app.extensions.get("generation_runner")
+            if runner is None:
+                runner = GenerationRunner(
+                    max_concurrency=app.config.get(
+                        "OPENAI_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY
+                    ),
+                    timeout=app.config.get("OPENAI_TIMEOUT", DEFAULT_TIMEOUT),
+                    cache=get_response_cache(),
+                    flight=get_single_flight("generate"),
+                )
+                app.extensions["generation_runner"] = runner
+    return runner
+
+
+def sse_event(event: str, data: Dict) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def wants_stream(accept: str, stream_param: Optional[str]) -> bool:
+    """Whether a generate request asked for Server-Sent Events."""
+    if stream_param is not None:
+        return stream_param.lower() in ("1", "true", "yes")
+    return "text/event-stream" in (accept or "")
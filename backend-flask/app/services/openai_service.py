@@ -1,13 +1,19 @@
 import logging
 import os
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from ..utils.metrics import track_llm_call
 
 logger = logging.getLogger(__name__)
 
-# Global client variable to allow for easier patching in tests
+# Global client variables to allow for easier patching in tests
 _client = None
+_async_client = None
+
+# Chat model used for vocabulary generation
+GENERATION_MODEL = "gpt-3.5-turbo"
 
 
 def get_openai_client():
@@ -19,6 +25,19 @@ def get_openai_client():
     return _client
 
 
+def get_async_openai_client():
+    """Get or create the AsyncOpenAI client instance.
+
+    The client's connection pool belongs to the event loop it is first used
+    on, so it should only be used from the generation runner's loop.
+    """
+    global _async_client
+    if _async_client is None:
+        api_key = os.environ.get("OPENAI_API_KEY", "dummy_key_for_tests")
+        _async_client = AsyncOpenAI(api_key=api_key)
+    return _async_client
+
+
 # Default implementation that will be replaced in tests
 async def default_generate_vocab(prompt: Optional[str] = None) -> Dict:
     try:
@@ -37,19 +56,45 @@ async def default_generate_vocab(prompt: Optional[str] = None) -> Dict:
 
 # Service that accepts the generator function
 async def generate_vocabulary(prompt: str, formal: bool = True) -> Dict:
-    """Generate vocabulary using OpenAI."""
+    """Generate vocabulary using OpenAI.
+
+    Awaits the completion without blocking the event loop; concurrency
+    limits and timeouts are applied by the caller
+    (see :class:`app.services.generation.GenerationRunner`).
+    """
     try:
         # Get client instance
-        client = get_openai_client()
+        client = get_async_openai_client()
 
         # Using the OpenAI API
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-        )
+        with track_llm_call("generate"):
+            response = await client.chat.completions.create(
+                model=GENERATION_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7,
+            )
 
         return {"response": response.choices[0].message.content, "status": "success"}
     except Exception as e:
         logger.error(f"OpenAI API error: {str(e)}")
         raise
+
+
+async def stream_vocabulary(prompt: str, formal: bool = True) -> AsyncIterator[str]:
+    """Stream generated vocabulary from OpenAI as text deltas."""
+    try:
+        client = get_async_openai_client()
+        # Timed until the last token arrives
+        with track_llm_call("generate_stream"):
+            stream = await client.chat.completions.create(
+                model=GENERATION_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+    except Exception as e:
+        logger.error(f"OpenAI API error: {str(e)}")
+        raise
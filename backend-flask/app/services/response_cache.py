@@ -0,0 +1,211 @@
+"""Response cache for vocabulary generation.
+
+Exact repeats of a prompt (after normalization, for the same formality and
+model) are served from a :class:`~app.utils.text_cache.TextCache`. When an
+embedding service is configured, a prompt that misses can also be served
+the response of a cached prompt whose embedding is similar enough, so
+rephrasings of a common request do not reach the LLM either.
+"""
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from flask import current_app, has_app_context
+
+from ..utils.text_cache import DEFAULT_MAX_SIZE, TextCache, normalize_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 60 * 60  # seconds
+DEFAULT_SIMILARITY = 0.95
+DEFAULT_SEMANTIC_SIZE = 256
+EMBEDDING_TIMEOUT = 2.0  # seconds
+
+# Values of the X-Cache response header
+HIT = "HIT"
+SIMILAR_HIT = "HIT-SIMILAR"
+MISS = "MISS"
+
+_app_lock = threading.Lock()
+
+
+def _unit(vector: List[float]) -> Optional[List[float]]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if not norm:
+        return None
+    return [value / norm for value in vector]
+
+
+class ResponseCache(TextCache):
+    """Cache of generated responses with an optional near-duplicate tier.
+
+    Args:
+        embedding_url: Base URL of the opea-comps embedding service; the
+            near-duplicate tier is off without it
+        similarity: Minimum cosine similarity for a near-duplicate hit
+        semantic_size: Prompt embeddings kept for near-duplicate search
+        embedding_model: Model name sent to the embedding service
+
+    Other arguments are those of :class:`TextCache`.
+    """
+
+    table = "response_cache"
+
+    def __init__(
+        self,
+        *args,
+        embedding_url: Optional[str] = None,
+        similarity: float = DEFAULT_SIMILARITY,
+        semantic_size: int = DEFAULT_SEMANTIC_SIZE,
+        embedding_model: str = "text-embedding-ada-002",
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.embedding_url = embedding_url.rstrip("/") if embedding_url else None
+        self.similarity = similarity
+        self.semantic_size = semantic_size
+        self.embedding_model = embedding_model
+        self.similar_hits = 0
+        self._vectors: "OrderedDict[str, Tuple[str, List[float]]]" = OrderedDict()
+        self._http: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def scope(formal: bool) -> str:
+        return "formal" if formal else "informal"
+
+    async def lookup(
+        self, prompt: str, formal: bool
+    ) -> Tuple[Optional[Dict], str, Optional[List[float]]]:
+        """Find a cached response for ``prompt``.
+
+        Returns:
+            tuple: ``(response, cache status, prompt embedding)``; the
+            embedding is passed back to :meth:`store` on a miss so it is
+            only computed once
+        """
+        scope = self.scope(formal)
+        response = self.get(prompt, scope)
+        if response is not None:
+            return response, HIT, None
+        if not self.embedding_url:
+            return None, MISS, None
+
+        vector = await self._embed(prompt)
+        if vector is None:
+            return None, MISS, None
+        key = self._nearest(scope, vector)
+        if key is not None:
+            response = self.get_by_key(key, count=False)
+            if response is not None:
+                with self._lock:
+                    self.similar_hits += 1
+                return response, SIMILAR_HIT, vector
+        return None, MISS, vector
+
+    def store(
+        self,
+        prompt: str,
+        formal: bool,
+        response: Dict,
+        vector: Optional[List[float]] = None,
+    ) -> None:
+        """Cache ``response``, indexing its embedding for similar prompts."""
+        scope = self.scope(formal)
+        key = self.set(prompt, response, scope)
+        if vector is not None:
+            with self._lock:
+                self._vectors[key] = (scope, vector)
+                self._vectors.move_to_end(key)
+                while len(self._vectors) > self.semantic_size:
+                    self._vectors.popitem(last=False)
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        lookups = stats["hits"] + stats["misses"]
+        # Near-duplicate hits are exact misses served from another entry
+        stats["similarHits"] = self.similar_hits
+        stats["hitRatio"] = (
+            round((stats["hits"] + self.similar_hits) / lookups, 4) if lookups else 0
+        )
+        stats["semantic"] = self.embedding_url is not None
+        return stats
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._vectors.clear()
+            self.similar_hits = 0
+
+    def _evicted(self, key: str) -> None:
+        self._vectors.pop(key, None)
+
+    def _nearest(self, scope: str, vector: List[float]) -> Optional[str]:
+        best_key, best = None, self.similarity
+        with self._lock:
+            candidates = list(self._vectors.items())
+        for key, (entry_scope, entry_vector) in candidates:
+            if entry_scope != scope or len(entry_vector) != len(vector):
+                continue
+            similarity = sum(a * b for a, b in zip(vector, entry_vector))
+            if similarity >= best:
+                best_key, best = key, similarity
+        return best_key
+
+    async def _embed(self, prompt: str) -> Optional[List[float]]:
+        """Embed the normalized prompt; failures just skip the tier."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=EMBEDDING_TIMEOUT)
+        try:
+            response = await self._http.post(
+                f"{self.embedding_url}/v1/embeddings",
+                json={
+                    "model": self.embedding_model,
+                    "messages": normalize_text(prompt),
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+            # opea-comps returns {"embedding": [...]}, OpenAI-style services
+            # return {"data": [{"embedding": [...]}]}
+            vector = data.get("embedding") or data["data"][0]["embedding"]
+            return _unit([float(value) for value in vector])
+        except Exception as e:
+            logger.warning(f"Embedding lookup failed, skipping similar cache: {e}")
+            return None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the response cache of the current app.
+
+    Built on first use from the ``RESPONSE_CACHE_*`` settings; None when
+    ``RESPONSE_CACHE_SIZE`` is 0.
+    """
+    from .openai_service import GENERATION_MODEL
+
+    if not has_app_context():
+        return None
+    app = current_app._get_current_object()
+    if not app.config.get("RESPONSE_CACHE_SIZE", DEFAULT_MAX_SIZE):
+        return None
+
+    cache = app.extensions.get("response_cache")
+    if cache is None:
+        with _app_lock:
+            cache = app.extensions.get("response_cache")
+            if cache is None:
+                cache = ResponseCache(
+                    max_size=app.config.get("RESPONSE_CACHE_SIZE", DEFAULT_MAX_SIZE),
+                    ttl=app.config.get("RESPONSE_CACHE_TTL", DEFAULT_TTL),
+                    db_path=app.config.get("RESPONSE_CACHE_DB"),
+                    namespace=GENERATION_MODEL,
+                    embedding_url=app.config.get("RESPONSE_CACHE_EMBEDDING_URL"),
+                    similarity=app.config.get(
+                        "RESPONSE_CACHE_SIMILARITY", DEFAULT_SIMILARITY
+                    ),
+                )
+                app.extensions["response_cache"] = cache
+    return cache
@@ -0,0 +1,196 @@
+"""Bulk vocabulary import.
+
+Takes the ``{"groups": [{"group": str, "words": [...]}]}`` document produced by
+the vocab-importer and writes it with a fixed number of set-based statements
+per chunk instead of one statement per row.
+"""
+
+import logging
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from sqlalchemy import func, insert, select, update
+
+from ..extensions import db
+from ..models import Group, Word, WordGroup
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT / IN (...) lookup, kept under SQLite's bound parameter limit
+IMPORT_CHUNK_SIZE = 500
+
+
+def _chunks(items: List, size: int) -> Iterator[List]:
+    for start in range(0, len(items), size):
+        end = start + size
+        yield items[start:end]
+
+
+def _normalize_word(word) -> Dict:
+    """Turn a plain string or a word object into column values."""
+    if isinstance(word, str):
+        word = {"romanian": word}
+    if not isinstance(word, dict):
+        raise ValueError(f"Invalid word entry: {word!r}")
+
+    romanian = (word.get("romanian") or word.get("word") or "").strip()
+    if not romanian:
+        raise ValueError("Word entries must have a Romanian text")
+
+    return {
+        "romanian": romanian,
+        "english": (word.get("english") or word.get("translation") or "").strip(),
+        "pronunciation": word.get("pronunciation"),
+        "part_of_speech": word.get("part_of_speech") or "",
+        "parts": word.get("parts") or [],
+    }
+
+
+def _normalize_groups(groups: Iterable) -> Dict[str, List[Dict]]:
+    """Validate the payload and merge entries that share a group name."""
+    if not isinstance(groups, list):
+        raise ValueError("groups must be a list")
+
+    merged: Dict[str, List[Dict]] = {}
+    for entry in groups:
+        if not isinstance(entry, dict):
+            raise ValueError(f"Invalid group entry: {entry!r}")
+        name = (entry.get("group") or "").strip()
+        if not name:
+            raise ValueError("Group name is required")
+        words = entry.get("words")
+        if not isinstance(words, list):
+            raise ValueError(f"Words for group '{name}' must be a list")
+        merged.setdefault(name, []).extend(_normalize_word(w) for w in words)
+    return merged
+
+
+def _ids_by(column, key_column, keys: List) -> Dict:
+    """Look up ``key -> id`` in chunks, keeping the lowest id for duplicates."""
+    ids = {}
+    for chunk in _chunks(keys, IMPORT_CHUNK_SIZE):
+        rows = db.session.execute(
+            select(key_column, column).where(key_column.in_(chunk)).order_by(column)
+        )
+        for key, row_id in rows:
+            ids.setdefault(key, row_id)
+    return ids
+
+
+def _upsert_groups(names: List[str]) -> Tuple[Dict[str, int], int]:
+    """Return ids for all group names and how many had to be inserted."""
+    group_ids = _ids_by(Group.id, Group.name, names)
+    missing = [name for name in names if name not in group_ids]
+    for chunk in _chunks(missing, IMPORT_CHUNK_SIZE):
+        rows = db.session.execute(
+            insert(Group.__table__).returning(Group.name, Group.id),
+            [{"name": name, "description": "", "word_count": 0} for name in chunk],
+        )
+        group_ids.update((name, group_id) for name, group_id in rows)
+    return group_ids, len(missing)
+
+
+def _insert_words(words: Dict[str, Dict]) -> Tuple[Dict[str, int], int]:
+    """Return ids for all words keyed by Romanian text and how many are new."""
+    keys = list(words)
+    word_ids = _ids_by(Word.id, Word.romanian, keys)
+    missing = [key for key in keys if key not in word_ids]
+    # Core inserts against the table skip the ORM's per-row bookkeeping
+    for chunk in _chunks(missing, IMPORT_CHUNK_SIZE):
+        rows = db.session.execute(
+            insert(Word.__table__).returning(Word.romanian, Word.id),
+            [words[key] for key in chunk],
+        )
+        word_ids.update((romanian, word_id) for romanian, word_id in rows)
+    return word_ids, len(missing)
+
+
+def _link_words(links: List[Tuple[int, int]], group_ids: List[int]) -> int:
+    """Insert the ``words_groups`` rows that do not exist yet."""
+    existing = set()
+    for chunk in _chunks(group_ids, IMPORT_CHUNK_SIZE):
+        rows = db.session.execute(
+            select(WordGroup.word_id, WordGroup.group_id).where(
+                WordGroup.group_id.in_(chunk)
+            )
+        )
+        existing.update((word_id, group_id) for word_id, group_id in rows)
+
+    new_links = [link for link in links if link not in existing]
+    for chunk in _chunks(new_links, IMPORT_CHUNK_SIZE):
+        db.session.execute(
+            insert(WordGroup.__table__),
+            [{"word_id": word_id, "group_id": group_id} for word_id, group_id in chunk],
+        )
+    return len(new_links)
+
+
+def _refresh_word_counts(group_ids: List[int]) -> None:
+    """Recompute ``Group.word_count`` from ``words_groups`` for the given groups."""
+    word_count = (
+        select(func.count())
+        .where(WordGroup.group_id == Group.id)
+        .correlate(Group)
+        .scalar_subquery()
+    )
+    for chunk in _chunks(group_ids, IMPORT_CHUNK_SIZE):
+        db.session.execute(
+            update(Group)
+            .where(Group.id.in_(chunk))
+            .values(word_count=word_count)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def import_vocabulary(groups) -> Dict[str, int]:
+    """Import groups and words in a single transaction.
+
+    Groups are upserted by name and words are matched on their Romanian text,
+    so importing the same file twice does not create duplicates.
+
+    Args:
+        groups: List of ``{"group": str, "words": [str | dict]}`` entries
+
+    Returns:
+        dict: Counts of groups and words created and links added
+
+    Raises:
+        ValueError: If the payload is malformed
+    """
+    merged = _normalize_groups(groups)
+
+    # The first occurrence of a word decides its column values
+    words: Dict[str, Dict] = {}
+    for group_words in merged.values():
+        for word in group_words:
+            words.setdefault(word["romanian"], word)
+
+    try:
+        group_ids, groups_created = _upsert_groups(list(merged))
+        word_ids, words_created = _insert_words(words)
+
+        links = list(
+            dict.fromkeys(
+                (word_ids[word["romanian"]], group_ids[name])
+                for name, group_words in merged.items()
+                for word in group_words
+            )
+        )
+        links_created = _link_words(links, list(group_ids.values()))
+        _refresh_word_counts(list(group_ids.values()))
+
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    logger.info(
+        f"Imported {len(words)} words into {len(merged)} groups "
+        f"({words_created} new words, {links_created} new links)"
+    )
+    return {
+        "groups": len(merged),
+        "groupsCreated": groups_created,
+        "words": len(words),
+        "wordsCreated": words_created,
+        "linksCreated": links_created,
+    }
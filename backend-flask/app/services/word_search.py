@@ -0,0 +1,71 @@
+"""Full-text word search.
+
+Queries the ``words_fts`` index maintained by triggers on ``words``. Results
+are ranked by bm25, weighted towards matches on the Romanian word, and the
+last term of the query is matched as a prefix so the search works as the
+user types.
+
+Every match is ranked: FTS5 keeps only the best ``limit`` rows while it
+scores them, so no candidate cut-off can drop the best match. Short
+prefixes of common words match much of the vocabulary and cost the most.
+"""
+
+import re
+from typing import List
+
+from sqlalchemy import Integer, column, select, text
+
+from ..extensions import db
+from ..models import Word
+from ..models.word_search import FTS_TABLE
+
+_TERM = re.compile(r"\w+")
+
+_MATCHES = text(
+    f"SELECT rowid AS id, rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :query "
+    "ORDER BY rank LIMIT :limit"
+).columns(column("id", Integer), column("rank"))
+
+
+def build_match_query(search: str, prefix: bool = True) -> str:
+    """Turn user input into an FTS5 ``MATCH`` expression.
+
+    Every word of the input must match. Terms are quoted so FTS5 operators
+    and punctuation in the input are treated as text.
+
+    Args:
+        search: Text typed by the user
+        prefix: Match the last term as a prefix ("mă" finds "măr")
+
+    Raises:
+        ValueError: If the input contains no words
+    """
+    terms = _TERM.findall(search)
+    if not terms:
+        raise ValueError("q must contain at least one letter or digit")
+    query = " ".join(f'"{term}"' for term in terms)
+    return query + "*" if prefix else query
+
+
+def search_words(search: str, fields: List[str], limit: int, prefix: bool = True):
+    """Find the best matching words for ``search``.
+
+    Args:
+        search: Text typed by the user
+        fields: API field names to select, see :meth:`Word.api_columns`
+        limit: Maximum number of words to return
+        prefix: Match the last term as a prefix
+
+    Returns:
+        list: JSON text of each word (see :meth:`Word.json_object`), best
+        match first
+    """
+    matches = _MATCHES.bindparams(
+        query=build_match_query(search, prefix),
+        limit=limit,
+    ).subquery("matches")
+    return db.session.scalars(
+        select(Word.json_object(fields))
+        .join(matches, matches.c.id == Word.id)
+        .order_by(matches.c.rank)
+    ).all()
@@ -47,8 +47,32 @@ swagger_config = {
         "/words": {
             "get": {
                 "tags": ["Words"],
-                "summary": "Get all words",
-                "description": "Returns a list of all vocabulary words",
+                "summary": "Get a page of words",
+                "description": (
+                    "Returns vocabulary words ordered by id, paginated with a "
+                    "keyset cursor"
+                ),
+                "parameters": [
+                    {
+                        "name": "cursor",
+                        "in": "query",
+                        "type": "integer",
+                        "description": "nextCursor from the previous page",
+                    },
+                    {
+                        "name": "limit",
+                        "in": "query",
+                        "type": "integer",
+                        "default": 50,
+                        "maximum": 500,
+                    },
+                    {
+                        "name": "fields",
+                        "in": "query",
+                        "type": "string",
+                        "description": "Comma separated list of fields to return",
+                    },
+                ],
                 "responses": {
                     "200": {
                         "description": "List of words",
@@ -67,9 +91,20 @@ swagger_config = {
                                             "pronunciation": {"type": "string"},
                                             "part_of_speech": {"type": "string"},
                                             "parts": {"type": "string"},
+                                            "groupIds": {
+                                                "type": "array",
+                                                "items": {"type": "integer"},
+                                            },
                                         },
                                     },
                                 },
+                                "pagination": {
+                                    "type": "object",
+                                    "properties": {
+                                        "limit": {"type": "integer"},
+                                        "nextCursor": {"type": "integer"},
+                                    },
+                                },
                             },
                         },
                     }
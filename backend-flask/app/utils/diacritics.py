@@ -0,0 +1,144 @@
+"""Single-pass restoration of Romanian diacritics.
+
+The text is scanned once for word tokens and each token is looked up in a
+table keyed by its diacritic-free, lowercase spelling, so the cost depends
+on the length of the text and not on the size of the dictionary.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Includes the cedilla forms (ş, ţ) that are still common in older text
+_FOLD_TABLE = str.maketrans("ăâîșțşţĂÂÎȘȚŞŢ", "aaiststAAISTST")
+_DIACRITICS = set("ăâîșțşţĂÂÎȘȚŞŢ")
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+_HEADWORD_RE = re.compile(r"^\s*\d+\.\s+(.+)$")
+_EXAMPLE_RE = re.compile(r'Example:\s*"([^"]*)"')
+
+
+def fold(text: str) -> str:
+    """Strip Romanian diacritics, e.g. ``"Țară"`` -> ``"Tara"``."""
+    return text.translate(_FOLD_TABLE)
+
+
+def has_diacritics(word: str) -> bool:
+    return any(char in _DIACRITICS for char in word)
+
+
+def build_table(
+    words: Dict[str, str], word_forms: Iterable[str] = ()
+) -> Dict[str, str]:
+    """Build the lookup table for :class:`DiacriticCorrector`.
+
+    Args:
+        words: Explicit corrections (misspelling -> correct form); these
+            always win
+        word_forms: Correctly spelled words. A form with diacritics is added
+            under its folded spelling unless that spelling is ambiguous,
+            i.e. another form folds to it as well (``casa``/``casă``). A
+            form ending in ``ă`` always is: the feminine definite form only
+            differs in its last letter (``apă``/``apa``)
+
+    Returns:
+        dict: lowercase folded spelling -> correct form
+    """
+    candidates: Dict[str, set] = {}
+    for form in word_forms:
+        form = form.lower()
+        forms = candidates.setdefault(fold(form), set())
+        forms.add(form)
+        if form.endswith("ă"):
+            forms.add(form[:-1] + "a")
+
+    table = {}
+    for key, forms in candidates.items():
+        if len(forms) == 1:
+            (form,) = forms
+            if has_diacritics(form):
+                table[key] = form
+
+    for word, correct in words.items():
+        table[fold(word).lower()] = correct
+    return table
+
+
+@lru_cache(maxsize=8)
+def load_word_forms(path: str) -> frozenset:
+    """Read the Romanian word forms from a vocabulary file.
+
+    Understands the ``sentence-constructor/utils/core-vocab.txt`` layout
+    (numbered headwords with quoted examples) and falls back to reading
+    every word of a plain word list.
+    """
+    forms = set()
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+
+    structured = any(_EXAMPLE_RE.search(line) for line in lines)
+    for line in lines:
+        if structured:
+            match = _HEADWORD_RE.match(line) or _EXAMPLE_RE.search(line)
+            if not match:
+                continue
+            line = match.group(1)
+        forms.update(_WORD_RE.findall(line))
+
+    logger.info(f"Loaded {len(forms)} word forms from {path}")
+    return frozenset(forms)
+
+
+class DiacriticCorrector:
+    """Restores diacritics in one pass over the text.
+
+    Case is preserved: ``TARA`` becomes ``ȚARĂ`` and ``Tara`` becomes
+    ``Țară``. Corrections that start with a capital letter (place names) keep
+    it even when the input is lowercase.
+    """
+
+    def __init__(self, words: Dict[str, str], word_forms: Iterable[str] = ()):
+        self.table = build_table(words, word_forms)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def _replace(self, match: "re.Match") -> str:
+        token = match.group(0)
+        correct = self.table.get(fold(token).lower())
+        if correct is None:
+            return token
+        if token.isupper() and len(token) > 1:
+            return correct.upper()
+        if token[0].isupper():
+            return correct[0].upper() + correct[1:]
+        return correct
+
+    def correct(self, text: str) -> str:
+        if not text or not self.table:
+            return text
+        return _WORD_RE.sub(self._replace, text)
+
+
+@lru_cache(maxsize=8)
+def _cached_corrector(words: tuple, vocab_path: Optional[str]) -> DiacriticCorrector:
+    word_forms = load_word_forms(vocab_path) if vocab_path else ()
+    return DiacriticCorrector(dict(words), word_forms)
+
+
+def get_diacritic_corrector(
+    words: Dict[str, str], vocab_path: Optional[str] = None
+) -> DiacriticCorrector:
+    """Get a corrector for ``words`` plus an optional vocabulary file.
+
+    Correctors are built once per dictionary and file and then reused.
+    If the file cannot be read only ``words`` are used.
+    """
+    try:
+        return _cached_corrector(tuple(sorted(words.items())), vocab_path)
+    except OSError as e:
+        logger.warning(f"Could not load diacritics vocabulary {vocab_path}: {e}")
+        return _cached_corrector(tuple(sorted(words.items())), None)
@@ -0,0 +1,259 @@
+"""Local detection of informal Romanian.
+
+Formal output only needs the formality LLM pass for sentences that address
+the reader informally. Informal address shows in second person singular
+pronouns and possessives (``tu``, ``te``, ``ție``, ``tău``) and in verb
+forms (``ești``, ``vrei``, ``lucrezi``, ``citești``, ``mănânci``), so a
+word lookup plus a few verb endings is enough to decide which sentences to
+send to the LLM. The check errs on the side of flagging: a false positive
+only costs an LLM call, a miss would leave informal text in formal output.
+"""
+
+import re
+from typing import List
+
+from .diacritics import fold
+
+# End of a sentence: terminal punctuation (plus closing quotes or brackets)
+# followed by whitespace, or a line break
+SENTENCE_END = re.compile(r"[.!?…]+[\"')\]»”]*\s+|\n+")
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+# Second person singular pronouns, possessives and common verb forms,
+# including imperatives and clitics (``du-te``, ``spune-mi``)
+INFORMAL_WORDS = frozenset(
+    {
+        "tu",
+        "te",
+        "ți",
+        "îți",
+        "ție",
+        "tine",
+        "tău",
+        "ta",
+        "tăi",
+        "tale",
+        "ești",
+        "ai",
+        "vrei",
+        "poți",
+        "mergi",
+        "vii",
+        "faci",
+        "știi",
+        "spui",
+        "iei",
+        "dai",
+        "stai",
+        "bei",
+        "zici",
+        "vezi",
+        "auzi",
+        "vino",
+        "fă",
+        "hai",
+        "vei",
+        "scrii",
+        "descrii",
+        "revii",
+        "devii",
+        "ții",
+        "obții",
+        "reții",
+        "menții",
+        "susții",
+        "continui",
+    }
+)
+
+# Present tense endings of the second person singular: lucr-ezi,
+# cit-ești, ur-ăști
+INFORMAL_ENDINGS = ("ezi", "ești", "ăști")
+
+# Most other verbs end the second person singular in a bare -i after the
+# stem (mănânc-i, dorm-i, cânț-i). Second person plural verbs, plural nouns
+# and adjectives end in -i too; these endings and a preceding preposition,
+# determiner or numeral (``a dormi``, ``multe cărți``) mark the word as
+# something else
+NOT_VERB_ENDINGS = ("ați", "ăți", "âți", "eți", "iți", "uri")
+
+BEFORE_NOUN = frozenset(
+    {
+        "a",
+        "de",
+        "cu",
+        "la",
+        "în",
+        "pe",
+        "din",
+        "prin",
+        "spre",
+        "pentru",
+        "despre",
+        "fără",
+        "după",
+        "sub",
+        "între",
+        "niște",
+        "multe",
+        "mulți",
+        "puține",
+        "puțini",
+        "câteva",
+        "câțiva",
+        "toate",
+        "toți",
+        "aceste",
+        "acești",
+        "acele",
+        "acei",
+        "cele",
+        "cei",
+        "alte",
+        "alți",
+        "unele",
+        "unii",
+        "două",
+        "doi",
+        "trei",
+        "patru",
+        "cinci",
+        "șase",
+        "șapte",
+        "opt",
+        "nouă",
+        "zece",
+    }
+)
+
+_VOWELS = frozenset("aeiou")
+
+# Common words with those endings that are not verbs; place names only
+# matter at the start of a sentence, elsewhere capitals mark them as names
+NOT_INFORMAL = frozenset(
+    {
+        "bucurești",
+        "pitești",
+        "ploiești",
+        "mărășești",
+        "chinezi",
+        "englezi",
+        "francezi",
+        "japonezi",
+        "olandezi",
+        "portughezi",
+        "danezi",
+        "irlandezi",
+        "românești",
+        "englezești",
+        "franțuzești",
+        "nemțești",
+        "omenești",
+        "pământești",
+        "sufletești",
+        "bărbătești",
+        "femeiești",
+        "copilărești",
+        # Words ending in a bare -i
+        "aici",
+        "atunci",
+        "deci",
+        "ieri",
+        "totuși",
+        "uneori",
+        "alteori",
+        "luni",
+        "vineri",
+        "mâini",
+        "ochi",
+        "unchi",
+        "vechi",
+        "oameni",
+        "nimeni",
+        "prieteni",
+        "profesori",
+        "studenți",
+        "părinți",
+        "elevi",
+        "bani",
+        "câini",
+        "munți",
+        "cărți",
+        "limbi",
+        "români",
+        "nemți",
+        "greci",
+        "ruși",
+        "italieni",
+        "mari",
+        "mici",
+        "buni",
+        "mulți",
+        "puțini",
+        "toți",
+        "câți",
+        "alți",
+        "acești",
+    }
+)
+
+
+def _key(word: str) -> str:
+    return fold(word.casefold())
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences, each keeping its trailing whitespace.
+
+    Joining the result gives back ``text``.
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_END.finditer(text):
+        end = match.end()
+        sentences.append(text[start:end])
+        start = end
+    if start < len(text):
+        sentences.append(text[start:])
+    return sentences
+
+
+class FormalityClassifier:
+    """Decides whether text addresses the reader informally.
+
+    Words and endings are compared without diacritics, so text missing
+    them is still recognised.
+    """
+
+    def __init__(self):
+        self.words = frozenset(_key(word) for word in INFORMAL_WORDS)
+        self.endings = tuple(_key(ending) for ending in INFORMAL_ENDINGS)
+        self.exceptions = frozenset(_key(word) for word in NOT_INFORMAL)
+        self.not_verb_endings = tuple(_key(ending) for ending in NOT_VERB_ENDINGS)
+        self.before_noun = frozenset(_key(word) for word in BEFORE_NOUN)
+
+    def is_informal(self, text: str) -> bool:
+        """Whether ``text`` contains an informal second person form."""
+        previous = None
+        for index, match in enumerate(_WORD_RE.finditer(text)):
+            word = match.group()
+            key = _key(word)
+            after, previous = previous, key
+            if key in self.words:
+                return True
+            # Capitalized words past the start are names (București)
+            if index and word[0].isupper():
+                continue
+            if key in self.exceptions:
+                continue
+            if key.endswith(self.endings) and len(key) > 4:
+                return True
+            if self._ends_in_bare_i(key) and after not in self.before_noun:
+                return True
+        return False
+
+    def _ends_in_bare_i(self, key: str) -> bool:
+        if len(key) <= 3 or not key.endswith("i") or key[-2] in _VOWELS:
+            return False
+        return not key.endswith(self.not_verb_endings)
@@ -4,7 +4,10 @@ from dataclasses import dataclass
 from typing import Optional
 
 # Import and re-export the LangChain guardrails for backward compatibility
-from .langchain_guardrails import LangChainRomanianGuardrails
+from .langchain_guardrails import (  # noqa: F401
+    LangChainRomanianGuardrails,
+    get_guardrails,
+)
 
 
 @dataclass
@@ -28,9 +31,7 @@ class RomanianGuardrails:
     def _get_guardrails(self):
         """Lazy initialization of guardrails to ensure app context is available."""
         if self.langchain_guardrails is None:
-            self.langchain_guardrails = LangChainRomanianGuardrails(
-                api_key=self.api_key
-            )
+            self.langchain_guardrails = get_guardrails(api_key=self.api_key)
         return self.langchain_guardrails
 
     def validate_input(self, text: str) -> GuardrailResult:
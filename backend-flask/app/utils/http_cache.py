@@ -0,0 +1,183 @@
+"""Conditional GET and payload caching for read-mostly API routes.
+
+A cached route declares the tables its response is built from. Its ETag is a
+hash of the request (path and query string) and the current versions of
+those tables, which triggers bump on every write (see
+:mod:`app.models.table_version`). A client that sends the ETag back in
+``If-None-Match`` gets a 304 after one lookup of the version counters,
+without the route reading any rows. Otherwise the serialized body is served
+from an in-process LRU while the versions are unchanged; a write changes the
+versions, so the next request rebuilds the entry.
+"""
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from flask import current_app, has_app_context, make_response, request
+
+from ..models.table_version import TableVersion
+from .metrics import API_CACHE_REQUESTS, request_endpoint
+
+DEFAULT_MAX_SIZE = 256
+
+# Values of the X-Cache response header
+HIT = "HIT"
+MISS = "MISS"
+
+_app_lock = threading.Lock()
+
+
+class PayloadCache:
+    """Thread-safe LRU of serialized responses, one entry per request.
+
+    Args:
+        max_size: Entries kept before the least recently used one is evicted
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(self, key: str, etag: str) -> Optional[bytes]:
+        """Return the body cached for ``key`` if it was stored under ``etag``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == etag:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                # Written to since: the entry can never be served again
+                del self._entries[key]
+                self.invalidations += 1
+            self.misses += 1
+            return None
+
+    def set(self, key: str, etag: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.invalidations = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Counters for monitoring the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxSize": self.max_size,
+                "bytes": sum(len(body) for _, body in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": round(self.hits / lookups, 4) if lookups else 0,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+def get_api_cache() -> Optional[PayloadCache]:
+    """Get the payload cache of the current app.
+
+    Built on first use from ``API_CACHE_SIZE``; None when it is 0.
+    """
+    if not has_app_context():
+        return None
+    app = current_app._get_current_object()
+    max_size = app.config.get("API_CACHE_SIZE", DEFAULT_MAX_SIZE)
+    if not max_size:
+        return None
+
+    cache = app.extensions.get("api_cache")
+    if cache is None:
+        with _app_lock:
+            cache = app.extensions.get("api_cache")
+            if cache is None:
+                cache = PayloadCache(max_size=max_size)
+                app.extensions["api_cache"] = cache
+    return cache
+
+
+def _request_key(vary: Optional[Callable[[], str]]) -> str:
+    # Parameter order does not change the response, so it does not change the key
+    query = urlencode(sorted(request.args.items(multi=True)))
+    key = f"{request.path}?{query}"
+    return f"{key}#{vary()}" if vary is not None else key
+
+
+def _etag(key: str, versions) -> str:
+    data = f"{key}|{versions}".encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def cached_response(*tables: str, vary: Optional[Callable[[], str]] = None):
+    """Serve a GET route with ETags and from the payload cache.
+
+    Args:
+        tables: Tables the response is built from
+        vary: Optional callable returning anything else the response depends
+            on, such as the current date
+
+    Only 200 responses are tagged and cached.
+    """
+
+    def decorator(f):
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            # Versions are read before the rows, so a write racing with the
+            # route can only tag new data with old versions, never the reverse
+            key = _request_key(vary)
+            etag = _etag(key, TableVersion.current(tables))
+            endpoint = request_endpoint()
+
+            if request.if_none_match.contains_weak(etag):
+                API_CACHE_REQUESTS.labels(
+                    endpoint=endpoint, result="not_modified"
+                ).inc()
+                response = current_app.response_class(status=304)
+                return _tag(response, etag)
+
+            cache = get_api_cache()
+            body = cache.get(key, etag) if cache is not None else None
+            if body is not None:
+                API_CACHE_REQUESTS.labels(endpoint=endpoint, result="hit").inc()
+                response = current_app.response_class(body, mimetype="application/json")
+                response.headers["X-Cache"] = HIT
+                return _tag(response, etag)
+
+            API_CACHE_REQUESTS.labels(endpoint=endpoint, result="miss").inc()
+            response = make_response(f(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            if cache is not None:
+                cache.set(key, etag, response.get_data())
+            response.headers["X-Cache"] = MISS
+            return _tag(response, etag)
+
+        return decorated_function
+
+    return decorator
+
+
+def _tag(response, etag: str):
+    response.set_etag(etag)
+    # Browsers keep the response but revalidate it on every use, so polling
+    # clients send If-None-Match without any frontend changes
+    response.headers["Cache-Control"] = "no-cache"
+    return response
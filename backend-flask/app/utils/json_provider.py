@@ -0,0 +1,119 @@
+"""JSON providers for Flask responses.
+
+``jsonify`` and ``request.get_json`` go through ``app.json``. With orjson
+installed, :class:`ORJSONProvider` encodes straight to bytes in C; otherwise
+:class:`StdlibJSONProvider` keeps the standard library encoder. Both write
+datetimes as ISO 8601 and embed :class:`RawJSON` fragments as they are, so
+rows that SQLite has already encoded (see ``Word.json_object``) are never
+turned back into Python objects.
+"""
+
+import json
+import logging
+from datetime import date, time
+from decimal import Decimal
+from typing import Any, Iterable, Union
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without orjson installed
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Values of the JSON_PROVIDER setting
+AUTO = "auto"
+ORJSON = "orjson"
+STDLIB = "stdlib"
+
+
+class RawJSON:
+    """Already encoded JSON, written into a response unchanged."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Union[str, bytes]):
+        self.data = data
+
+
+def json_array(items: Iterable[str]) -> RawJSON:
+    """Join encoded JSON values into one encoded array."""
+    return RawJSON("[" + ",".join(items) + "]")
+
+
+def _stdlib_default(o: Any) -> Any:
+    if isinstance(o, (date, time)):
+        return o.isoformat()
+    if isinstance(o, RawJSON):
+        return json.loads(o.data)
+    return DefaultJSONProvider.default(o)
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Flask's default provider, writing datetimes as ISO 8601."""
+
+    default = staticmethod(_stdlib_default)
+
+
+def _orjson_default(o: Any) -> Any:
+    if isinstance(o, RawJSON):
+        return orjson.Fragment(o.data)
+    if isinstance(o, Decimal):
+        return str(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class ORJSONProvider(StdlibJSONProvider):
+    """JSON provider backed by orjson.
+
+    Output matches the default provider apart from whitespace and non-ASCII
+    text, which is written as UTF-8 rather than ``\\u`` escapes. Calls with
+    options orjson does not support fall back to the standard library.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if set(kwargs) - {"sort_keys", "indent"}:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, **kwargs).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any, sort_keys=None, indent=None) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_orjson_default, option=option)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=indent) + b"\n", mimetype=self.mimetype
+        )
+
+
+def init_json_provider(app: Flask) -> None:
+    """Install the provider selected by ``JSON_PROVIDER`` on ``app``.
+
+    ``auto`` uses orjson when it is installed; ``orjson`` without orjson
+    installed logs a warning and uses the standard library.
+    """
+    choice = app.config.get("JSON_PROVIDER", AUTO)
+    if choice not in (AUTO, ORJSON, STDLIB):
+        raise ValueError(f"Unknown JSON_PROVIDER: {choice}")
+    if choice == ORJSON and orjson is None:
+        logger.warning("JSON_PROVIDER is orjson but it is not installed, using json")
+    if choice != STDLIB and orjson is not None:
+        app.json = ORJSONProvider(app)
+    else:
+        app.json = StdlibJSONProvider(app)
@@ -0,0 +1,181 @@
+"""Prometheus metrics for the backend.
+
+Requests are labelled with their route template (``/api/words/<int:id>``)
+rather than the raw path, so the number of series stays bounded however
+many ids are requested. Metrics are collected in the default registry and
+served at ``/metrics``.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from flask import Flask, Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+REQUEST_COUNT = Counter(
+    "backend_flask_requests_total",
+    "Total requests processed",
+    ["method", "endpoint", "status"],
+)
+
+REQUEST_LATENCY = Histogram(
+    "backend_flask_request_latency_seconds",
+    "Request latency in seconds",
+    ["method", "endpoint"],
+)
+
+REQUESTS_IN_PROGRESS = Gauge(
+    "backend_flask_requests_in_progress",
+    "Requests currently being handled",
+)
+
+DB_QUERY_LATENCY = Histogram(
+    "backend_flask_db_query_seconds",
+    "Database statement execution time in seconds",
+    ["statement"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+LLM_CALL_LATENCY = Histogram(
+    "backend_flask_llm_call_seconds",
+    "LLM call time in seconds",
+    ["operation"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+
+LLM_CALLS_IN_PROGRESS = Gauge(
+    "backend_flask_llm_calls_in_progress",
+    "LLM calls currently waiting for a reply",
+    ["operation"],
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "backend_flask_db_queries_per_request",
+    "Database statements executed per request (SQL_PROFILING)",
+    ["endpoint"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+DB_TIME_PER_REQUEST = Histogram(
+    "backend_flask_db_seconds_per_request",
+    "Total database time per request in seconds (SQL_PROFILING)",
+    ["endpoint"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+DB_SLOW_QUERIES = Counter(
+    "backend_flask_db_slow_queries_total",
+    "Statements slower than SQL_SLOW_QUERY_MS (SQL_PROFILING)",
+    ["endpoint"],
+)
+
+DB_N_PLUS_ONE = Counter(
+    "backend_flask_db_n_plus_one_total",
+    "Statements repeated within one request, likely N+1 queries (SQL_PROFILING)",
+    ["endpoint"],
+)
+
+API_CACHE_REQUESTS = Counter(
+    "backend_flask_api_cache_requests_total",
+    "Cached API route requests by result (hit, miss, not_modified)",
+    ["endpoint", "result"],
+)
+
+UNMATCHED = "unmatched"
+
+_STATEMENTS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+@contextmanager
+def track_llm_call(operation: str) -> Iterator[None]:
+    """Time an LLM call and count it as in progress while it runs."""
+    with LLM_CALLS_IN_PROGRESS.labels(operation=operation).track_inprogress():
+        with LLM_CALL_LATENCY.labels(operation=operation).time():
+            yield
+
+
+def _statement_type(statement: str) -> str:
+    words = statement.split(None, 1)
+    verb = words[0].upper() if words else ""
+    return verb if verb in _STATEMENTS else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    started = conn.info["query_start"].pop()
+    DB_QUERY_LATENCY.labels(statement=_statement_type(statement)).observe(
+        time.perf_counter() - started
+    )
+
+
+def _handle_error(context) -> None:
+    starts = context.connection.info.get("query_start") if context.connection else None
+    if starts:
+        starts.pop()
+
+
+def _instrument_engines() -> None:
+    """Time statements on every engine; listeners are registered once."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+def record_request(method: str, endpoint: str, status: int, seconds: float) -> None:
+    """Count a finished request and observe its latency."""
+    REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status).inc()
+    REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(seconds)
+
+
+def request_endpoint() -> str:
+    """Route template of the current request, used as the endpoint label."""
+    return request.url_rule.rule if request.url_rule is not None else UNMATCHED
+
+
+def init_metrics(app: Flask) -> None:
+    """Record request, database and LLM metrics and serve them at /metrics.
+
+    Call before other extensions register ``before_request`` hooks, so that
+    requests they reject (such as rate limited ones) are counted too.
+    """
+    _instrument_engines()
+
+    @app.before_request
+    def _start_timer():
+        g.metrics_start = time.perf_counter()
+        g.metrics_in_progress = True
+        REQUESTS_IN_PROGRESS.inc()
+
+    @app.after_request
+    def _record_request(response):
+        started = g.pop("metrics_start", None)
+        if started is not None:
+            record_request(
+                request.method,
+                request_endpoint(),
+                response.status_code,
+                time.perf_counter() - started,
+            )
+        return response
+
+    @app.teardown_request
+    def _end_request(error=None):
+        if g.pop("metrics_in_progress", False):
+            REQUESTS_IN_PROGRESS.dec()
+
+    @app.route("/metrics")
+    def metrics():
+        return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
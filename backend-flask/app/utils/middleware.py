@@ -3,7 +3,7 @@ import logging
 
 from flask import current_app, jsonify, request
 
-from .langchain_guardrails import LangChainRomanianGuardrails
+from .langchain_guardrails import get_guardrails
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +48,7 @@ def apply_guardrails(f):
             formal = data.get("formal", True)
 
             # Apply input guardrails using LangChain
-            guardrails = LangChainRomanianGuardrails()
+            guardrails = get_guardrails()
             try:
                 guardrails.validate_input(text)
             except ValueError as e:
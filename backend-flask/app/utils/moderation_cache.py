@@ -0,0 +1,49 @@
+"""Content-addressed cache for moderation verdicts.
+
+Moderating the same prompt twice gives the same answer, so verdicts are
+cached under a hash of the normalized input text (see
+:class:`app.utils.text_cache.TextCache`).
+"""
+
+import threading
+
+from flask import current_app, has_app_context
+
+from .text_cache import DEFAULT_MAX_SIZE, DEFAULT_TTL, TextCache, normalize_text
+
+__all__ = ["ModerationCache", "get_moderation_cache", "normalize_text"]
+
+_app_lock = threading.Lock()
+
+
+class ModerationCache(TextCache):
+    """Thread-safe LRU + TTL cache of moderation verdicts."""
+
+    table = "moderation_verdicts"
+
+
+def get_moderation_cache() -> ModerationCache:
+    """Get the moderation cache shared by the current app.
+
+    Built on first use from the ``MODERATION_CACHE_*`` settings and stored in
+    ``app.extensions``, with keys namespaced by ``MODERATION_MODEL`` so a
+    model change does not reuse old verdicts. Outside an app context a
+    private cache is returned.
+    """
+    if not has_app_context():
+        return ModerationCache()
+
+    app = current_app._get_current_object()
+    cache = app.extensions.get("moderation_cache")
+    if cache is None:
+        with _app_lock:
+            cache = app.extensions.get("moderation_cache")
+            if cache is None:
+                cache = ModerationCache(
+                    max_size=app.config.get("MODERATION_CACHE_SIZE", DEFAULT_MAX_SIZE),
+                    ttl=app.config.get("MODERATION_CACHE_TTL", DEFAULT_TTL),
+                    db_path=app.config.get("MODERATION_CACHE_DB"),
+                    namespace=app.config.get("MODERATION_MODEL", ""),
+                )
+                app.extensions["moderation_cache"] = cache
+    return cache
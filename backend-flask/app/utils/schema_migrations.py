@@ -0,0 +1,71 @@
+"""Versioned SQL migrations.
+
+Migrations are the ``NNN_name.sql`` files in ``migrations/``, applied in
+order. Each applied version is recorded in ``schema_migrations``, so a
+migration runs once per database, in the same transaction as its record.
+
+A shipped migration is never edited; schema changes go in a new file.
+Databases migrated before versions were recorded have only run
+``001``-``002``, which create what does not exist yet, so they re-run those
+and get everything after them.
+"""
+
+import os
+import sqlite3
+from typing import List
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "migrations")
+
+_CREATE_VERSIONS = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version TEXT PRIMARY KEY,
+    applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def migration_files(directory: str = MIGRATIONS_DIR) -> List[str]:
+    """All migration file names, in the order they are applied."""
+    return sorted(name for name in os.listdir(directory) if name.endswith(".sql"))
+
+
+def applied_versions(conn: sqlite3.Connection) -> List[str]:
+    """Versions already applied to the database, oldest first."""
+    conn.execute(_CREATE_VERSIONS)
+    return [
+        version
+        for (version,) in conn.execute(
+            "SELECT version FROM schema_migrations ORDER BY version"
+        )
+    ]
+
+
+def apply_migrations(
+    conn: sqlite3.Connection, directory: str = MIGRATIONS_DIR
+) -> List[str]:
+    """Apply the migrations the database has not seen yet.
+
+    Returns:
+        list: File names of the migrations applied by this call
+    """
+    done = set(applied_versions(conn))
+    conn.commit()
+
+    applied = []
+    for filename in migration_files(directory):
+        version = filename.split("_", 1)[0]
+        if version in done:
+            continue
+        with open(os.path.join(directory, filename), "r") as sql_file:
+            script = sql_file.read()
+        try:
+            conn.executescript(
+                f"BEGIN;\n{script}\n"
+                f"INSERT INTO schema_migrations (version) VALUES ('{version}');\n"
+                "COMMIT;"
+            )
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        applied.append(filename)
+    return applied
@@ -0,0 +1,146 @@
+"""Request coalescing for identical in-flight LLM calls.
+
+When a class starts an exercise, many identical requests arrive together.
+A :class:`SingleFlight` group lets the first call for a key go upstream
+while identical calls made before it finishes wait for and share its
+result (or its exception), so a burst costs one OpenAI call per distinct
+input.
+"""
+
+import asyncio
+import concurrent.futures
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from flask import current_app, has_app_context
+
+_app_lock = threading.Lock()
+
+
+class _Flight:
+    """An upstream call and the number of callers waiting on it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future):
+        self.future = future
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key.
+
+    :meth:`do` coalesces calls made from threads, :meth:`ado` coroutines on
+    one event loop. The result is copied once when the call finishes and
+    every caller, the one that made the call included, gets its own deep
+    copy of that snapshot, so they may modify it freely.
+
+    Args:
+        name: Label for the group in monitoring output
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.calls = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args) -> Any:
+        """Call ``fn(*args)`` unless a call for ``key`` is already running."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(concurrent.futures.Future())
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return copy.deepcopy(flight.future.result())
+
+        try:
+            result = fn(*args)
+            # Taken before the caller can change the result
+            flight.future.set_result(copy.deepcopy(result))
+        except BaseException as e:
+            if not flight.future.done():
+                flight.future.set_exception(e)
+            raise
+        else:
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    async def ado(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args) -> Any:
+        """Await ``fn(*args)`` unless a call for ``key`` is already running.
+
+        A caller that is cancelled stops waiting without cancelling the
+        shared call, unless it was the last caller waiting on it.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        with self._lock:
+            flight = self._flights.get(loop_key)
+            leader = flight is None
+            if leader:
+                flight = _Flight(loop.create_task(fn(*args)))
+                flight.future.add_done_callback(
+                    lambda _: self._finished(loop_key, flight)
+                )
+                self._flights[loop_key] = flight
+                self.calls += 1
+            else:
+                self.coalesced += 1
+            flight.waiters += 1
+
+        try:
+            result = await asyncio.shield(flight.future)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.future.done():
+                flight.future.cancel()
+        # The task's result is the snapshot: nobody gets it without copying
+        return copy.deepcopy(result)
+
+    def _finished(self, key: Hashable, flight: _Flight) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def stats(self) -> Dict:
+        """Counters for monitoring the group."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "inFlight": len(self._flights),
+            }
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Get the coalescing group ``name`` shared by the current app.
+
+    Outside an app context a private group is returned.
+    """
+    if not has_app_context():
+        return SingleFlight(name)
+
+    app = current_app._get_current_object()
+    groups = app.extensions.setdefault("single_flight", {})
+    group = groups.get(name)
+    if group is None:
+        with _app_lock:
+            group = groups.get(name)
+            if group is None:
+                group = groups[name] = SingleFlight(name)
+    return group
+
+
+def single_flight_stats() -> Dict:
+    """Counters of every coalescing group the current app has used."""
+    groups = current_app.extensions.get("single_flight", {})
+    return {name: group.stats() for name, group in sorted(groups.items())}
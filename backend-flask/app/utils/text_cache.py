@@ -0,0 +1,197 @@
+"""Content-addressed cache for LLM results.
+
+Results are cached under a hash of the normalized input text. The in-memory
+tier is an LRU with a TTL; an optional SQLite file keeps results across
+restarts and between worker processes. Values are stored as JSON, so every
+lookup returns a fresh copy that callers may modify.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different inputs share a cache entry.
+
+    Unicode is composed (so "ș" typed either way matches), case is folded and
+    runs of whitespace are collapsed.
+    """
+    text = unicodedata.normalize("NFC", text)
+    return " ".join(text.casefold().split())
+
+
+class TextCache:
+    """Thread-safe LRU + TTL cache keyed on normalized text.
+
+    Args:
+        max_size: Entries kept in memory before the least recently used
+            one is evicted
+        ttl: Seconds an entry stays valid, in both tiers
+        db_path: Optional SQLite file for the persistent tier
+        namespace: Mixed into the key so a different model or prompt does
+            not reuse old results
+    """
+
+    table = "text_cache"
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        db_path: Optional[str] = None,
+        namespace: str = "",
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.namespace = namespace
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.persistent_hits = 0
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def key(self, text: str, scope: str = "") -> str:
+        """Cache key for ``text``; ``scope`` separates variants of one input."""
+        data = f"{self.namespace}\0{scope}\0{normalize_text(text)}".encode("utf-8")
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, text: str, scope: str = "") -> Optional[Any]:
+        """Return the cached value for ``text``, or None on a miss."""
+        return self.get_by_key(self.key(text, scope))
+
+    def set(self, text: str, value: Any, scope: str = "") -> str:
+        """Cache ``value`` for ``text`` in every tier and return its key."""
+        key = self.key(text, scope)
+        self.set_by_key(key, value)
+        return key
+
+    def get_by_key(self, key: str, count: bool = True) -> Optional[Any]:
+        """Return the value cached under ``key``.
+
+        With ``count=False`` the lookup is left out of the hit/miss counters,
+        for callers that already counted it under another key.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                data, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += count
+                    return json.loads(data)
+                del self._entries[key]
+                self.expirations += 1
+                self._evicted(key)
+
+            row = self._get_persistent(key)
+            if row is not None:
+                # Keep the persisted expiry, converted to the monotonic clock
+                data, expires_at = row
+                self._store(key, data, now + expires_at - time.time())
+                self.hits += count
+                self.persistent_hits += count
+                return json.loads(data)
+
+            self.misses += count
+            return None
+
+    def set_by_key(self, key: str, value: Any) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._store(key, data, time.monotonic() + self.ttl)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?)",
+                    (key, data, time.time() + self.ttl),
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"{self.table} write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute(f"DELETE FROM {self.table}")
+                self._db.commit()
+            self.hits = self.misses = self.evictions = 0
+            self.expirations = self.persistent_hits = 0
+
+    def stats(self) -> Dict:
+        """Counters for monitoring the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxSize": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": round(self.hits / lookups, 4) if lookups else 0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "persistentHits": self.persistent_hits,
+                "persistent": self._db is not None,
+            }
+
+    def _evicted(self, key: str) -> None:
+        """Called with the lock held when ``key`` leaves the memory tier."""
+
+    def _store(self, key: str, data: str, expires_at: float) -> None:
+        # Caller holds the lock; ``expires_at`` is on the monotonic clock
+        self._entries[key] = (data, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self.evictions += 1
+            self._evicted(evicted)
+
+    def _get_persistent(self, key: str) -> Optional[Tuple[str, float]]:
+        # Caller holds the lock; returns the value and its wall clock expiry
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            data, expires_at = row
+            if expires_at <= time.time():
+                self._db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._db.commit()
+                self.expirations += 1
+                return None
+            return data, expires_at
+        except sqlite3.Error as e:
+            # The persistent tier is best effort
+            logger.warning(f"{self.table} lookup failed: {e}")
+            return None
@@ -0,0 +1,5 @@
+-- migrations/003_words_learned.sql
+
+-- Whether the learner has marked the word as learned; counted by the
+-- dashboard summary in 004
+ALTER TABLE words ADD COLUMN learned BOOLEAN DEFAULT 0;
@@ -0,0 +1,143 @@
+-- migrations/004_dashboard_stats.sql
+
+-- Single-row summary read by the dashboard, maintained by the triggers below
+CREATE TABLE IF NOT EXISTS dashboard_stats (
+    id INTEGER PRIMARY KEY,
+    total_words INTEGER NOT NULL DEFAULT 0,
+    learned_words INTEGER NOT NULL DEFAULT 0,
+    total_groups INTEGER NOT NULL DEFAULT 0,
+    total_sessions INTEGER NOT NULL DEFAULT 0,
+    completed_sessions INTEGER NOT NULL DEFAULT 0,
+    total_reviews INTEGER NOT NULL DEFAULT 0,
+    correct_reviews INTEGER NOT NULL DEFAULT 0,
+    last_session_id INTEGER,
+    last_session_date TEXT,
+    current_streak INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_word_insert
+AFTER INSERT ON words
+BEGIN
+    UPDATE dashboard_stats SET
+        total_words = total_words + 1,
+        learned_words = learned_words + COALESCE(NEW.learned, 0)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_word_delete
+AFTER DELETE ON words
+BEGIN
+    UPDATE dashboard_stats SET
+        total_words = total_words - 1,
+        learned_words = learned_words - COALESCE(OLD.learned, 0)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_word_learned
+AFTER UPDATE OF learned ON words
+BEGIN
+    UPDATE dashboard_stats SET
+        learned_words = learned_words + COALESCE(NEW.learned, 0) - COALESCE(OLD.learned, 0)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_group_insert
+AFTER INSERT ON groups
+BEGIN
+    UPDATE dashboard_stats SET
+        total_groups = total_groups + 1
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_group_delete
+AFTER DELETE ON groups
+BEGIN
+    UPDATE dashboard_stats SET
+        total_groups = total_groups - 1
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_session_insert
+AFTER INSERT ON study_sessions
+BEGIN
+    UPDATE dashboard_stats SET
+        total_sessions = total_sessions + 1,
+        completed_sessions = completed_sessions + (NEW.end_time IS NOT NULL),
+        current_streak = CASE
+            WHEN last_session_date IS NULL THEN 1
+            WHEN date(NEW.start_time) <= last_session_date THEN current_streak
+            WHEN date(NEW.start_time) = date(last_session_date, '+1 day') THEN current_streak + 1
+            ELSE 1
+        END,
+        last_session_id = CASE
+            WHEN last_session_date IS NULL OR date(NEW.start_time) >= last_session_date THEN NEW.id
+            ELSE last_session_id
+        END,
+        last_session_date = CASE
+            WHEN last_session_date IS NULL OR date(NEW.start_time) > last_session_date THEN date(NEW.start_time)
+            ELSE last_session_date
+        END
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_session_end
+AFTER UPDATE OF end_time ON study_sessions
+BEGIN
+    UPDATE dashboard_stats SET
+        completed_sessions = completed_sessions + (NEW.end_time IS NOT NULL) - (OLD.end_time IS NOT NULL)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_session_delete
+AFTER DELETE ON study_sessions
+BEGIN
+    UPDATE dashboard_stats SET
+        total_sessions = total_sessions - 1,
+        completed_sessions = completed_sessions - (OLD.end_time IS NOT NULL),
+        last_session_id = CASE
+            WHEN last_session_id = OLD.id THEN (SELECT id FROM study_sessions ORDER BY start_time DESC, id DESC LIMIT 1)
+            ELSE last_session_id
+        END
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_review_insert
+AFTER INSERT ON word_review_items
+BEGIN
+    UPDATE dashboard_stats SET
+        total_reviews = total_reviews + 1,
+        correct_reviews = correct_reviews + COALESCE(NEW.correct, 0)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS dashboard_stats_review_delete
+AFTER DELETE ON word_review_items
+BEGIN
+    UPDATE dashboard_stats SET
+        total_reviews = total_reviews - 1,
+        correct_reviews = correct_reviews - COALESCE(OLD.correct, 0)
+    WHERE id = 1;
+END;
+
+-- Seed the summary row from existing data
+INSERT OR IGNORE INTO dashboard_stats (
+    id, total_words, learned_words, total_groups, total_sessions,
+    completed_sessions, total_reviews, correct_reviews,
+    last_session_id, last_session_date, current_streak
+)
+SELECT
+    1,
+    (SELECT COUNT(*) FROM words),
+    (SELECT COUNT(*) FROM words WHERE learned),
+    (SELECT COUNT(*) FROM groups),
+    (SELECT COUNT(*) FROM study_sessions),
+    (SELECT COUNT(*) FROM study_sessions WHERE end_time IS NOT NULL),
+    (SELECT COUNT(*) FROM word_review_items),
+    (SELECT COUNT(*) FROM word_review_items WHERE correct),
+    last.id,
+    date(last.start_time),
+    CASE WHEN last.id IS NULL THEN 0 ELSE 1 END
+FROM (SELECT 1) LEFT JOIN (
+    SELECT id, start_time FROM study_sessions
+    ORDER BY start_time DESC, id DESC LIMIT 1
+) AS last;
@@ -0,0 +1,38 @@
+-- migrations/005_words_groups_and_indexes.sql
+
+-- Rebuild words_groups the way the ORM maps it: one row per word and group,
+-- keyed by both ids. The primary key doubles as the word -> groups lookup;
+-- duplicate links are dropped.
+CREATE TABLE words_groups_new (
+    word_id INTEGER NOT NULL,
+    group_id INTEGER NOT NULL,
+    PRIMARY KEY (word_id, group_id),
+    FOREIGN KEY(word_id) REFERENCES words(id),
+    FOREIGN KEY(group_id) REFERENCES groups(id)
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO words_groups_new (word_id, group_id)
+SELECT word_id, group_id FROM words_groups;
+
+DROP TABLE words_groups;
+ALTER TABLE words_groups_new RENAME TO words_groups;
+
+-- group -> words: group word counts, Group.words and imports
+CREATE INDEX IF NOT EXISTS ix_words_groups_group_id_word_id
+    ON words_groups (group_id, word_id);
+
+-- Imports match words on their Romanian text and groups on their name
+CREATE INDEX IF NOT EXISTS ix_words_romanian ON words (romanian);
+CREATE INDEX IF NOT EXISTS ix_words_english ON words (english);
+CREATE INDEX IF NOT EXISTS ix_groups_name ON groups (name);
+
+-- A word's review history, newest first
+CREATE INDEX IF NOT EXISTS ix_word_review_items_word_id_created_at
+    ON word_review_items (word_id, created_at);
+
+-- A group's sessions by date, and the latest session overall (dashboard
+-- triggers and streak rebuild)
+CREATE INDEX IF NOT EXISTS ix_study_sessions_group_id_start_time
+    ON study_sessions (group_id, start_time);
+CREATE INDEX IF NOT EXISTS ix_study_sessions_start_time
+    ON study_sessions (start_time);
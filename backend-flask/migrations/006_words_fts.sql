@@ -0,0 +1,55 @@
+-- migrations/006_words_fts.sql
+
+-- Full-text index over words for /api/words/search. External content table:
+-- the text lives in words, the triggers below keep the index in sync.
+-- remove_diacritics 2 folds Romanian diacritics ("tara" matches "țară");
+-- prefixes of up to 6 characters are indexed for typeahead queries.
+-- parts used to be stored with non-ASCII characters escaped ("p\u0103dure"),
+-- which the tokenizer cannot match; store them as plain UTF-8 text
+UPDATE words
+SET parts = (SELECT json_group_array(value) FROM json_each(words.parts))
+WHERE json_valid(parts)
+    AND json_type(parts) = 'array'
+    AND instr(parts, '\u') > 0
+    AND NOT EXISTS (
+        SELECT 1 FROM json_each(words.parts) WHERE type IN ('array', 'object')
+    );
+
+CREATE VIRTUAL TABLE IF NOT EXISTS words_fts USING fts5(
+    romanian,
+    english,
+    parts,
+    content='words',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='1 2 3 4 5 6'
+);
+
+-- bm25 column weights: romanian, english, parts
+INSERT INTO words_fts(words_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0, 1.0)');
+
+CREATE TRIGGER IF NOT EXISTS words_fts_insert
+AFTER INSERT ON words
+BEGIN
+    INSERT INTO words_fts(rowid, romanian, english, parts)
+    VALUES (NEW.id, NEW.romanian, NEW.english, NEW.parts);
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_fts_delete
+AFTER DELETE ON words
+BEGIN
+    INSERT INTO words_fts(words_fts, rowid, romanian, english, parts)
+    VALUES ('delete', OLD.id, OLD.romanian, OLD.english, OLD.parts);
+END;
+
+CREATE TRIGGER IF NOT EXISTS words_fts_update
+AFTER UPDATE OF romanian, english, parts ON words
+BEGIN
+    INSERT INTO words_fts(words_fts, rowid, romanian, english, parts)
+    VALUES ('delete', OLD.id, OLD.romanian, OLD.english, OLD.parts);
+    INSERT INTO words_fts(rowid, romanian, english, parts)
+    VALUES (NEW.id, NEW.romanian, NEW.english, NEW.parts);
+END;
+
+-- Index the words that already exist
+INSERT INTO words_fts(words_fts) VALUES ('rebuild');
@@ -0,0 +1,106 @@
+-- migrations/007_table_versions.sql
+
+-- One counter per table read by the cached API routes (/api/words,
+-- /api/groups, /api/dashboard). The triggers below bump a table's counter
+-- on every write; responses are tagged with the counters they depend on.
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO table_versions (table_name, version) VALUES
+    ('words', 0),
+    ('groups', 0),
+    ('words_groups', 0),
+    ('study_sessions', 0),
+    ('dashboard_stats', 0);
+
+CREATE TRIGGER IF NOT EXISTS table_versions_words_insert
+AFTER INSERT ON words
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'words';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_words_update
+AFTER UPDATE ON words
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'words';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_words_delete
+AFTER DELETE ON words
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'words';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_groups_insert
+AFTER INSERT ON groups
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_groups_update
+AFTER UPDATE ON groups
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_groups_delete
+AFTER DELETE ON groups
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_words_groups_insert
+AFTER INSERT ON words_groups
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'words_groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_words_groups_update
+AFTER UPDATE ON words_groups
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'words_groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_words_groups_delete
+AFTER DELETE ON words_groups
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'words_groups';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_study_sessions_insert
+AFTER INSERT ON study_sessions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'study_sessions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_study_sessions_update
+AFTER UPDATE ON study_sessions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'study_sessions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_study_sessions_delete
+AFTER DELETE ON study_sessions
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'study_sessions';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_dashboard_stats_insert
+AFTER INSERT ON dashboard_stats
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'dashboard_stats';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_dashboard_stats_update
+AFTER UPDATE ON dashboard_stats
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'dashboard_stats';
+END;
+
+CREATE TRIGGER IF NOT EXISTS table_versions_dashboard_stats_delete
+AFTER DELETE ON dashboard_stats
+BEGIN
+    UPDATE table_versions SET version = version + 1 WHERE table_name = 'dashboard_stats';
+END;
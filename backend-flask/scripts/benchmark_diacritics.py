@@ -0,0 +1,49 @@
+"""Benchmark diacritic restoration against dictionary size.
+
+Compares the previous approach, one ``re.sub`` per dictionary entry, with
+the single-pass ``DiacriticCorrector`` on a typical AI response.
+
+Usage:
+    poetry run python scripts/benchmark_diacritics.py
+"""
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.utils.diacritics import DiacriticCorrector, fold  # noqa: E402
+
+TEXT = (
+    "Bucuresti este capitala Romaniei. In tara noastra, limba romana are "
+    "multe cuvinte frumoase, iar la Timisoara si Iasi se vorbeste frumos. "
+) * 20
+
+
+def per_entry(words, text):
+    for word, correct in words.items():
+        text = re.sub(r"\b" + word + r"\b", correct, text, flags=re.IGNORECASE)
+    return text
+
+
+def synthetic_words(size):
+    forms = ["ț" + "".join(chr(97 + int(d)) for d in str(i)) for i in range(size)]
+    return {fold(form): form for form in forms}
+
+
+def main() -> None:
+    print(f"Diacritic restoration on {len(TEXT)} characters")
+    print(f"{'entries':>8} {'per-entry re.sub':>18} {'single pass':>14}")
+    for size in (10, 1000, 20000):
+        words = synthetic_words(size)
+        corrector = DiacriticCorrector(words)
+        runs = 3 if size > 1000 else 20
+        before = timeit.timeit(lambda: per_entry(words, TEXT), number=runs) / runs
+        after = timeit.timeit(lambda: corrector.correct(TEXT), number=runs) / runs
+        print(f"{size:>8} {before * 1e3:>15.2f} ms {after * 1e3:>11.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark per-request guardrails setup.
+
+Compares building ``LangChainRomanianGuardrails`` for every request, as the
+generate route used to, with fetching the app-scoped instance from
+``get_guardrails``. No requests are sent to OpenAI.
+
+Usage:
+    poetry run python scripts/benchmark_guardrails.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import create_app  # noqa: E402
+from app.utils.langchain_guardrails import (  # noqa: E402
+    LangChainRomanianGuardrails,
+    get_guardrails,
+)
+
+
+def main(iterations: int = 200) -> None:
+    app = create_app("testing")
+    app.config["OPENAI_API_KEY"] = "sk-benchmark"
+
+    with app.test_request_context():
+        get_guardrails()  # the first request pays for building it once
+
+        per_request = timeit.timeit(LangChainRomanianGuardrails, number=iterations)
+        shared = timeit.timeit(get_guardrails, number=iterations)
+
+    before = per_request / iterations * 1e6
+    after = shared / iterations * 1e6
+    print(f"Guardrails setup per request ({iterations} requests)")
+    print(f"  new instance per request: {before:10.1f} us")
+    print(f"  app-scoped instance:      {after:10.1f} us")
+    print(f"  speedup:                  {before / after:10.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
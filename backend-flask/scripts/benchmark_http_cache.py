@@ -0,0 +1,83 @@
+"""Benchmark the cached read routes.
+
+Builds a database from the migrations with a vocabulary of generated words,
+then times each cached route three ways: a full response (payload cache
+disabled), a response from the payload cache, and a conditional request
+answered with 304, as a polling frontend sends them.
+
+Usage:
+    poetry run python scripts/benchmark_http_cache.py [words] [repeats]
+"""
+
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import create_app  # noqa: E402
+from app.config import ProductionConfig  # noqa: E402
+from app.services.vocabulary_import import import_vocabulary  # noqa: E402
+from app.utils.schema_migrations import apply_migrations  # noqa: E402
+
+ROUTES = ["/api/words?limit=500", "/api/groups", "/api/dashboard"]
+
+
+def _app(path: str):
+    with patch.object(ProductionConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{path}"):
+        # The production rate limit would stop the benchmark after 50 requests
+        with patch.object(ProductionConfig, "RATELIMIT_ENABLED", False, create=True):
+            return create_app("production")
+
+
+def _time(client, url: str, repeats: int, headers=None) -> float:
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        client.get(url, headers=headers)
+        latencies.append(time.perf_counter() - started)
+    return statistics.median(latencies) * 1000
+
+
+def main(words: int = 10_000, repeats: int = 200) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    conn = sqlite3.connect(path)
+    apply_migrations(conn)
+    conn.close()
+
+    app = _app(path)
+    with app.app_context():
+        import_vocabulary(
+            [
+                {
+                    "group": f"Grupa {g}",
+                    "words": [f"cuvânt {i}" for i in range(g, words, 50)],
+                }
+                for g in range(50)
+            ]
+        )
+    client = app.test_client()
+
+    print(f"{words} words, median of {repeats} requests")
+    for url in ROUTES:
+        app.config["API_CACHE_SIZE"] = 0
+        full = _time(client, url, repeats)
+        app.config["API_CACHE_SIZE"] = 256
+        etag = client.get(url).headers["ETag"]
+        cached = _time(client, url, repeats)
+        not_modified = _time(client, url, repeats, {"If-None-Match": etag})
+        print(
+            f"  {url:22} full {full:7.2f} ms  cached {cached:6.2f} ms  "
+            f"304 {not_modified:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
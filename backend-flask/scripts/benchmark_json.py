@@ -0,0 +1,147 @@
+"""Benchmark JSON serialization of 10k-row payloads.
+
+Times building a ``jsonify`` response for every word and every group, query
+included, the way the routes used to (``to_dict`` per ORM object, or
+``serialize_row`` per projected row, through the standard library encoder)
+and the way they do now (rows encoded by SQLite with ``json_object`` and
+embedded by the orjson provider).
+
+Usage:
+    poetry run python scripts/benchmark_json.py [rows] [repeats]
+"""
+
+import gc
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from flask import jsonify  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.config import ProductionConfig  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.models import Group, Word  # noqa: E402
+from app.utils.json_provider import json_array  # noqa: E402
+from app.utils.schema_migrations import apply_migrations  # noqa: E402
+
+GROUPS_PER_WORD = 2
+
+
+def _app(path: str, provider: str):
+    with patch.object(ProductionConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{path}"):
+        with patch.object(ProductionConfig, "JSON_PROVIDER", provider):
+            return create_app("production")
+
+
+def _seed(path: str, rows: int) -> None:
+    conn = sqlite3.connect(path)
+    apply_migrations(conn)
+    with conn:
+        conn.executemany(
+            "INSERT INTO groups (name, description, word_count) VALUES (?, ?, ?)",
+            ((f"Grupa {i}", f"Cuvinte românești {i}", 10) for i in range(rows)),
+        )
+        conn.executemany(
+            "INSERT INTO words (romanian, english, pronunciation, part_of_speech, "
+            "parts, learned, created_at, updated_at) "
+            "VALUES (?, ?, ?, 'noun', ?, ?, ?, ?)",
+            (
+                (
+                    f"cuvânt {i}",
+                    f"word {i}",
+                    f"cu-vânt {i}",
+                    '["substantiv", "natură"]',
+                    i % 2,
+                    "2025-03-01 09:30:15.123456",
+                    "2025-03-02 10:00:00.000000",
+                )
+                for i in range(rows)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO words_groups (word_id, group_id) VALUES (?, ?)",
+            (
+                (word, (word + offset) % rows + 1)
+                for word in range(1, rows + 1)
+                for offset in range(GROUPS_PER_WORD)
+            ),
+        )
+    conn.close()
+
+
+def _words_to_dict():
+    return jsonify({"success": True, "data": [w.to_dict() for w in Word.query]})
+
+
+def _words_serialize_row():
+    columns = Word.api_columns()
+    fields = list(columns) + ["groupIds"]
+    rows = db.session.query(*[c.label(f) for f, c in columns.items()]).all()
+    group_ids = Word.group_ids_for([row.id for row in rows])
+    data = [Word.serialize_row(row, fields, group_ids) for row in rows]
+    return jsonify({"success": True, "data": data})
+
+
+def _words_json_object():
+    fields = list(Word.json_columns())
+    rows = db.session.scalars(select(Word.json_object(fields)).order_by(Word.id))
+    return jsonify({"success": True, "data": json_array(rows)})
+
+
+def _groups_to_dict():
+    return jsonify({"success": True, "data": [g.to_dict() for g in Group.query]})
+
+
+def _groups_json_object():
+    rows = db.session.scalars(select(Group.json_object()).order_by(Group.id))
+    return jsonify({"success": True, "data": json_array(rows)})
+
+
+# (label, JSON provider, function building the response)
+CASES = [
+    ("words  to_dict + jsonify", "stdlib", _words_to_dict),
+    ("words  to_dict + jsonify", "orjson", _words_to_dict),
+    ("words  serialize_row + jsonify", "stdlib", _words_serialize_row),
+    ("words  serialize_row + jsonify", "orjson", _words_serialize_row),
+    ("words  json_object", "stdlib", _words_json_object),
+    ("words  json_object", "orjson", _words_json_object),
+    ("groups to_dict + jsonify", "stdlib", _groups_to_dict),
+    ("groups to_dict + jsonify", "orjson", _groups_to_dict),
+    ("groups json_object", "orjson", _groups_json_object),
+]
+
+
+def main(rows: int = 10_000, repeats: int = 10) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    _seed(path, rows)
+    apps = {provider: _app(path, provider) for provider in ("stdlib", "orjson")}
+
+    print(f"{rows} rows, median of {repeats} responses (query included)")
+    for label, provider, build in CASES:
+        with apps[provider].test_request_context():
+            size = len(build().get_data())
+            latencies = []
+            for _ in range(repeats):
+                gc.collect()
+                started = time.perf_counter()
+                build().get_data()
+                latencies.append(time.perf_counter() - started)
+                db.session.remove()
+        print(
+            f"  {label:32} {provider:7} {statistics.median(latencies) * 1000:8.2f} ms"
+            f"  {size / 1024:7.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
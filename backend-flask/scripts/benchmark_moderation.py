@@ -0,0 +1,80 @@
+"""Benchmark batch moderation against one LLM call per text.
+
+The LLM is replaced by a stub that sleeps for a fixed latency per call, so
+the numbers show how many round trips each approach pays for. No requests
+are sent to OpenAI.
+
+Usage:
+    poetry run python scripts/benchmark_moderation.py [texts] [latency_ms]
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from langchain_core.output_parsers import StrOutputParser  # noqa: E402
+from langchain_core.runnables import RunnableLambda  # noqa: E402
+
+from app.utils.langchain_guardrails import LangChainRomanianGuardrails  # noqa: E402
+from app.utils.moderation_cache import ModerationCache  # noqa: E402
+
+_ITEM = re.compile(r"^\s*(\d+)\. ", re.MULTILINE)
+
+
+def _fake_llm(latency: float):
+    def reply(prompt) -> str:
+        time.sleep(latency)
+        count = len(_ITEM.findall(prompt.to_string()))
+        if not count:
+            return "SAFE"
+        return json.dumps(
+            [{"id": number, "verdict": "SAFE"} for number in range(1, count + 1)]
+        )
+
+    return RunnableLambda(reply)
+
+
+def _guardrails(latency: float) -> LangChainRomanianGuardrails:
+    guardrails = LangChainRomanianGuardrails(
+        api_key="sk-benchmark", moderation_cache=ModerationCache()
+    )
+    llm = _fake_llm(latency)
+    guardrails.moderation_chain = (
+        guardrails.moderation_chain.first | llm | StrOutputParser()
+    )
+    guardrails.batch_moderation_chain = (
+        guardrails.batch_moderation_chain.first | llm | StrOutputParser()
+    )
+    return guardrails
+
+
+def main(count: int = 200, latency_ms: float = 50) -> None:
+    latency = latency_ms / 1000
+    texts = [f"Propoziția numărul {i} despre fructe și legume." for i in range(count)]
+
+    guardrails = _guardrails(latency)
+    start = time.perf_counter()
+    for text in texts:
+        guardrails.moderation_chain.invoke({"text": text})
+    sequential = time.perf_counter() - start
+
+    guardrails = _guardrails(latency)
+    start = time.perf_counter()
+    guardrails.moderate_batch(texts)
+    batched = time.perf_counter() - start
+
+    print(f"Moderating {count} texts at {latency_ms:g} ms per LLM call")
+    print(f"  one call per text: {count / sequential:10.1f} texts/s")
+    print(f"  moderate_batch:    {count / batched:10.1f} texts/s")
+    print(f"  speedup:           {sequential / batched:10.1f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    )
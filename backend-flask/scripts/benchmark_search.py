@@ -0,0 +1,100 @@
+"""Benchmark /api/words/search on a large vocabulary.
+
+Builds a database from the migrations with generated Romanian-looking words
+(one million by default), then times the search endpoint for typeahead
+prefixes of growing length and for whole words, typed without diacritics.
+
+Usage:
+    poetry run python scripts/benchmark_search.py [words] [repeats]
+"""
+
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import create_app  # noqa: E402
+from app.config import ProductionConfig  # noqa: E402
+from app.utils.schema_migrations import apply_migrations  # noqa: E402
+
+SYLLABLES = [
+    "ma", "mă", "ra", "ră", "ța", "ta", "te", "șc", "șo", "lă", "ca", "câ",
+    "ne", "pa", "ri", "ro", "ti", "în", "fl", "or", "br", "du", "ge", "zi",
+]  # fmt: skip
+ENGLISH = ["house", "apple", "country", "school", "river", "stone", "bread"]
+PARTS = ["noun", "verb", "adjective", "fruit", "place", "food"]
+
+# (label, query): typeahead without diacritics, then full words
+QUERIES = [
+    ("1 letter", "m"),
+    ("2 letters", "ma"),
+    ("3 letters", "mar"),
+    ("4 letters", "mara"),
+    ("word", "tara"),
+    ("english", "river"),
+    ("two words", "scoala fl"),
+]
+
+
+def _word(rng: random.Random, i: int) -> tuple:
+    romanian = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+    english = f"{rng.choice(ENGLISH)} {i}"
+    parts = json.dumps(rng.sample(PARTS, 2))
+    return (romanian, english, "noun", parts)
+
+
+def _build(path: str, words: int) -> None:
+    conn = sqlite3.connect(path)
+    apply_migrations(conn)
+    rng = random.Random(0)
+    with conn:
+        conn.executemany(
+            "INSERT INTO words (romanian, english, part_of_speech, parts) "
+            "VALUES (?, ?, ?, ?)",
+            (_word(rng, i) for i in range(words)),
+        )
+    conn.execute("INSERT INTO words_fts(words_fts) VALUES ('optimize')")
+    conn.commit()
+    conn.close()
+
+
+def main(words: int = 1_000_000, repeats: int = 200) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    started = time.perf_counter()
+    _build(path, words)
+    print(f"{words} words indexed in {time.perf_counter() - started:.1f}s")
+
+    with patch.object(ProductionConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{path}"):
+        # The production rate limit would stop the benchmark after 50 requests
+        with patch.object(ProductionConfig, "RATELIMIT_ENABLED", False, create=True):
+            app = create_app("production")
+    client = app.test_client()
+
+    for label, query in QUERIES:
+        url = f"/api/words/search?q={query}&limit=10"
+        client.get(url)  # warm the page cache
+        latencies = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            response = client.get(url)
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+        print(
+            f"  {label:10} {query!r:12} {len(response.json['data']):3} results  "
+            f"p50 {statistics.median(latencies) * 1000:7.2f} ms  "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,135 @@
+"""Benchmark dashboard reads while an import is writing.
+
+Builds a database from the migrations, then runs reader processes
+(dashboard stats and a page of words, as the dashboard and words pages load
+them) against a writer process importing batches of new words. It runs once with
+SQLite's defaults (rollback journal) and once with ``SQLITE_PRAGMAS``, and
+reports read throughput and latency.
+
+Usage:
+    poetry run python scripts/benchmark_sqlite.py [seconds] [readers]
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import create_app  # noqa: E402
+from app.config import Config, ProductionConfig  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.models import Word  # noqa: E402
+from app.services.dashboard_stats import get_dashboard_stats  # noqa: E402
+from app.services.vocabulary_import import import_vocabulary  # noqa: E402
+from app.utils.schema_migrations import apply_migrations  # noqa: E402
+
+SEED_WORDS = 50_000
+BATCH_WORDS = 50_000
+
+
+def _batch(start: int) -> list:
+    words = [
+        {"romanian": f"cuvânt {i}", "english": f"word {i}", "parts": ["benchmark"]}
+        for i in range(start, start + BATCH_WORDS)
+    ]
+    return [{"group": f"Lot {start // BATCH_WORDS % 10}", "words": words}]
+
+
+def _app(path: str, pragmas: dict):
+    with patch.object(ProductionConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{path}"):
+        with patch.object(ProductionConfig, "SQLITE_PRAGMAS", pragmas):
+            return create_app("production")
+
+
+def _read(path: str, pragmas: dict, deadline: float, results) -> None:
+    app = _app(path, pragmas)
+    latencies, errors = [], 0
+    while time.time() < deadline:
+        started = time.perf_counter()
+        try:
+            with app.app_context():
+                get_dashboard_stats()
+                db.session.query(Word.id, Word.romanian).order_by(Word.id).limit(
+                    50
+                ).all()
+                db.session.remove()
+        except Exception:
+            errors += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+    results.put((latencies, errors))
+
+
+def _write(path: str, pragmas: dict, deadline: float, results) -> None:
+    app = _app(path, pragmas)
+    start = SEED_WORDS
+    while time.time() < deadline:
+        with app.app_context():
+            import_vocabulary(_batch(start))
+            db.session.remove()
+        start += BATCH_WORDS
+    results.put(start - SEED_WORDS)
+
+
+def _run(pragmas: dict, seconds: float, readers: int) -> dict:
+    path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    conn = sqlite3.connect(path)
+    apply_migrations(conn)
+    conn.close()
+
+    with _app(path, pragmas).app_context():
+        for start in range(0, SEED_WORDS, BATCH_WORDS):
+            import_vocabulary(_batch(start))
+        db.engine.dispose()
+
+    # One process per reader and for the writer, like separate app workers
+    reads, writes = multiprocessing.Queue(), multiprocessing.Queue()
+    deadline = time.time() + seconds
+    processes = [
+        multiprocessing.Process(target=_read, args=(path, pragmas, deadline, reads))
+        for _ in range(readers)
+    ]
+    processes.append(
+        multiprocessing.Process(target=_write, args=(path, pragmas, deadline, writes))
+    )
+    for process in processes:
+        process.start()
+    results = [reads.get() for _ in range(readers)]
+    words = writes.get()
+    for process in processes:
+        process.join()
+
+    latencies = sorted(latency for result, _ in results for latency in result)
+    return {
+        "reads": len(latencies) / seconds,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1000,
+        "max": latencies[-1] * 1000,
+        "errors": sum(errors for _, errors in results),
+        "words": words / seconds,
+    }
+
+
+def main(seconds: float = 5, readers: int = 4) -> None:
+    print(f"{readers} readers and 1 writer for {seconds:g}s")
+    for name, pragmas in (("defaults", {}), ("SQLITE_PRAGMAS", Config.SQLITE_PRAGMAS)):
+        result = _run(pragmas, seconds, readers)
+        print(
+            f"  {name:15} {result['reads']:8.0f} reads/s  "
+            f"p50 {result['p50']:7.2f} ms  p99 {result['p99']:7.2f} ms  "
+            f"max {result['max']:8.2f} ms  {result['errors']} errors  "
+            f"{result['words']:8.0f} words imported/s"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 5,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+    )
@@ -4,6 +4,8 @@ import sqlite3
 
 from invoke import task
 
+from app.utils.schema_migrations import apply_migrations
+
 DB_FILE = "words.db"
 MIGRATIONS_DIR = "migrations"
 SEEDS_DIR = "seeds"
@@ -23,20 +25,20 @@ def init_db(ctx):
 
 @task
 def migrate(ctx):
-    """Run migration SQL files in order."""
+    """Apply the migration SQL files the database has not seen yet."""
     conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    for filename in sorted(os.listdir(MIGRATIONS_DIR)):
-        if filename.endswith(".sql"):
-            file_path = os.path.join(MIGRATIONS_DIR, filename)
-            with open(file_path, "r") as sql_file:
-                sql_script = sql_file.read()
-                cursor.executescript(sql_script)
-                print(f"Ran migration: {filename}")
-    conn.commit()
+    for filename in apply_migrations(conn, MIGRATIONS_DIR):
+        print(f"Ran migration: {filename}")
     conn.close()
 
 
+def _to_sql_value(val):
+    """Convert any list/dict values to JSON strings."""
+    if isinstance(val, (list, dict)):
+        return json.dumps(val, ensure_ascii=False)
+    return val
+
+
 @task
 def seed(ctx):
     """Seed the database with initial data."""
@@ -58,22 +60,15 @@ def seed(ctx):
                 placeholders = ",".join(["?" for _ in columns])
                 columns_str = ",".join(columns)
 
-                # Insert data
-                for item in data:
-                    # Convert any list/dict values to JSON strings
-                    values = []
-                    for col in columns:
-                        val = item[col]
-                        if isinstance(val, (list, dict)):
-                            val = json.dumps(val)
-                        values.append(val)
-
-                    query = (
-                        f"INSERT INTO {table_name} "
-                        f"({columns_str}) "
-                        f"VALUES ({placeholders})"
-                    )
-                    cursor.execute(query, values)
+                rows = [[_to_sql_value(item[col]) for col in columns] for item in data]
+
+                # Insert data in a single batched statement
+                query = (
+                    f"INSERT INTO {table_name} "
+                    f"({columns_str}) "
+                    f"VALUES ({placeholders})"
+                )
+                cursor.executemany(query, rows)
 
                 print(f"Seeded {table_name} table")
 
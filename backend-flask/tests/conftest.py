@@ -1,7 +1,7 @@
 """Test fixtures for the Flask application."""
 
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from flask import Flask
@@ -18,6 +18,12 @@ mock_openai_client.chat.completions.create.return_value = MagicMock(
     choices=[MagicMock(message=MagicMock(content="Mocked response"))]
 )
 
+# And for the AsyncOpenAI client used for generation
+mock_async_openai_client = MagicMock()
+mock_async_openai_client.chat.completions.create = AsyncMock(
+    return_value=mock_openai_client.chat.completions.create.return_value
+)
+
 
 @pytest.fixture(autouse=True)
 def patch_openai() -> Generator[None, None, None]:
@@ -27,7 +33,11 @@ def patch_openai() -> Generator[None, None, None]:
             "app.services.openai_service.get_openai_client",
             return_value=mock_openai_client,
         ):
-            yield
+            with patch(
+                "app.services.openai_service.get_async_openai_client",
+                return_value=mock_async_openai_client,
+            ):
+                yield
 
 
 @pytest.fixture(autouse=True)
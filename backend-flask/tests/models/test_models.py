@@ -1,3 +1,10 @@
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.extensions import db
 from app.models import Group, Word
 
 
@@ -31,3 +38,45 @@ def test_group_to_dict():
     assert data["name"] == "Fruits"
     assert data["description"] == "Romanian fruit vocabulary"
     assert data["wordCount"] == 10
+
+
+@pytest.mark.parametrize(
+    "learned,created_at",
+    [
+        (True, datetime(2025, 3, 1, 9, 30, 15, 123456)),
+        (False, datetime(2025, 3, 1, 9, 30, 15)),  # isoformat() drops zero µs
+        (None, None),
+    ],
+)
+def test_word_json_object_matches_to_dict(app, learned, created_at):
+    with app.app_context():
+        group = Group.query.one()
+        word = Word(
+            romanian="pădure",
+            english="forest",
+            part_of_speech="noun",
+            parts=["natură", "loc"],
+            learned=learned,
+            created_at=created_at,
+            groups=[group],
+        )
+        db.session.add(word)
+        db.session.commit()
+
+        fields = list(Word.json_columns())
+        encoded = db.session.scalar(
+            select(Word.json_object(fields)).where(Word.id == word.id)
+        )
+
+        assert json.loads(encoded) == word.to_dict()
+        assert list(json.loads(encoded)) == fields
+
+
+def test_group_json_object_matches_to_dict(app):
+    with app.app_context():
+        group = Group.query.one()
+        encoded = db.session.scalar(
+            select(Group.json_object()).where(Group.id == group.id)
+        )
+
+        assert json.loads(encoded) == group.to_dict()
@@ -0,0 +1,214 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.asgi import GenerateApp
+
+GUARDRAILS = "app.utils.langchain_guardrails.LangChainRomanianGuardrails"
+BODY = {"text": "Cum conjug verbul a merge?", "prompt": "Teach me verbs"}
+BODY_INFORMAL = {**BODY, "formal": False}
+
+
+async def _call(asgi_app, body, disconnect=None, headers=()):
+    """Send one HTTP request through the ASGI app."""
+    messages = [
+        {"type": "http.request", "body": json.dumps(body).encode()},
+    ]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        if disconnect is not None:
+            await disconnect.wait()
+        else:
+            await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/vocabulary/generate",
+        "headers": list(headers),
+    }
+    await asyncio.wait_for(asgi_app(scope, receive, send), timeout=5)
+    if not sent:
+        return None, None, None
+    headers = dict(sent[0]["headers"])
+    body = sent[1]["body"]
+    if headers[b"content-type"] == b"application/json":
+        body = json.loads(body)
+    return sent[0]["status"], headers, body
+
+
+@pytest.fixture
+def asgi_app(app):
+    asgi_app = GenerateApp(app)
+    yield asgi_app
+    runner = app.extensions.pop("generation_runner", None)
+    if runner:
+        runner.close()
+
+
+@pytest.mark.asyncio
+async def test_generate_returns_processed_response(asgi_app, monkeypatch):
+    async def fake_generate(prompt, formal):
+        return {"response": "tu esti student", "status": "success"}
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", fake_generate
+    )
+
+    with patch(f"{GUARDRAILS}.validate_input", return_value=True):
+        with patch(
+            f"{GUARDRAILS}.process_output", return_value="dumneavoastră sunteți"
+        ):
+            status, headers, data = await _call(
+                asgi_app, BODY, headers=[(b"origin", b"http://localhost:5173")]
+            )
+
+    assert status == 200
+    assert data == {"response": "dumneavoastră sunteți", "status": "success"}
+    assert headers[b"access-control-allow-origin"] == b"http://localhost:5173"
+    assert headers[b"x-cache"] == b"MISS"
+
+
+@pytest.mark.asyncio
+async def test_generate_rejects_invalid_input(asgi_app):
+    labels = {"method": "POST", "endpoint": "/api/vocabulary/generate", "status": "400"}
+    before = REGISTRY.get_sample_value("backend_flask_requests_total", labels) or 0
+
+    status, _, data = await _call(asgi_app, {"text": "Salut"})
+    assert status == 400
+    assert data["error"] == "Prompt is required"
+    # Served outside Flask, but counted like any other route
+    assert REGISTRY.get_sample_value("backend_flask_requests_total", labels) == (
+        before + 1
+    )
+
+    with patch(
+        f"{GUARDRAILS}.validate_input",
+        side_effect=ValueError("Input contains inappropriate content"),
+    ):
+        status, _, data = await _call(asgi_app, BODY)
+
+    assert status == 400
+    assert "inappropriate content" in data["error"]
+
+
+@pytest.mark.asyncio
+async def test_generate_is_rate_limited(asgi_app, app):
+    # Rejected input still counts, like on any Flask route
+    statuses = [(await _call(asgi_app, {}))[0] for _ in range(51)]
+
+    assert statuses[:50] == [400] * 50
+    assert statuses[50] == 429
+    # Counted in the same storage as the Flask route for the endpoint
+    response = app.test_client().post("/api/vocabulary/generate", json=BODY)
+    assert response.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_generate_timeout(asgi_app, app, monkeypatch):
+    app.config["OPENAI_TIMEOUT"] = 0.05
+
+    async def slow_generate(prompt, formal):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", slow_generate
+    )
+
+    with patch(f"{GUARDRAILS}.validate_input", return_value=True):
+        status, _, data = await _call(asgi_app, BODY)
+
+    assert status == 504
+
+
+@pytest.mark.asyncio
+async def test_client_disconnect_cancels_generation(asgi_app, monkeypatch):
+    cancelled = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    async def slow_generate(prompt, formal):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            loop.call_soon_threadsafe(cancelled.set)
+            raise
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", slow_generate
+    )
+    disconnect = asyncio.Event()
+    loop.call_later(0.1, disconnect.set)
+
+    with patch(f"{GUARDRAILS}.validate_input", return_value=True):
+        status, _, _ = await _call(asgi_app, BODY, disconnect=disconnect)
+
+    assert status is None
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generate_calls_share_the_event_loop(asgi_app, monkeypatch):
+    async def slow_generate(prompt, formal):
+        await asyncio.sleep(0.2)
+        return {"response": prompt, "status": "success"}
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", slow_generate
+    )
+
+    with patch(f"{GUARDRAILS}.validate_input", return_value=True):
+        with patch(f"{GUARDRAILS}.process_output", side_effect=lambda t, f: t):
+            start = asyncio.get_running_loop().time()
+            results = await asyncio.gather(
+                *[_call(asgi_app, {**BODY, "prompt": str(i)}) for i in range(20)]
+            )
+            loop_time = asyncio.get_running_loop().time() - start
+
+    assert [data["response"] for _, _, data in results] == [str(i) for i in range(20)]
+    # Twenty 200ms calls overlap instead of running one after another
+    assert loop_time < 1
+
+
+@pytest.mark.asyncio
+async def test_generate_streams_events(asgi_app, monkeypatch):
+    async def fake_stream(prompt, formal):
+        for token in ("Bucu", "resti e", "ste frumos"):
+            yield token
+
+    monkeypatch.setattr("app.services.openai_service.stream_vocabulary", fake_stream)
+    sent = []
+    messages = [{"type": "http.request", "body": json.dumps(BODY_INFORMAL).encode()}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/vocabulary/generate",
+        "query_string": b"stream=true",
+        "headers": [],
+    }
+    with patch(f"{GUARDRAILS}.validate_input", return_value=True):
+        await asyncio.wait_for(asgi_app(scope, receive, send), timeout=5)
+
+    assert dict(sent[0]["headers"])[b"content-type"] == b"text/event-stream"
+    body = b"".join(message.get("body", b"") for message in sent[1:]).decode()
+    assert body.startswith('event: token\ndata: {"token": "București "}')
+    assert body.endswith('event: done\ndata: {"status": "success"}\n\n')
+    assert sent[-1].get("more_body", False) is False
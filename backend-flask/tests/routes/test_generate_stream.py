@@ -0,0 +1,72 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+GUARDRAILS = "app.utils.langchain_guardrails.LangChainRomanianGuardrails"
+BODY = {
+    "text": "Cum spun țară?",
+    "prompt": "Teach me nouns",
+    "formal": False,
+}
+
+
+def _events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.fixture
+def streamed_tokens(monkeypatch):
+    tokens = ["Ro", "mania are o ", "tara si man", "care buna."]
+
+    async def fake_stream(prompt, formal):
+        for token in tokens:
+            yield token
+
+    monkeypatch.setattr("app.services.openai_service.stream_vocabulary", fake_stream)
+    return tokens
+
+
+def test_generate_streams_server_sent_events(app, client, streamed_tokens):
+    with patch(f"{GUARDRAILS}.validate_input", return_value=True):
+        response = client.post(
+            "/api/vocabulary/generate",
+            json=BODY,
+            headers={"Accept": "text/event-stream"},
+        )
+        body = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = _events(body)
+    assert events[-1] == ("done", {"status": "success"})
+    text = "".join(data["token"] for event, data in events if event == "token")
+    assert text == "Romania are o țară si mâncare buna."
+
+
+def test_generate_stream_reports_errors(app, client, monkeypatch):
+    async def failing_stream(prompt, formal):
+        yield "Ro"
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr("app.services.openai_service.stream_vocabulary", failing_stream)
+
+    with patch(f"{GUARDRAILS}.validate_input", return_value=True):
+        response = client.post("/api/vocabulary/generate?stream=true", json=BODY)
+        events = _events(response.get_data(as_text=True))
+
+    assert events[-1] == ("error", {"error": "An internal error occurred."})
+
+
+def test_generate_stream_validates_input_first(app, client, streamed_tokens):
+    with patch(
+        f"{GUARDRAILS}.validate_input",
+        side_effect=ValueError("Input contains inappropriate content"),
+    ):
+        response = client.post("/api/vocabulary/generate?stream=true", json=BODY)
+
+    assert response.status_code == 400
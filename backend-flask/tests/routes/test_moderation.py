@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+GUARDRAILS = "app.utils.langchain_guardrails.LangChainRomanianGuardrails"
+
+
+def test_moderate_batch(client):
+    """Test the batch endpoint returns one verdict per text."""
+    with patch(
+        f"{GUARDRAILS}.moderate_batch",
+        return_value=["SAFE", "UNSAFE: insults", "UNSAFE"],
+    ) as moderate:
+        response = client.post(
+            "/api/moderation/batch", json={"texts": ["măr", "ești prost", "???"]}
+        )
+
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "success": True,
+        "data": [
+            {"safe": True, "reason": None},
+            {"safe": False, "reason": "insults"},
+            {"safe": False, "reason": "inappropriate content"},
+        ],
+        "summary": {"total": 3, "unsafe": 2},
+    }
+    moderate.assert_called_once_with(["măr", "ești prost", "???"])
+
+
+def test_moderate_batch_validates_texts(client, app):
+    """Test malformed and oversized batches are rejected."""
+    app.config["MODERATION_BATCH_MAX_TEXTS"] = 2
+
+    for body, error in [
+        ({"texts": []}, "Texts must be a non-empty list"),
+        ({"texts": ["măr", " "]}, "Every text must be a non-empty string"),
+        ({"texts": ["a b", "c d", "e f"]}, "At most 2 texts"),
+    ]:
+        response = client.post("/api/moderation/batch", json=body)
+        assert response.status_code == 400
+        assert error in response.get_json()["error"]
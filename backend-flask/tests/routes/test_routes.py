@@ -10,8 +10,10 @@ import json
 
 import pytest
 from flask.testing import FlaskClient
+from limits.storage import MemoryStorage
+from limits.strategies import MovingWindowRateLimiter
 
-from app import db
+from app import db, limiter
 from app.models import Group, Word
 
 
@@ -47,6 +49,17 @@ def test_health_check(client: FlaskClient) -> None:
     assert "version" in data
 
 
+def test_rate_limit_uses_configured_storage(app, client: FlaskClient) -> None:
+    """Test the limiter counts requests in a moving window in the storage."""
+    assert app.config["RATELIMIT_STORAGE_URI"] == "memory://"
+    assert isinstance(limiter.storage, MemoryStorage)
+    assert isinstance(limiter.limiter, MovingWindowRateLimiter)
+
+    statuses = [client.get("/api/health").status_code for _ in range(51)]
+    assert statuses[:50] == [200] * 50
+    assert statuses[50] == 429
+
+
 def test_get_words(client: FlaskClient) -> None:
     """Test words endpoint returns properly formatted list of words."""
     response = client.get("/api/words")
@@ -0,0 +1,74 @@
+"""Tests for the streaming NDJSON vocabulary export."""
+
+import json
+
+import pytest
+from flask.testing import FlaskClient
+
+from app import db
+from app.models import Group, Word
+from app.routes import vocabulary
+
+
+@pytest.fixture(autouse=True)
+def setup_vocabulary(app) -> None:
+    """Add a grouped word on top of the base fixture."""
+    with app.app_context():
+        group = Group(name="Home", description="Romanian household vocabulary")
+        word = Word(
+            romanian="casă", english="house", part_of_speech="noun", parts=["home"]
+        )
+        word.groups.append(group)
+        db.session.add_all([group, word])
+        db.session.commit()
+        yield
+
+
+def _read_lines(response):
+    return [json.loads(line) for line in response.data.decode().splitlines()]
+
+
+def test_export_streams_ndjson(client: FlaskClient) -> None:
+    """Test the export is NDJSON with groups before words."""
+    response = client.get("/api/vocabulary/export")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.is_streamed
+    assert "vocabulary_export_" in response.headers["Content-Disposition"]
+
+    records = _read_lines(response)
+    types = [record["type"] for record in records]
+    assert types == ["group", "group", "word", "word"]
+
+
+def test_export_includes_group_ids(client: FlaskClient) -> None:
+    """Test exported words reference the exported groups."""
+    records = _read_lines(client.get("/api/vocabulary/export"))
+    groups = {
+        r["data"]["name"]: r["data"]["id"] for r in records if r["type"] == "group"
+    }
+    words = {r["data"]["romanian"]: r["data"] for r in records if r["type"] == "word"}
+
+    assert words["casă"]["groupIds"] == [groups["Home"]]
+    assert words["măr"]["groupIds"] == []
+
+
+def test_export_batches_rows(app, client: FlaskClient, monkeypatch) -> None:
+    """Test the export covers every row when it spans several batches."""
+    monkeypatch.setattr(vocabulary, "EXPORT_BATCH_SIZE", 2)
+    with app.app_context():
+        db.session.add_all(
+            Word(
+                romanian=f"cuvânt{i}",
+                english=f"word{i}",
+                part_of_speech="noun",
+                parts=[],
+            )
+            for i in range(5)
+        )
+        db.session.commit()
+
+    records = _read_lines(client.get("/api/vocabulary/export"))
+    word_ids = [r["data"]["id"] for r in records if r["type"] == "word"]
+    assert len(word_ids) == 7
+    assert word_ids == sorted(word_ids)
@@ -0,0 +1,197 @@
+"""Tests for the paginated words listing."""
+
+import pytest
+from flask.testing import FlaskClient
+
+from app import db
+from app.models import Group, Word
+
+
+@pytest.fixture(autouse=True)
+def setup_words(app) -> None:
+    """Add a handful of words, two of them grouped, on top of the base fixture."""
+    with app.app_context():
+        group = Group(name="Animals", description="Romanian animal vocabulary")
+        words = [
+            Word(
+                romanian=f"cuvânt{i}",
+                english=f"word{i}",
+                part_of_speech="noun",
+                parts=[],
+            )
+            for i in range(5)
+        ]
+        words[0].groups.append(group)
+        words[1].groups.append(group)
+        db.session.add(group)
+        db.session.add_all(words)
+        db.session.commit()
+        yield
+
+
+def test_get_words_first_page(client: FlaskClient) -> None:
+    """Test the first page is limited and carries a cursor to the next one."""
+    response = client.get("/api/words?limit=2")
+    assert response.status_code == 200
+    data = response.json
+
+    assert len(data["data"]) == 2
+    assert data["pagination"]["limit"] == 2
+    assert data["pagination"]["nextCursor"] == data["data"][-1]["id"]
+
+
+def test_get_words_walks_all_pages(client: FlaskClient) -> None:
+    """Test following nextCursor visits every word exactly once, in id order."""
+    ids = []
+    cursor = None
+    while True:
+        url = "/api/words?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        data = client.get(url).json
+        ids.extend(word["id"] for word in data["data"])
+        cursor = data["pagination"]["nextCursor"]
+        if cursor is None:
+            break
+
+    # One word from the base fixture plus five from setup_words
+    assert len(ids) == 6
+    assert ids == sorted(ids)
+
+
+def test_get_words_field_projection(client: FlaskClient) -> None:
+    """Test only the requested fields (plus id) are returned."""
+    response = client.get("/api/words?fields=romanian,english")
+    assert response.status_code == 200
+
+    for word in response.json["data"]:
+        assert set(word) == {"id", "romanian", "english"}
+
+
+def test_get_words_group_ids(client: FlaskClient) -> None:
+    """Test groupIds are batch loaded and match the relationship."""
+    response = client.get("/api/words?fields=romanian,groupIds")
+    by_name = {word["romanian"]: word for word in response.json["data"]}
+
+    assert len(by_name["cuvânt0"]["groupIds"]) == 1
+    assert by_name["cuvânt0"]["groupIds"] == by_name["cuvânt1"]["groupIds"]
+    assert by_name["cuvânt2"]["groupIds"] == []
+
+
+def test_get_words_matches_to_dict(app, client: FlaskClient) -> None:
+    """Test the full projection serializes like Word.to_dict."""
+    response = client.get("/api/words")
+    with app.app_context():
+        expected = [word.to_dict() for word in Word.query.order_by(Word.id)]
+    assert response.json["data"] == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["limit=0", "limit=abc", "cursor=abc", "fields=romanian,secret"],
+)
+def test_get_words_invalid_params(client: FlaskClient, query: str) -> None:
+    """Test invalid query parameters are rejected with 400."""
+    response = client.get(f"/api/words?{query}")
+    assert response.status_code == 400
+    assert "error" in response.json
+
+
+@pytest.fixture
+def search_words(app) -> None:
+    """Add words with diacritics to search for."""
+    with app.app_context():
+        db.session.add_all(
+            [
+                Word(romanian=r, english=e, part_of_speech="noun", parts=p)
+                for r, e, p in [
+                    ("țară", "country", ["place"]),
+                    ("tare", "strong", ["adjective"]),
+                    ("școală", "school", ["place"]),
+                    ("mărar", "dill", ["herb"]),
+                ]
+            ]
+        )
+        db.session.commit()
+
+
+def _search(client: FlaskClient, query: str) -> list:
+    response = client.get(f"/api/words/search?fields=romanian&{query}")
+    assert response.status_code == 200
+    return [word["romanian"] for word in response.json["data"]]
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("tara", ["țară"]),
+        ("ţară", ["țară"]),  # cedilla variant
+        ("scoala", ["școală"]),
+        ("school", ["școală"]),
+        ("place", ["țară", "școală"]),
+        ("country place", ["țară"]),
+    ],
+)
+def test_search_folds_diacritics(client, search_words, query, expected) -> None:
+    """Test words match with or without diacritics, in any column."""
+    assert sorted(_search(client, f"q={query}")) == sorted(expected)
+
+
+def test_search_prefix_for_typeahead(client: FlaskClient, search_words) -> None:
+    """Test the last term matches as a prefix unless prefix=false."""
+    assert sorted(_search(client, "q=ta")) == ["tare", "țară"]
+    assert _search(client, "q=ta&prefix=false") == []
+    assert _search(client, "q=mar&prefix=false") == ["măr"]
+
+
+def test_search_ranks_romanian_matches_first(client: FlaskClient, search_words) -> None:
+    """Test a match on the Romanian word outranks one on its parts."""
+    with client.application.app_context():
+        db.session.add(
+            Word(romanian="pădure", english="forest", part_of_speech="noun", parts=[])
+        )
+        db.session.add(
+            Word(
+                romanian="copac",
+                english="tree",
+                part_of_speech="noun",
+                parts=["pădure"],
+            )
+        )
+        db.session.commit()
+
+    assert _search(client, "q=padure") == ["pădure", "copac"]
+
+
+def test_search_follows_updates_and_deletes(app, client: FlaskClient) -> None:
+    """Test the index triggers keep search results in sync with words."""
+    with app.app_context():
+        word = Word.query.filter_by(romanian="măr").one()
+        word.romanian = "pară"
+        db.session.commit()
+        assert _search(client, "q=mar") == []
+        assert _search(client, "q=para") == ["pară"]
+
+        db.session.delete(word)
+        db.session.commit()
+        assert _search(client, "q=para") == []
+
+
+def test_search_serializes_like_words(app, client: FlaskClient) -> None:
+    """Test search results have the same shape as the words listing."""
+    response = client.get("/api/words/search?q=cuvant0")
+    with app.app_context():
+        expected = [Word.query.filter_by(romanian="cuvânt0").one().to_dict()]
+    assert response.json["data"] == expected
+
+
+def test_search_limit(client: FlaskClient) -> None:
+    """Test limit caps the number of results."""
+    assert len(_search(client, "q=cuvant&limit=3")) == 3
+    assert len(_search(client, "q=cuvant&limit=1000")) == 5
+
+
+@pytest.mark.parametrize("query", ["", "q=", "q=%22*", "q=mar&limit=0"])
+def test_search_invalid_params(client: FlaskClient, query: str) -> None:
+    """Test a missing or empty query and a bad limit are rejected with 400."""
+    response = client.get(f"/api/words/search?{query}")
+    assert response.status_code == 400
+    assert "error" in response.json
@@ -0,0 +1,116 @@
+from datetime import date, datetime
+
+from app.extensions import db
+from app.models import DashboardStats, Group, StudySession, Word, WordReviewItem
+from app.services.dashboard_stats import get_dashboard_stats, rebuild_dashboard_stats
+
+
+def _session(day, minutes=None, **kwargs):
+    start = datetime.fromisoformat(f"{day} 10:00:00")
+    end = start.replace(minute=minutes) if minutes is not None else None
+    return StudySession(
+        activity_id="flashcards", start_time=start, end_time=end, **kwargs
+    )
+
+
+def test_counts_follow_word_and_group_writes(app):
+    with app.app_context():
+        db.session.add(Group(name="Colours"))
+        db.session.add_all(
+            [
+                Word(romanian="roșu", english="red", part_of_speech="adj", parts=[]),
+                Word(
+                    romanian="verde",
+                    english="green",
+                    part_of_speech="adj",
+                    parts=[],
+                    learned=True,
+                ),
+            ]
+        )
+        db.session.commit()
+
+        stats = get_dashboard_stats()
+        assert stats["stats"]["totalWords"] == 3
+        assert stats["stats"]["totalGroups"] == 2
+        assert stats["progress"]["totalWordsLearned"] == 1
+        assert stats["progress"]["completionRate"] == 33.3
+
+        word = Word.query.filter_by(romanian="roșu").one()
+        word.learned = True
+        db.session.delete(Word.query.filter_by(romanian="verde").one())
+        db.session.commit()
+
+        stats = get_dashboard_stats()
+        assert stats["stats"]["totalWords"] == 2
+        assert stats["progress"]["totalWordsLearned"] == 1
+
+
+def test_sessions_and_reviews_fill_streak_and_last_session(app):
+    with app.app_context():
+        word = Word.query.first()
+        for day in ("2026-03-01", "2026-03-03", "2026-03-04", "2026-03-04"):
+            db.session.add(_session(day, minutes=5, score=0.5))
+        last = _session("2026-03-05", score=0.8)
+        db.session.add(last)
+        db.session.flush()
+        db.session.add_all(
+            [
+                WordReviewItem(word_id=word.id, session_id=last.id, correct=True),
+                WordReviewItem(word_id=word.id, session_id=last.id, correct=False),
+            ]
+        )
+        db.session.commit()
+
+        stats = get_dashboard_stats(today=date(2026, 3, 6))
+        assert stats["progress"]["streak"] == 3
+        assert stats["stats"]["completedSessions"] == 4
+        assert stats["stats"]["totalReviews"] == 2
+        assert stats["stats"]["correctReviews"] == 1
+        assert stats["lastSession"] == {
+            "date": "2026-03-05T10:00:00",
+            "score": 0.8,
+            "duration": 0,
+            "activity": "flashcards",
+        }
+
+        last.end_time = datetime(2026, 3, 5, 10, 15)
+        db.session.commit()
+
+        stats = get_dashboard_stats(today=date(2026, 3, 5))
+        assert stats["stats"]["completedSessions"] == 5
+        assert stats["lastSession"]["duration"] == 15 * 60
+
+        # The streak lapses once a full day passes without a session
+        assert get_dashboard_stats(today=date(2026, 3, 7))["progress"]["streak"] == 0
+
+
+def test_rebuild_matches_trigger_maintained_row(app):
+    with app.app_context():
+        for day in ("2026-03-01", "2026-03-02", "2026-03-03"):
+            db.session.add(_session(day, minutes=5))
+        db.session.commit()
+        before = get_dashboard_stats(today=date(2026, 3, 3))
+
+        db.session.delete(db.session.get(DashboardStats, 1))
+        db.session.commit()
+        # A missing row is rebuilt on the next read
+        assert get_dashboard_stats(today=date(2026, 3, 3)) == before
+
+        # Deleting history leaves a stale streak until the row is rebuilt
+        db.session.delete(StudySession.query.filter_by(id=2).one())
+        db.session.commit()
+        rebuild_dashboard_stats()
+        stats = get_dashboard_stats(today=date(2026, 3, 3))
+        assert stats["progress"]["streak"] == 1
+        assert stats["stats"]["completedSessions"] == 2
+
+
+def test_dashboard_route_uses_stats(client):
+    response = client.get("/api/dashboard")
+
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["stats"]["totalWords"] == 1
+    assert data["stats"]["totalGroups"] == 1
+    assert data["lastSession"]["date"] is None
@@ -0,0 +1,175 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.generation import GenerationRunner, GenerationTimeout
+
+
+@pytest.fixture
+def runner():
+    runner = GenerationRunner(max_concurrency=2, timeout=1)
+    yield runner
+    runner.close()
+
+
+def test_generate_returns_result(runner, monkeypatch):
+    async def fake_generate(prompt, formal):
+        return {"response": f"{prompt} ({formal})", "status": "success"}
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", fake_generate
+    )
+
+    assert runner.generate("verbs", False)["response"] == "verbs (False)"
+
+
+def test_concurrency_is_bounded(runner, monkeypatch):
+    peak = 0
+
+    async def fake_generate(prompt, formal):
+        nonlocal peak
+        peak = max(peak, runner.in_flight)
+        await asyncio.sleep(0.05)
+        return {"response": prompt}
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", fake_generate
+    )
+
+    futures = [runner.submit(str(i)) for i in range(6)]
+    results = [future.result() for future in futures]
+
+    assert [r["response"] for r in results] == [str(i) for i in range(6)]
+    assert peak == 2
+    assert runner.in_flight == 0
+
+
+def test_timeout_cancels_call(runner, monkeypatch):
+    cancelled = []
+
+    async def fake_generate(prompt, formal):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(prompt)
+            raise
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", fake_generate
+    )
+
+    start = time.monotonic()
+    with pytest.raises(GenerationTimeout):
+        runner.generate("slow", timeout=0.05)
+
+    assert time.monotonic() - start < 1
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_awaiting_task_cancels_call(runner, monkeypatch):
+    started = asyncio.Event()
+    cancelled = []
+    loop = asyncio.get_running_loop()
+
+    async def fake_generate(prompt, formal):
+        loop.call_soon_threadsafe(started.set)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(prompt)
+            raise
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", fake_generate
+    )
+
+    task = asyncio.ensure_future(runner.agenerate("abandoned"))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    for _ in range(100):
+        if cancelled:
+            break
+        await asyncio.sleep(0.01)
+    assert cancelled == ["abandoned"]
+
+
+def test_identical_calls_are_coalesced(runner, monkeypatch):
+    calls = []
+
+    async def fake_generate(prompt, formal):
+        calls.append(prompt)
+        while runner.flight.coalesced < 3:
+            await asyncio.sleep(0.001)
+        return {"response": prompt, "status": "success"}
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", fake_generate
+    )
+
+    futures = [
+        runner.submit(prompt) for prompt in ["Verbs", "verbs", "verbs ", "Verbs"]
+    ]
+    results = [future.result() for future in futures]
+
+    assert calls == ["Verbs"]
+    assert results == [{"response": "Verbs", "status": "success"}] * 4
+    assert runner.flight.stats()["coalesced"] == 3
+
+
+class _Guardrails:
+    async def aprocess_output_stream(self, chunks, formal):
+        async for chunk in chunks:
+            yield chunk.upper()
+
+
+def test_iter_stream_yields_processed_chunks(runner, monkeypatch):
+    async def fake_stream(prompt, formal):
+        for token in ("un ", "doi ", "trei"):
+            yield token
+
+    monkeypatch.setattr("app.services.openai_service.stream_vocabulary", fake_stream)
+
+    chunks = list(runner.iter_stream("numbers", False, _Guardrails()))
+
+    assert chunks == ["UN ", "DOI ", "TREI"]
+    assert runner.in_flight == 0
+
+
+def test_closing_stream_cancels_call(runner, monkeypatch):
+    closed = []
+
+    async def fake_stream(prompt, formal):
+        try:
+            yield "first "
+            await asyncio.sleep(10)
+            yield "never"
+        finally:
+            closed.append(prompt)
+
+    monkeypatch.setattr("app.services.openai_service.stream_vocabulary", fake_stream)
+
+    stream = runner.iter_stream("abandoned", False, _Guardrails())
+    assert next(stream) == "FIRST "
+    stream.close()
+
+    assert closed == ["abandoned"]
+    assert runner.in_flight == 0
+
+
+def test_stalled_stream_times_out(runner, monkeypatch):
+    async def fake_stream(prompt, formal):
+        yield "first "
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr("app.services.openai_service.stream_vocabulary", fake_stream)
+
+    stream = runner.iter_stream("stalled", False, _Guardrails(), timeout=0.05)
+    assert next(stream) == "FIRST "
+    with pytest.raises(GenerationTimeout):
+        next(stream)
+    assert runner.in_flight == 0
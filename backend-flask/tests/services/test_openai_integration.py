@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,7 +13,7 @@ def mock_openai_client():
     mock_response.choices = [
         MagicMock(message=MagicMock(content="Here is some Romanian vocabulary"))
     ]
-    mock_client.chat.completions.create.return_value = mock_response
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
     return mock_client
 
 
@@ -21,7 +21,8 @@ def mock_openai_client():
 async def test_generate_vocabulary_success(mock_openai_client):
     """Test successful vocabulary generation."""
     with patch(
-        "app.services.openai_service.get_openai_client", return_value=mock_openai_client
+        "app.services.openai_service.get_async_openai_client",
+        return_value=mock_openai_client,
     ):
         result = await generate_vocabulary("Test prompt")
         assert "response" in result
@@ -34,13 +35,14 @@ async def test_generate_vocabulary_with_prompt(mock_openai_client):
     test_prompt = "Generate Romanian food vocabulary"
 
     with patch(
-        "app.services.openai_service.get_openai_client", return_value=mock_openai_client
+        "app.services.openai_service.get_async_openai_client",
+        return_value=mock_openai_client,
     ):
         result = await generate_vocabulary(test_prompt)
         assert "response" in result
 
         # Verify the prompt was passed correctly
-        mock_openai_client.chat.completions.create.assert_called_once_with(
+        mock_openai_client.chat.completions.create.assert_awaited_once_with(
             model="gpt-3.5-turbo",
             messages=[{"role": "user", "content": test_prompt}],
             temperature=0.7,
@@ -51,10 +53,11 @@ async def test_generate_vocabulary_with_prompt(mock_openai_client):
 async def test_generate_vocabulary_error_handling():
     """Test error handling during vocabulary generation."""
     mock_client = MagicMock()
-    mock_client.chat.completions.create.side_effect = Exception("API Error")
+    mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
 
     with patch(
-        "app.services.openai_service.get_openai_client", return_value=mock_client
+        "app.services.openai_service.get_async_openai_client",
+        return_value=mock_client,
     ):
         with pytest.raises(Exception):
             await generate_vocabulary("Test prompt")
@@ -67,10 +70,11 @@ async def test_generate_vocabulary_invalid_response():
     mock_response = MagicMock()
     # Create an invalid response structure
     mock_response.choices = []  # Empty choices
-    mock_client.chat.completions.create.return_value = mock_response
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
     with patch(
-        "app.services.openai_service.get_openai_client", return_value=mock_client
+        "app.services.openai_service.get_async_openai_client",
+        return_value=mock_client,
     ):
         with pytest.raises(IndexError):
             await generate_vocabulary("Test prompt")
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -20,11 +20,12 @@ async def test_generate_vocabulary_success():
 
     # Create a mock client with a mock chat completions create method
     mock_client = MagicMock()
-    mock_client.chat.completions.create.return_value = mock_response
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
     # Patch the get_openai_client function to return our mock client
     with patch(
-        "app.services.openai_service.get_openai_client", return_value=mock_client
+        "app.services.openai_service.get_async_openai_client",
+        return_value=mock_client,
     ):
         result = await generate_vocabulary("Teach me about verbs", formal=True)
 
@@ -33,7 +34,7 @@ async def test_generate_vocabulary_success():
         assert result["status"] == "success"
 
         # Verify correct parameters were passed
-        mock_client.chat.completions.create.assert_called_once_with(
+        mock_client.chat.completions.create.assert_awaited_once_with(
             model="gpt-3.5-turbo",
             messages=[{"role": "user", "content": "Teach me about verbs"}],
             temperature=0.7,
@@ -45,11 +46,12 @@ async def test_generate_vocabulary_error():
     """Test error handling in vocabulary generation"""
     # Create a mock client that raises an exception
     mock_client = MagicMock()
-    mock_client.chat.completions.create.side_effect = Exception("API Error")
+    mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
 
     # Patch the get_openai_client function
     with patch(
-        "app.services.openai_service.get_openai_client", return_value=mock_client
+        "app.services.openai_service.get_async_openai_client",
+        return_value=mock_client,
     ):
         with pytest.raises(Exception):
             await generate_vocabulary("Test prompt", formal=True)
@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.generation import GenerationRunner
+from app.services.response_cache import HIT, MISS, SIMILAR_HIT, ResponseCache
+
+GUARDRAILS = "app.utils.langchain_guardrails.LangChainRomanianGuardrails"
+RESULT = {"response": "mere, pere", "status": "success"}
+
+
+def _lookup(cache, prompt, formal=True):
+    return asyncio.run(cache.lookup(prompt, formal))
+
+
+def _embeddings(cache, vectors):
+    """Serve fixed, already normalized embeddings per prompt."""
+
+    async def fake_embed(prompt):
+        return vectors.get(prompt)
+
+    cache._embed = fake_embed
+
+
+def test_exact_hit_after_normalization():
+    cache = ResponseCache()
+    cache.store("Fruit  vocabulary", True, RESULT)
+
+    response, status, _ = _lookup(cache, "fruit vocabulary")
+
+    assert (response, status) == (RESULT, HIT)
+    assert _lookup(cache, "fruit vocabulary", formal=False)[1] == MISS
+    assert cache.stats()["hitRatio"] == 0.5
+
+
+def test_similar_prompt_reuses_response():
+    cache = ResponseCache(embedding_url="http://embeddings:6000/", similarity=0.9)
+    _embeddings(
+        cache,
+        {
+            "fruit words": [1.0, 0.0],
+            "words for fruit": [0.96, 0.28],
+            "verbs": [0.0, 1.0],
+        },
+    )
+    _, status, vector = _lookup(cache, "fruit words")
+    assert status == MISS
+    cache.store("fruit words", True, RESULT, vector)
+
+    response, status, _ = _lookup(cache, "words for fruit")
+    assert (response, status) == (RESULT, SIMILAR_HIT)
+    assert _lookup(cache, "verbs")[1] == MISS
+    # Formality is never mixed up by similarity
+    assert _lookup(cache, "words for fruit", formal=False)[1] == MISS
+
+    stats = cache.stats()
+    assert stats["similarHits"] == 1
+    assert stats["hitRatio"] == 0.25
+    assert cache.embedding_url == "http://embeddings:6000"
+
+
+def test_eviction_drops_embedding():
+    cache = ResponseCache(max_size=1, embedding_url="http://embeddings:6000")
+    cache.store("fruit", True, RESULT, [1.0, 0.0])
+    cache.store("verbs", True, RESULT, [0.0, 1.0])
+
+    assert cache._nearest("formal", [1.0, 0.0]) is None
+    assert cache._nearest("formal", [0.0, 1.0]) is not None
+
+
+@pytest.fixture
+def cached_runner():
+    runner = GenerationRunner(max_concurrency=2, timeout=1, cache=ResponseCache())
+    yield runner
+    runner.close()
+
+
+def test_runner_generates_once_per_prompt(cached_runner, monkeypatch):
+    calls = []
+
+    async def fake_generate(prompt, formal):
+        calls.append(prompt)
+        return {"response": f"{prompt} ({formal})", "status": "success"}
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", fake_generate
+    )
+
+    first = cached_runner.generate_cached("Verbs", False)
+    second = cached_runner.generate_cached("verbs ", False)
+
+    assert first == ({"response": "Verbs (False)", "status": "success"}, MISS)
+    assert second == ({"response": "Verbs (False)", "status": "success"}, HIT)
+    assert calls == ["Verbs"]
+
+
+def test_route_sets_cache_header(client, monkeypatch):
+    calls = []
+
+    async def fake_generate(prompt, formal):
+        calls.append(prompt)
+        return {"response": "mere", "status": "success"}
+
+    monkeypatch.setattr(
+        "app.services.openai_service.generate_vocabulary", fake_generate
+    )
+    body = {"text": "Cum se spune apple?", "prompt": "Fruit vocabulary"}
+
+    try:
+        with patch(f"{GUARDRAILS}.validate_input", return_value=True):
+            with patch(f"{GUARDRAILS}.process_output", side_effect=lambda t, f: t):
+                first = client.post("/api/vocabulary/generate", json=body)
+                second = client.post("/api/vocabulary/generate", json=body)
+        health = client.get("/api/health").get_json()
+    finally:
+        runner = client.application.extensions.pop("generation_runner", None)
+        if runner:
+            runner.close()
+
+    assert first.headers["X-Cache"] == MISS
+    assert second.headers["X-Cache"] == HIT
+    assert second.get_json() == first.get_json()
+    assert calls == ["Fruit vocabulary"]
+    assert health["responseCache"]["hits"] == 1
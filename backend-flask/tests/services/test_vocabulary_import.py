@@ -0,0 +1,111 @@
+"""Tests for the bulk vocabulary import."""
+
+import pytest
+
+from app.models import Group, Word
+from app.services import vocabulary_import
+from app.services.vocabulary_import import import_vocabulary
+
+
+def test_import_creates_groups_words_and_links(app) -> None:
+    """Test a fresh import creates everything and keeps word counts in sync."""
+    with app.app_context():
+        summary = import_vocabulary(
+            [
+                {"group": "Colours", "words": ["roșu", "verde"]},
+                {"group": "Fruits", "words": ["măr", "pară"]},
+            ]
+        )
+
+        # "Fruits" and "măr" already exist from the base fixture
+        assert summary["groupsCreated"] == 1
+        assert summary["wordsCreated"] == 3
+        assert summary["linksCreated"] == 4
+
+        colours = Group.query.filter_by(name="Colours").one()
+        fruits = Group.query.filter_by(name="Fruits").one()
+        assert colours.word_count == 2
+        assert fruits.word_count == 2
+        assert {w.romanian for w in fruits.words} == {"măr", "pară"}
+        assert Word.query.filter_by(romanian="măr").count() == 1
+
+
+def test_import_is_idempotent(app) -> None:
+    """Test importing the same document twice does not duplicate rows."""
+    groups = [{"group": "Colours", "words": ["roșu", "verde", "roșu"]}]
+    with app.app_context():
+        import_vocabulary(groups)
+        summary = import_vocabulary(groups)
+
+        assert summary["groupsCreated"] == 0
+        assert summary["wordsCreated"] == 0
+        assert summary["linksCreated"] == 0
+        assert Group.query.filter_by(name="Colours").one().word_count == 2
+
+
+def test_import_accepts_word_objects(app) -> None:
+    """Test word entries can carry translations and grammar details."""
+    with app.app_context():
+        import_vocabulary(
+            [
+                {
+                    "group": "Home",
+                    "words": [
+                        {
+                            "romanian": "casă",
+                            "english": "house",
+                            "part_of_speech": "noun",
+                        }
+                    ],
+                }
+            ]
+        )
+        word = Word.query.filter_by(romanian="casă").one()
+        assert word.english == "house"
+        assert word.part_of_speech == "noun"
+        assert word.parts == []
+
+
+def test_import_spans_chunks(app, monkeypatch) -> None:
+    """Test imports larger than one chunk are written completely."""
+    monkeypatch.setattr(vocabulary_import, "IMPORT_CHUNK_SIZE", 3)
+    with app.app_context():
+        summary = import_vocabulary(
+            [{"group": "Numbers", "words": [f"număr{i}" for i in range(10)]}]
+        )
+        assert summary["wordsCreated"] == 10
+        assert Group.query.filter_by(name="Numbers").one().word_count == 10
+
+
+@pytest.mark.parametrize(
+    "groups",
+    [
+        "not a list",
+        [{"words": ["roșu"]}],
+        [{"group": "Colours", "words": "roșu"}],
+        [{"group": "Colours", "words": [""]}],
+    ],
+)
+def test_import_rejects_malformed_payload(app, groups) -> None:
+    """Test malformed documents raise ValueError and write nothing."""
+    with app.app_context():
+        with pytest.raises(ValueError):
+            import_vocabulary(groups)
+        assert Group.query.filter_by(name="Colours").count() == 0
+
+
+def test_create_vocabulary_route(client) -> None:
+    """Test the import endpoint returns the import summary."""
+    response = client.post(
+        "/api/vocabulary", json={"groups": [{"group": "Colours", "words": ["roșu"]}]}
+    )
+    assert response.status_code == 201
+    assert response.json["success"] is True
+    assert response.json["data"]["wordsCreated"] == 1
+
+
+def test_create_vocabulary_route_requires_groups(client) -> None:
+    """Test the import endpoint rejects documents without groups."""
+    response = client.post("/api/vocabulary", json={"prompt": "Teach me verbs"})
+    assert response.status_code == 400
+    assert "Groups are required" in response.json["error"]
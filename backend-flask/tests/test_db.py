@@ -6,8 +6,15 @@ Tests core database operations:
 - Query functionality
 """
 
-from app import db
-from app.models import Group, Word
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from app import create_app, db
+from app.config import TestingConfig
+from app.models import Group, Word, WordReviewItem
 
 
 def test_database(app) -> None:
@@ -42,3 +49,32 @@ def test_database(app) -> None:
         # Test retrieving words in a group
         assert retrieved_group.words.count() == 1
         assert retrieved_group.words[0].romanian == "casă"
+
+
+def test_sqlite_pragmas_are_applied(tmp_path) -> None:
+    """Every connection runs in WAL mode with foreign keys enforced."""
+    with patch.object(
+        TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path}/app.db"
+    ):
+        app = create_app("testing")
+
+    with app.app_context():
+        db.create_all()
+        pragmas = {
+            name: db.session.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "foreign_keys", "busy_timeout")
+        }
+        assert pragmas == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "foreign_keys": 1,
+            "busy_timeout": 5000,
+        }
+
+        db.session.add(
+            WordReviewItem(word_id=404, session_id=404, correct=True, user_answer="x")
+        )
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+        db.engine.dispose()
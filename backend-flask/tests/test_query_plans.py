@@ -0,0 +1,199 @@
+"""Query plan regression tests.
+
+The app runs against a database built by the SQL migrations. Every
+statement an API route executes is captured and explained with
+``EXPLAIN QUERY PLAN``, so a change that stops a lookup from using its
+index fails here rather than in production.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, inspect
+
+from app import create_app
+from app.config import TestingConfig
+from app.extensions import db
+from app.utils.schema_migrations import apply_migrations
+
+# Tables no route may read in full
+NEVER_SCANNED = ("words_groups", "word_review_items", "study_sessions")
+
+IMPORT = {
+    "groups": [
+        {"group": "Fructe", "words": ["măr", "pară"]},
+        {"group": "Legume", "words": ["roșie", "măr"]},
+    ]
+}
+
+# (method, path, body, fragments the plans must contain)
+ROUTES = [
+    (
+        "POST",
+        "/api/vocabulary",
+        IMPORT,
+        [
+            "INDEX ix_words_romanian (romanian=?)",
+            "INDEX ix_groups_name (name=?)",
+            "INDEX ix_words_groups_group_id_word_id (group_id=?)",
+        ],
+    ),
+    (
+        "GET",
+        "/api/words?cursor=1&fields=id,romanian,groupIds",
+        None,
+        [
+            "SEARCH words USING INTEGER PRIMARY KEY (rowid>?)",
+            "SEARCH words_groups USING PRIMARY KEY (word_id=?)",
+        ],
+    ),
+    (
+        "GET",
+        "/api/words/search?q=mar&fields=id,romanian,groupIds",
+        None,
+        [
+            "SCAN words_fts VIRTUAL TABLE",
+            "SEARCH words USING INTEGER PRIMARY KEY (rowid=?)",
+            "SEARCH words_groups USING PRIMARY KEY (word_id=?)",
+        ],
+    ),
+    ("GET", "/api/groups", None, ["SCAN groups"]),
+    (
+        "GET",
+        "/api/dashboard",
+        None,
+        [
+            "SEARCH dashboard_stats USING INTEGER PRIMARY KEY (rowid=?)",
+            "SEARCH study_sessions USING INTEGER PRIMARY KEY (rowid=?)",
+        ],
+    ),
+    (
+        "GET",
+        "/api/vocabulary/export",
+        None,
+        ["SEARCH words_groups USING PRIMARY KEY (word_id=?)"],
+    ),
+]
+
+# Lookups that have an index but no route yet
+LOOKUPS = [
+    (
+        "SELECT * FROM word_review_items WHERE word_id = 1 ORDER BY created_at DESC",
+        "INDEX ix_word_review_items_word_id_created_at (word_id=?)",
+    ),
+    (
+        "SELECT * FROM study_sessions WHERE group_id = 1 ORDER BY start_time DESC",
+        "INDEX ix_study_sessions_group_id_start_time (group_id=?)",
+    ),
+    (
+        # Dashboard trigger after a session is deleted
+        "SELECT id FROM study_sessions ORDER BY start_time DESC, id DESC LIMIT 1",
+        "SCAN study_sessions USING COVERING INDEX ix_study_sessions_start_time",
+    ),
+    (
+        "SELECT * FROM words WHERE english = 'apple'",
+        "INDEX ix_words_english (english=?)",
+    ),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "app.db")
+    conn = sqlite3.connect(path)
+    apply_migrations(conn)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def migrated_app(db_path):
+    with patch.object(TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{db_path}"):
+        app = create_app("testing")
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _plan(conn, statement, parameters):
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [detail for *_, detail in rows]
+
+
+def _route_plans(app, db_path, method, path, body):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            statements.append((statement, parameters))
+
+    client = app.test_client()
+    client.post("/api/vocabulary", json=IMPORT)
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        response = client.open(path, method=method, json=body)
+        response.get_data()  # streamed responses run their queries here
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+    assert response.status_code in (200, 201), response.data
+
+    conn = sqlite3.connect(db_path)
+    try:
+        return [
+            detail
+            for statement, parameters in statements
+            for detail in _plan(conn, statement, parameters)
+        ]
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    "method,path,body,expected", ROUTES, ids=[f"{r[0]} {r[1]}" for r in ROUTES]
+)
+def test_route_uses_indexes(migrated_app, db_path, method, path, body, expected):
+    plans = _route_plans(migrated_app, db_path, method, path, body)
+
+    for fragment in expected:
+        assert any(fragment in detail for detail in plans), (fragment, plans)
+    for table in NEVER_SCANNED:
+        assert not any(detail.startswith(f"SCAN {table}") for detail in plans), plans
+
+
+@pytest.mark.parametrize("statement,expected", LOOKUPS)
+def test_lookup_uses_index(db_path, statement, expected):
+    conn = sqlite3.connect(db_path)
+    try:
+        plans = _plan(conn, statement, ())
+    finally:
+        conn.close()
+
+    assert any(expected in detail for detail in plans), plans
+
+
+def test_migrations_match_models(migrated_app, tmp_path):
+    """The migrated schema has the tables, columns and indexes of the models."""
+    migrated = inspect(db.engine)
+    models_path = tmp_path / "models.db"
+    with patch.object(
+        TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{models_path}"
+    ):
+        models_app = create_app("testing")
+    with models_app.app_context():
+        db.create_all()
+        models = inspect(db.engine)
+
+        for table in models.get_table_names():
+            assert {c["name"] for c in migrated.get_columns(table)} == {
+                c["name"] for c in models.get_columns(table)
+            }, table
+            assert {i["name"] for i in migrated.get_indexes(table)} == {
+                i["name"] for i in models.get_indexes(table)
+            }, table
+            primary_key = models.get_pk_constraint(table)["constrained_columns"]
+            assert (
+                migrated.get_pk_constraint(table)["constrained_columns"] == primary_key
+            ), table
+        db.engine.dispose()
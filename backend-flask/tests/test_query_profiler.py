@@ -0,0 +1,87 @@
+"""Tests for the opt-in SQL query profiler."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+from flask import jsonify
+from prometheus_client import REGISTRY
+
+from app import create_app
+from app.config import TestingConfig
+from app.extensions import db
+from app.models import Word
+
+WORDS_ENDPOINT = "/profiled/words"
+
+
+@pytest.fixture
+def profiled_app():
+    with patch.object(TestingConfig, "SQL_PROFILING", True):
+        app = create_app("testing")
+    app.debug = True
+
+    @app.route(WORDS_ENDPOINT)
+    def words_with_groups():
+        # Loads each word's groups separately: a textbook N+1
+        return jsonify([word.to_dict() for word in Word.query.all()])
+
+    with app.app_context():
+        db.create_all()
+        for i in range(6):
+            db.session.add(
+                Word(
+                    romanian=f"cuvânt {i}",
+                    english=f"word {i}",
+                    part_of_speech="noun",
+                    parts=[],
+                )
+            )
+        db.session.commit()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def test_headers_report_queries_and_n_plus_one(profiled_app, caplog):
+    labels = {"endpoint": WORDS_ENDPOINT}
+    before = REGISTRY.get_sample_value("backend_flask_db_n_plus_one_total", labels)
+
+    with caplog.at_level(logging.WARNING, logger="app.extensions"):
+        response = profiled_app.test_client().get(WORDS_ENDPOINT)
+
+    assert response.status_code == 200
+    # One query for the words, then one per word for its groups
+    assert response.headers["X-DB-Query-Count"] == "7"
+    assert float(response.headers["X-DB-Time-Ms"]) > 0
+    assert response.headers["X-DB-N-Plus-One"] == "1"
+    assert "Possible N+1 in /profiled/words: statement run 6 times" in caplog.text
+    after = REGISTRY.get_sample_value("backend_flask_db_n_plus_one_total", labels)
+    assert after == (before or 0) + 1
+
+
+def test_slow_queries_are_logged(profiled_app, caplog):
+    profiled_app.config["SQL_SLOW_QUERY_MS"] = 0
+
+    with caplog.at_level(logging.WARNING, logger="app.extensions"):
+        response = profiled_app.test_client().get("/api/groups")
+
+    assert int(response.headers["X-DB-Slow-Queries"]) >= 1
+    assert "Slow query in /api/groups" in caplog.text
+
+
+def test_headers_only_in_debug(profiled_app):
+    profiled_app.debug = False
+
+    response = profiled_app.test_client().get(WORDS_ENDPOINT)
+
+    assert response.status_code == 200
+    assert "X-DB-Query-Count" not in response.headers
+
+
+def test_profiling_is_off_by_default(client):
+    client.application.debug = True
+
+    response = client.get("/api/groups")
+
+    assert "X-DB-Query-Count" not in response.headers
@@ -0,0 +1,66 @@
+import pytest
+
+from app.utils.diacritics import DiacriticCorrector, fold, get_diacritic_corrector
+
+WORDS = {"tara": "țară", "Bucuresti": "București", "Romaniei": "României"}
+
+
+@pytest.fixture
+def corrector():
+    return DiacriticCorrector(WORDS, ["mâncare", "școală", "casă", "casa"])
+
+
+def test_fold():
+    assert fold("Țară ŞI șir") == "Tara SI sir"
+
+
+def test_corrects_in_one_pass_preserving_case(corrector):
+    text = "TARA, tara si Tara. Mancare din bucuresti"
+
+    assert corrector.correct(text) == "ȚARĂ, țară si Țară. Mâncare din București"
+
+
+def test_ambiguous_forms_are_left_alone(corrector):
+    # "casa" and "casă" are both words, so there is nothing to restore
+    assert corrector.correct("casa mare") == "casa mare"
+
+
+def test_definite_feminine_forms_are_left_alone():
+    corrector = DiacriticCorrector({}, ["apă", "școală"])
+
+    # "apa" and "scoala" also spell the definite forms "apa" and "școala"
+    assert corrector.correct("Apa este rece la scoala") == "Apa este rece la scoala"
+
+
+def test_whole_words_only(corrector):
+    assert corrector.correct("tarabă") == "tarabă"
+
+
+def test_loads_core_vocab_layout(tmp_path):
+    vocab = tmp_path / "core-vocab.txt"
+    vocab.write_text(
+        "12. A mânca\n"
+        "    - English: To eat\n"
+        '    - Example: "El mănâncă mereu la ora prânzului." (He always eats.)\n',
+        encoding="utf-8",
+    )
+
+    corrector = get_diacritic_corrector(WORDS, str(vocab))
+
+    assert corrector.correct("El va manca la ora pranzului") == (
+        "El va mânca la ora prânzului"
+    )
+
+
+def test_missing_vocab_file_falls_back_to_words(tmp_path):
+    corrector = get_diacritic_corrector(WORDS, str(tmp_path / "missing.txt"))
+
+    assert corrector.correct("Romaniei") == "României"
+
+
+def test_scales_to_large_dictionaries():
+    forms = ["ț" + "".join(chr(97 + int(d)) for d in str(i)) for i in range(20000)]
+    corrector = DiacriticCorrector(WORDS, forms)
+
+    assert len(corrector) > 20000
+    assert corrector.correct("tbcd si tara") == "țbcd si țară"
@@ -0,0 +1,60 @@
+import pytest
+
+from app.utils.formality import FormalityClassifier, split_sentences
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return FormalityClassifier()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Tu ești student.",
+        "Ce faci azi?",
+        "Unde lucrezi?",
+        "Citești o carte.",
+        "Du-te acasă!",
+        "Mama ta este profesoară.",
+        "Esti acasa?",  # missing diacritics
+        "Locuiești în București.",
+        "Ce mănânci azi?",
+        "Scrii o scrisoare.",
+        "Înțelegi întrebarea?",
+        "Cânți foarte frumos.",
+        "Când pleci?",
+        "Dormi bine?",
+        "Ajungi la timp?",
+        "Cand pleci?",  # missing diacritics
+    ],
+)
+def test_informal_sentences_are_flagged(classifier, text):
+    assert classifier.is_informal(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Dumneavoastră sunteți student.",
+        "București este capitala României.",
+        "Mărul este un fruct.",
+        "Francezi și englezi învață limba română.",
+        "Bucătăria românești are multe feluri de mâncare.",
+        "Vă rog să repetați cuvântul.",
+        "Am cumpărat multe cărți noi.",
+        "Oamenii sunt buni și prietenii vin luni.",
+        "Este bine a dormi opt ore.",
+    ],
+)
+def test_formal_sentences_are_not_flagged(classifier, text):
+    assert not classifier.is_informal(text)
+
+
+def test_split_sentences_keeps_whitespace():
+    text = "Tu ești student. Mărul este roșu!\nCe faci?"
+
+    sentences = split_sentences(text)
+
+    assert sentences == ["Tu ești student. ", "Mărul este roșu!\n", "Ce faci?"]
+    assert "".join(sentences) == text
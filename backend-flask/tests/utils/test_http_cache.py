@@ -0,0 +1,140 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import Word
+from app.utils.http_cache import HIT, MISS, PayloadCache, get_api_cache
+
+
+def _statements(app):
+    """Start capturing statements; returns them and a function that stops."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", capture)
+    return statements, lambda: event.remove(db.engine, "before_cursor_execute", capture)
+
+
+@pytest.mark.parametrize("path", ["/api/words", "/api/groups", "/api/dashboard"])
+def test_repeat_is_served_from_cache(client, path):
+    first = client.get(path)
+    second = client.get(path)
+
+    assert first.headers["X-Cache"] == MISS
+    assert second.headers["X-Cache"] == HIT
+    assert second.data == first.data
+    assert second.json == first.json
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+
+def test_if_none_match_skips_the_rows(app, client):
+    etag = client.get("/api/words").headers["ETag"]
+    statements, stop = _statements(app)
+    try:
+        response = client.get("/api/words", headers={"If-None-Match": etag})
+    finally:
+        stop()
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert len(statements) == 1
+    assert "FROM table_versions" in statements[0]
+
+
+def test_write_changes_etag_of_dependent_routes_only(client):
+    words = client.get("/api/words").headers["ETag"]
+    groups = client.get("/api/groups").headers["ETag"]
+
+    client.post("/api/groups", json={"name": "Legume"})
+
+    response = client.get("/api/groups", headers={"If-None-Match": groups})
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == MISS
+    assert "Legume" in [group["name"] for group in response.json["data"]]
+    response = client.get("/api/words", headers={"If-None-Match": words})
+    assert response.status_code == 304
+
+
+def test_writes_outside_the_orm_invalidate(app, client):
+    """Triggers catch raw SQL writes, e.g. from another process."""
+    dashboard = client.get("/api/dashboard")
+    with app.app_context():
+        db.session.execute(
+            Word.__table__.insert().values(
+                romanian="pară", english="pear", part_of_speech="noun", parts=[]
+            )
+        )
+        db.session.commit()
+
+    response = client.get(
+        "/api/dashboard", headers={"If-None-Match": dashboard.headers["ETag"]}
+    )
+
+    assert response.status_code == 200
+    totals = (dashboard.json["data"]["stats"], response.json["data"]["stats"])
+    assert totals[1]["totalWords"] == totals[0]["totalWords"] + 1
+
+
+def test_dashboard_etag_changes_with_the_date(client):
+    etag = client.get("/api/dashboard").headers["ETag"]
+
+    with patch("app.routes.dashboard.datetime") as clock:
+        clock.now.return_value.date.return_value.isoformat.return_value = "2099-01-01"
+        response = client.get("/api/dashboard", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_query_string_is_part_of_the_key(client):
+    first = client.get("/api/words?limit=1&fields=romanian")
+    reordered = client.get("/api/words?fields=romanian&limit=1")
+    other = client.get("/api/words?limit=2&fields=romanian")
+
+    assert reordered.headers["X-Cache"] == HIT
+    assert reordered.headers["ETag"] == first.headers["ETag"]
+    assert other.headers["ETag"] != first.headers["ETag"]
+
+
+def test_errors_are_not_cached(client):
+    response = client.get("/api/words?limit=0")
+
+    assert response.status_code == 400
+    assert "ETag" not in response.headers
+    assert "X-Cache" not in response.headers
+
+
+def test_etags_work_without_payload_cache(app, client):
+    app.config["API_CACHE_SIZE"] = 0
+    first = client.get("/api/groups")
+    response = client.get(
+        "/api/groups", headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert first.headers["X-Cache"] == MISS
+    assert response.status_code == 304
+    with app.app_context():
+        assert get_api_cache() is None
+
+
+def test_payload_cache_lru_and_invalidation():
+    cache = PayloadCache(max_size=2)
+    cache.set("a", "v1", b"a1")
+    cache.set("b", "v1", b"b1")
+
+    assert cache.get("a", "v1") == b"a1"
+    assert cache.get("b", "v2") is None  # stale version drops the entry
+    cache.set("c", "v1", b"c1")
+    cache.set("d", "v1", b"d1")  # evicts "a", the least recently used
+    assert cache.get("a", "v1") is None
+
+    stats = cache.stats()
+    assert (stats["size"], stats["invalidations"], stats["evictions"]) == (2, 1, 1)
+    assert (stats["hits"], stats["misses"]) == (1, 2)
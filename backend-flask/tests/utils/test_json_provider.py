@@ -0,0 +1,104 @@
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from flask import jsonify
+
+from app import create_app
+from app.config import TestingConfig
+from app.utils import json_provider
+from app.utils.json_provider import (
+    ORJSONProvider,
+    RawJSON,
+    StdlibJSONProvider,
+    json_array,
+)
+
+PAYLOAD = {
+    "word": "țară",
+    "createdAt": datetime(2025, 3, 1, 9, 30, 15, 123456),
+    "day": date(2025, 3, 1),
+    "score": Decimal("1.5"),
+    "byId": {2: "b", 1: "a"},
+    "data": json_array(['{"id":1,"parts":["loc"]}', '{"id":2,"parts":[]}']),
+}
+
+EXPECTED = {
+    "word": "țară",
+    "createdAt": "2025-03-01T09:30:15.123456",
+    "day": "2025-03-01",
+    "score": "1.5",
+    "byId": {"1": "a", "2": "b"},
+    "data": [{"id": 1, "parts": ["loc"]}, {"id": 2, "parts": []}],
+}
+
+
+def _app(provider):
+    with patch.object(TestingConfig, "JSON_PROVIDER", provider):
+        return create_app("testing")
+
+
+@pytest.mark.parametrize(
+    "provider,expected",
+    [
+        ("auto", ORJSONProvider),
+        ("orjson", ORJSONProvider),
+        ("stdlib", StdlibJSONProvider),
+    ],
+)
+def test_provider_is_selected_by_config(provider, expected):
+    assert type(_app(provider).json) is expected
+
+
+def test_missing_orjson_falls_back_to_stdlib():
+    with patch.object(json_provider, "orjson", None):
+        app = _app("orjson")
+
+    assert type(app.json) is StdlibJSONProvider
+
+
+def test_unknown_provider_is_rejected():
+    with pytest.raises(ValueError, match="JSON_PROVIDER"):
+        _app("simplejson")
+
+
+@pytest.mark.parametrize("provider", ["orjson", "stdlib"])
+def test_providers_encode_the_same_values(provider):
+    app = _app(provider)
+
+    with app.test_request_context():
+        response = jsonify(PAYLOAD)
+
+    assert response.mimetype == "application/json"
+    assert response.get_data().endswith(b"\n")
+    assert app.json.loads(response.get_data()) == EXPECTED
+    assert app.json.loads(app.json.dumps(PAYLOAD)) == EXPECTED
+
+
+def test_orjson_sorts_keys_and_writes_utf8():
+    orjson_app, stdlib_app = _app("orjson"), _app("stdlib")
+    data = {"b": 1, "a": ["măr"]}
+
+    assert orjson_app.json.dumps(data) == '{"a":["măr"],"b":1}'
+    # Options orjson does not have go through the standard library
+    assert orjson_app.json.dumps(data, separators=(",", ":")) == stdlib_app.json.dumps(
+        data, separators=(",", ":")
+    )
+
+
+def test_orjson_parses_request_bodies(client):
+    response = client.post(
+        "/api/groups",
+        data='{"name": "Legume", "description": "legume românești"}',
+        content_type="application/json",
+    )
+
+    assert response.status_code == 201
+    assert response.json["data"]["description"] == "legume românești"
+
+
+def test_raw_json_is_not_reencoded():
+    raw = RawJSON(b'{"b":1,"a":2}')
+
+    assert _app("orjson").json.dumps({"x": raw}) == '{"x":{"b":1,"a":2}}'
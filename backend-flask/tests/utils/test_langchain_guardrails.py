@@ -1,8 +1,14 @@
-from unittest.mock import MagicMock, patch
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.utils.langchain_guardrails import LangChainRomanianGuardrails
+from app.utils.langchain_guardrails import (
+    LangChainRomanianGuardrails,
+    _pack,
+    get_guardrails,
+)
 
 
 @pytest.fixture
@@ -17,6 +23,7 @@ def guardrails():
 
         guardrails.moderation_chain = mock_moderation_chain
         guardrails.formality_chain = mock_formality_chain
+        guardrails.batch_moderation_chain = MagicMock()
 
         return guardrails
 
@@ -61,3 +68,218 @@ def test_process_output_diacritics(guardrails):
     result = guardrails.process_output("Bucuresti este capitala Romaniei")
     assert "București" in result
     assert "României" in result
+
+
+def test_process_output_skips_formal_text(guardrails):
+    """Test text without informal forms never reaches the formality chain."""
+    result = guardrails.process_output("Mărul este un fruct. Para este dulce.")
+
+    assert result == "Mărul este un fruct. Para este dulce."
+    guardrails.formality_chain.invoke.assert_not_called()
+    guardrails.formality_chain.batch.assert_not_called()
+
+
+def test_process_output_rewrites_only_informal_sentences(guardrails):
+    """Test only flagged sentences are rewritten and stitched back in order."""
+    guardrails.formality_chain.batch.side_effect = lambda inputs: [
+        f"[{item['text']}]" for item in inputs
+    ]
+
+    result = guardrails.process_output(
+        "Mărul este roșu. Tu ai un măr? Para este dulce.\nCe faci?"
+    )
+
+    assert result == "Mărul este roșu. [Tu ai un măr?] Para este dulce.\n[Ce faci?]"
+    guardrails.formality_chain.batch.assert_called_once()
+    guardrails.formality_chain.invoke.assert_not_called()
+
+
+def _batch_replies(unsafe=(), broken=lambda texts: False):
+    """Fake batch moderation chain replies, one JSON array per prompt."""
+
+    def batch(inputs, config=None, return_exceptions=False):
+        replies = []
+        for item in inputs:
+            texts = [
+                json.loads(line.split(". ", 1)[1])
+                for line in item["texts"].splitlines()
+            ]
+            if broken(texts):
+                replies.append("Sorry, I cannot help with that.")
+                continue
+            verdicts = [
+                {"id": number, "verdict": "UNSAFE: insults" if t in unsafe else "SAFE"}
+                for number, t in enumerate(texts, 1)
+            ]
+            replies.append(json.dumps(verdicts))
+        return replies
+
+    return batch
+
+
+def test_moderate_batch_returns_verdicts_in_order(guardrails):
+    """Test batch moderation packs texts and reuses cache and duplicates."""
+    guardrails.batch_size = 2
+    guardrails.batch_moderation_chain.batch.side_effect = _batch_replies(
+        unsafe={"ești prost"}
+    )
+    guardrails.moderation_cache.set("Bună ziua", "SAFE")
+
+    verdicts = guardrails.moderate_batch(
+        ["Bună ziua", "Ce mai faci?", "ești prost", "ce mai faci?", "Mulțumesc"]
+    )
+
+    assert verdicts == ["SAFE", "SAFE", "UNSAFE: insults", "SAFE", "SAFE"]
+    (inputs,), kwargs = guardrails.batch_moderation_chain.batch.call_args
+    # Cached and duplicate texts are not sent; 3 texts fit in 2 prompts
+    assert len(inputs) == 2
+    assert kwargs["config"] == {"max_concurrency": guardrails.batch_concurrency}
+    guardrails.moderation_chain.invoke.assert_not_called()
+    assert guardrails.moderation_cache.get("Mulțumesc") == "SAFE"
+
+
+def test_moderate_batch_splits_unparseable_batches(guardrails):
+    """Test a bad reply splits the batch down to single texts."""
+    guardrails.batch_moderation_chain.batch.side_effect = _batch_replies(
+        broken=lambda texts: "spam spam" in texts
+    )
+    guardrails.moderation_chain.invoke.return_value = "UNSAFE: spam"
+
+    verdicts = guardrails.moderate_batch(["unu doi", "trei patru", "spam spam"])
+
+    assert verdicts == ["SAFE", "SAFE", "UNSAFE: spam"]
+    assert guardrails.batch_moderation_chain.batch.call_count == 3
+    guardrails.moderation_chain.invoke.assert_called_once_with({"text": "spam spam"})
+
+
+def test_moderate_batch_raises_llm_errors_without_splitting(guardrails):
+    """Test a failed call is raised instead of being retried in halves."""
+    guardrails.batch_size = 2
+
+    def batch(inputs, config=None, return_exceptions=False):
+        replies = _batch_replies()(inputs[:1])
+        return replies + [Exception("429 Too Many Requests")] * (len(inputs) - 1)
+
+    guardrails.batch_moderation_chain.batch.side_effect = batch
+
+    with pytest.raises(Exception, match="429"):
+        guardrails.moderate_batch(["unu", "doi", "trei", "patru"])
+
+    guardrails.batch_moderation_chain.batch.assert_called_once()
+    guardrails.moderation_chain.invoke.assert_not_called()
+    # The batch that did go through is kept for the next attempt
+    assert guardrails.moderation_cache.get("unu") == "SAFE"
+
+
+def test_pack_respects_token_budget():
+    """Test batches stay within the token budget and item limit."""
+    texts = ["a" * 400, "b" * 40, "c" * 40, "d" * 40]
+
+    assert _pack(texts, token_budget=120, max_items=10) == [
+        ["a" * 400],
+        ["b" * 40, "c" * 40, "d" * 40],
+    ]
+    assert _pack(texts[1:], token_budget=1000, max_items=2) == [
+        ["b" * 40, "c" * 40],
+        ["d" * 40],
+    ]
+
+
+def test_get_guardrails_shares_instance_per_key(app):
+    """Test the app builds one guardrails instance per API key and config."""
+    with patch("app.utils.langchain_guardrails.ChatOpenAI") as mock_llm:
+        with app.app_context():
+            first = get_guardrails()
+            assert get_guardrails() is first
+            assert get_guardrails(api_key="sk-other-key") is not first
+
+            app.config["GUARDRAILS"] = {**app.config["GUARDRAILS"], "x": 1}
+            assert get_guardrails() is not first
+
+    assert mock_llm.call_count == 3
+
+
+def test_get_guardrails_is_thread_safe(app):
+    """Test concurrent first requests build a single instance."""
+    with patch("app.utils.langchain_guardrails.ChatOpenAI"):
+
+        def fetch():
+            with app.app_context():
+                return get_guardrails()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: fetch(), range(32)))
+
+    assert len({id(instance) for instance in instances}) == 1
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_process_output_stream_releases_whole_words(guardrails):
+    """Test streamed diacritic correction never splits a word."""
+    stream = guardrails.aprocess_output_stream(
+        _chunks("Bucu", "resti este ca", "pitala Roma", "niei"), formal=False
+    )
+
+    pieces = await _collect(stream)
+
+    assert "".join(pieces) == "București este capitala României"
+    assert all(not piece[-1:].isalpha() for piece in pieces[:-1])
+
+
+@pytest.mark.asyncio
+async def test_process_output_stream_formalizes_per_sentence(guardrails):
+    """Test streamed formality rewriting runs once per sentence."""
+    guardrails.formality_chain.ainvoke = AsyncMock(
+        side_effect=lambda x: f"[{x['text']}]"
+    )
+    stream = guardrails.aprocess_output_stream(
+        _chunks("Tu ești stu", "dent. Tu ai o ", "carte!\nLocuiești în Bucuresti"),
+        formal=True,
+    )
+
+    pieces = await _collect(stream)
+
+    assert pieces == [
+        "[Tu ești student.] ",
+        "[Tu ai o carte!]\n",
+        "[Locuiești în București]",
+    ]
+    assert guardrails.formality_chain.ainvoke.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_process_output_stream_formality_fallback(guardrails):
+    """Test streamed formality falls back to replacements on chain errors."""
+    guardrails.formality_chain.ainvoke = AsyncMock(side_effect=Exception("API"))
+
+    pieces = await _collect(
+        guardrails.aprocess_output_stream(_chunks("tu ești aici. "), formal=True)
+    )
+
+    assert pieces == ["dumneavoastră sunteți aici. "]
+
+
+@pytest.mark.asyncio
+async def test_process_output_stream_skips_formal_sentences(guardrails):
+    """Test streamed sentences without informal forms are passed through."""
+    guardrails.formality_chain.ainvoke = AsyncMock(
+        side_effect=lambda x: f"[{x['text']}]"
+    )
+
+    pieces = await _collect(
+        guardrails.aprocess_output_stream(
+            _chunks("Mărul este roșu. Tu ai un măr?"), formal=True
+        )
+    )
+
+    assert pieces == ["Mărul este roșu. ", "[Tu ai un măr?]"]
+    assert guardrails.formality_chain.ainvoke.await_count == 1
@@ -0,0 +1,79 @@
+"""Tests for Prometheus metrics."""
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.utils.metrics import track_llm_call
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_requests_are_labelled_with_route_template(client):
+    endpoint = "/api/words/<int:word_id>"
+    before = _sample(
+        "backend_flask_requests_total", method="GET", endpoint=endpoint, status="200"
+    )
+
+    client.get("/api/words/1")
+    client.get("/api/words/2")
+
+    after = _sample(
+        "backend_flask_requests_total", method="GET", endpoint=endpoint, status="200"
+    )
+    assert after == before + 2
+    assert _sample("backend_flask_requests_in_progress") == 0
+
+
+def test_unmatched_paths_share_one_label(client):
+    before = _sample(
+        "backend_flask_requests_total",
+        method="GET",
+        endpoint="unmatched",
+        status="404",
+    )
+
+    client.get("/no/such/page/1")
+    client.get("/no/such/page/2")
+
+    after = _sample(
+        "backend_flask_requests_total",
+        method="GET",
+        endpoint="unmatched",
+        status="404",
+    )
+    assert after == before + 2
+
+
+def test_database_statements_are_timed(client):
+    before = _sample("backend_flask_db_query_seconds_count", statement="SELECT")
+
+    client.get("/api/words")
+
+    assert _sample("backend_flask_db_query_seconds_count", statement="SELECT") > before
+
+
+def test_llm_calls_are_timed():
+    before = _sample("backend_flask_llm_call_seconds_count", operation="test")
+
+    with track_llm_call("test"):
+        assert _sample("backend_flask_llm_calls_in_progress", operation="test") == 1
+    with pytest.raises(RuntimeError):
+        with track_llm_call("test"):
+            raise RuntimeError("upstream error")
+
+    assert _sample("backend_flask_llm_call_seconds_count", operation="test") == (
+        before + 2
+    )
+    assert _sample("backend_flask_llm_calls_in_progress", operation="test") == 0
+
+
+def test_metrics_endpoint(client):
+    for _ in range(60):
+        response = client.get("/metrics")
+
+    # Exempt from the default rate limits so scrapes are never refused
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    assert b"backend_flask_requests_total" in response.data
@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.utils.langchain_guardrails import LangChainRomanianGuardrails
+from app.utils.moderation_cache import ModerationCache, get_moderation_cache
+
+
+@pytest.fixture
+def guardrails():
+    with patch("app.utils.langchain_guardrails.ChatOpenAI"):
+        guardrails = LangChainRomanianGuardrails(
+            api_key="sk-test-key", moderation_cache=ModerationCache()
+        )
+    guardrails.moderation_chain = MagicMock()
+    guardrails.moderation_chain.invoke.return_value = "SAFE"
+    return guardrails
+
+
+def test_repeated_input_skips_moderation_chain(guardrails):
+    guardrails.validate_input("Cum se spune mulțumesc?")
+    # Case, spacing and decomposed diacritics do not change the key
+    guardrails.validate_input("  cum SE spune   mult\u0326umesc? ")
+
+    guardrails.moderation_chain.invoke.assert_called_once()
+    stats = guardrails.moderation_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_unsafe_verdict_is_cached(guardrails):
+    guardrails.moderation_chain.invoke.return_value = "UNSAFE: insults"
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="insults"):
+            guardrails.validate_input("Some inappropriate text")
+
+    guardrails.moderation_chain.invoke.assert_called_once()
+
+
+def test_lru_eviction():
+    cache = ModerationCache(max_size=2)
+    cache.set("first text", "SAFE")
+    cache.set("second text", "SAFE")
+    assert cache.get("first text") == "SAFE"
+    cache.set("third text", "SAFE")
+
+    assert cache.get("second text") is None
+    assert cache.get("first text") == "SAFE"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    cache = ModerationCache(ttl=60)
+    with patch("app.utils.text_cache.time.monotonic", return_value=0):
+        cache.set("some text", "SAFE")
+    with patch("app.utils.text_cache.time.monotonic", return_value=61):
+        assert cache.get("some text") is None
+
+    assert cache.stats()["expirations"] == 1
+
+
+def test_persistent_tier_survives_new_cache(tmp_path):
+    db_path = str(tmp_path / "moderation.db")
+    ModerationCache(db_path=db_path).set("some text", "SAFE")
+
+    cache = ModerationCache(db_path=db_path)
+
+    assert cache.get("some text") == "SAFE"
+    assert cache.stats()["persistentHits"] == 1
+
+
+def test_persistent_hit_keeps_its_expiry(tmp_path):
+    db_path = str(tmp_path / "moderation.db")
+    with patch("app.utils.text_cache.time.time", return_value=1000):
+        ModerationCache(ttl=60, db_path=db_path).set("some text", "SAFE")
+
+    cache = ModerationCache(ttl=60, db_path=db_path)
+    with patch("app.utils.text_cache.time.time", return_value=1050), patch(
+        "app.utils.text_cache.time.monotonic", return_value=0
+    ):
+        assert cache.get("some text") == "SAFE"
+    # 10 seconds were left when the entry was promoted to memory
+    with patch("app.utils.text_cache.time.monotonic", return_value=11):
+        assert cache.get("some text") is None
+
+
+def test_app_cache_is_shared_and_reported(app, client):
+    with app.app_context():
+        cache = get_moderation_cache()
+        assert get_moderation_cache() is cache
+        cache.set("some text", "SAFE")
+        cache.get("some text")
+
+    data = client.get("/api/health").get_json()
+
+    assert data["moderationCache"]["hits"] == 1
+
+
+def test_app_cache_is_namespaced_by_model(app, client):
+    # Whoever builds the shared cache first, keys include the model
+    client.get("/api/health")
+
+    with app.app_context():
+        cache = get_moderation_cache()
+
+    assert cache.namespace == app.config["MODERATION_MODEL"] == "gpt-3.5-turbo"
@@ -0,0 +1,91 @@
+"""Tests for the versioned SQL migrations."""
+
+import json
+import shutil
+import sqlite3
+
+from app.utils.schema_migrations import (
+    MIGRATIONS_DIR,
+    apply_migrations,
+    migration_files,
+)
+
+
+def _search(conn, query):
+    return [
+        romanian
+        for (romanian,) in conn.execute(
+            "SELECT words.romanian FROM words_fts "
+            "JOIN words ON words.id = words_fts.rowid "
+            "WHERE words_fts MATCH ? ORDER BY rank",
+            (query,),
+        )
+    ]
+
+
+def test_migrations_run_once(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "app.db"))
+
+    assert apply_migrations(conn) == migration_files()
+    assert apply_migrations(conn) == []
+
+
+def test_search_index_covers_existing_words(tmp_path):
+    """Words added before the search migration are indexed, escaped parts too."""
+    directory = tmp_path / "migrations"
+    directory.mkdir()
+    for filename in migration_files():
+        if filename < "006":
+            shutil.copy(f"{MIGRATIONS_DIR}/{filename}", directory)
+    conn = sqlite3.connect(str(tmp_path / "app.db"))
+    apply_migrations(conn, str(directory))
+    conn.execute(
+        "INSERT INTO words (romanian, english, part_of_speech, parts) "
+        "VALUES ('copac', 'tree', 'noun', ?)",
+        (json.dumps(["pădure"]),),
+    )
+    conn.commit()
+
+    apply_migrations(conn)
+
+    assert conn.execute("SELECT parts FROM words").fetchone() == ('["pădure"]',)
+    assert _search(conn, "padure") == ["copac"]
+    conn.execute("UPDATE words SET romanian = 'brad'")
+    assert _search(conn, "copac") == []
+    assert _search(conn, "brad") == ["brad"]
+
+
+def _schema(conn):
+    """Columns of every table, and the names of indexes and triggers."""
+    objects = conn.execute(
+        "SELECT type, name FROM sqlite_master "
+        "WHERE name NOT LIKE 'sqlite_%' AND name NOT LIKE 'words_fts_%' "
+        "ORDER BY type, name"
+    ).fetchall()
+    columns = {
+        name: [row[1:3] for row in conn.execute(f"PRAGMA table_info('{name}')")]
+        for kind, name in objects
+        if kind == "table"
+    }
+    return objects, columns
+
+
+def test_upgrades_database_from_before_versions(tmp_path):
+    """A database built by the unversioned migrate task reaches the current schema."""
+    conn = sqlite3.connect(str(tmp_path / "old.db"))
+    for filename in ("001_init.sql", "002_create_tables.sql"):
+        with open(f"{MIGRATIONS_DIR}/{filename}") as sql_file:
+            conn.executescript(sql_file.read())
+    conn.execute(
+        "INSERT INTO words (romanian, english, part_of_speech, parts) "
+        "VALUES ('măr', 'apple', 'noun', '[]')"
+    )
+    conn.commit()
+
+    assert apply_migrations(conn) == migration_files()
+
+    fresh = sqlite3.connect(str(tmp_path / "new.db"))
+    apply_migrations(fresh)
+    assert _schema(conn) == _schema(fresh)
+    assert conn.execute("SELECT total_words FROM dashboard_stats").fetchone() == (1,)
+    assert _search(conn, "mar") == ["măr"]
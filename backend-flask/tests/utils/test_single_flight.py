@@ -0,0 +1,162 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.utils.single_flight import SingleFlight
+
+
+def _wait_for_followers(flight, count):
+    while flight.coalesced < count:
+        threading.Event().wait(0.001)
+
+
+def test_concurrent_calls_share_one_upstream_call():
+    flight = SingleFlight("moderation")
+    calls = []
+
+    def moderate(text):
+        calls.append(text)
+        _wait_for_followers(flight, 4)
+        return {"verdict": "SAFE"}
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(
+            pool.map(lambda _: flight.do("key", moderate, "salut"), range(5))
+        )
+
+    assert calls == ["salut"]
+    assert results == [{"verdict": "SAFE"}] * 5
+    # Followers get copies, so one caller's changes do not leak to another
+    assert len({id(result) for result in results}) == 5
+    assert flight.stats() == {"calls": 1, "coalesced": 4, "inFlight": 0}
+
+
+def test_exception_is_shared():
+    flight = SingleFlight()
+
+    def fail():
+        _wait_for_followers(flight, 1)
+        raise RuntimeError("rate limited")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(flight.do, "key", fail) for _ in range(2)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="rate limited"):
+            future.result()
+    # Later calls start a new upstream call
+    assert flight.do("key", lambda: "ok") == "ok"
+    assert flight.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_async_calls_share_one_upstream_call():
+    flight = SingleFlight()
+    calls = []
+    release = asyncio.Event()
+
+    async def formalize(text):
+        calls.append(text)
+        await release.wait()
+        return text.upper()
+
+    tasks = [
+        asyncio.ensure_future(flight.ado(text, formalize, text))
+        for text in ["tu ești", "tu ești", "tu ai"]
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["TU EȘTI", "TU EȘTI", "TU AI"]
+    assert sorted(calls) == ["tu ai", "tu ești"]
+    assert flight.stats() == {"calls": 2, "coalesced": 1, "inFlight": 0}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_leaves_shared_call_running():
+    flight = SingleFlight()
+    started = asyncio.Event()
+    release = asyncio.Event()
+    cancelled = []
+
+    async def generate():
+        started.set()
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "verbs"
+
+    first = asyncio.ensure_future(flight.ado("key", generate))
+    second = asyncio.ensure_future(flight.ado("key", generate))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled
+    release.set()
+    assert await second == "verbs"
+
+    # Once every caller is gone the upstream call is cancelled
+    release.clear()
+    started.clear()
+    lone = asyncio.ensure_future(flight.ado("key", generate))
+    await started.wait()
+    lone.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await lone
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert cancelled == [True]
+    assert flight.stats()["inFlight"] == 0
+
+
+def test_leader_changes_do_not_reach_followers():
+    flight = SingleFlight()
+
+    def generate():
+        _wait_for_followers(flight, 1)
+        return {"response": "raw"}
+
+    def lead():
+        result = flight.do("key", generate)
+        # Post-process in place, as the generate route does, before the
+        # follower has woken up to copy the result
+        result["response"] = "processed"
+        return result
+
+    def follow():
+        while not flight.calls:
+            threading.Event().wait(0.001)
+        return flight.do("key", generate)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(lead)
+        follower = pool.submit(follow)
+
+    assert leader.result() == {"response": "processed"}
+    assert follower.result() == {"response": "raw"}
+
+
+@pytest.mark.asyncio
+async def test_async_callers_each_get_a_copy():
+    flight = SingleFlight()
+
+    async def generate():
+        await asyncio.sleep(0)
+        return {"response": "raw"}
+
+    async def call_and_process():
+        result = await flight.ado("key", generate)
+        result["response"] = "processed"
+        return result
+
+    leader = asyncio.ensure_future(call_and_process())
+    follower = asyncio.ensure_future(flight.ado("key", generate))
+
+    assert await leader == {"response": "processed"}
+    assert await follower == {"response": "raw"}
+    assert flight.stats()["coalesced"] == 1
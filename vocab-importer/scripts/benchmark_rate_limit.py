@@ -0,0 +1,83 @@
+"""Benchmark the rate limiter under many distinct clients.
+
+Compares the previous limiter (one dict of every client ever seen, guarded
+by a global ``asyncio.Lock``) with the sharded token buckets used for
+``memory://`` storage, sending hits from 10k distinct client addresses from
+concurrent tasks. No HTTP requests are made.
+
+Usage:
+    poetry run python scripts/benchmark_rate_limit.py [clients] [hits]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.middleware.rate_limit_storage import TokenBucketLimiter  # noqa: E402
+
+TASKS = 100
+
+
+class GlobalLockLimiter:
+    """The previous implementation: fixed window, one lock, no eviction."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.requests = {}
+        self.lock = asyncio.Lock()
+        self.acquisitions = 0
+
+    async def hit(self, key: str) -> bool:
+        async with self.lock:
+            self.acquisitions += 1
+            now = time.time()
+            last_time, count = self.requests.get(key, (now, 0))
+            if now - last_time >= 60:
+                last_time, count = now, 0
+            if count >= self.limit:
+                return False
+            self.requests[key] = (last_time, count + 1)
+            return True
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+
+async def _run(limiter, clients: int, hits: int) -> float:
+    addresses = [f"10.{i // 65536}.{i // 256 % 256}.{i % 256}" for i in range(clients)]
+
+    async def worker(offset: int) -> None:
+        for i in range(offset, hits, TASKS):
+            await limiter.hit(addresses[i % clients])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(offset) for offset in range(TASKS)))
+    return time.perf_counter() - start
+
+
+async def main(clients: int = 10_000, hits: int = 200_000) -> None:
+    before = GlobalLockLimiter(limit=100)
+    before_time = await _run(before, clients, hits)
+
+    after = TokenBucketLimiter(limit=100, max_clients=clients // 2)
+    after_time = await _run(after, clients, hits)
+
+    print(f"{hits} hits from {clients} clients over {TASKS} concurrent tasks")
+    print(f"  global lock: {hits / before_time:12.0f} hits/s")
+    print(f"               {len(before):12d} clients tracked (unbounded)")
+    print(f"               {before.acquisitions:12d} lock acquisitions")
+    print(f"  token bucket:{hits / after_time:12.0f} hits/s")
+    print(f"               {len(after):12d} clients tracked (cap {clients // 2})")
+    print(f"               {0:12d} lock acquisitions")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+            int(sys.argv[2]) if len(sys.argv) > 2 else 200_000,
+        )
+    )
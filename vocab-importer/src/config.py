@@ -14,15 +14,31 @@ class Settings(BaseSettings):
     BACKEND_URL: str = "http://localhost:5000"
     FRONTEND_URL: str = "http://localhost:5173"
 
+    # Backend connection pool
+    BACKEND_MAX_CONNECTIONS: int = 100
+    BACKEND_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    BACKEND_KEEPALIVE_EXPIRY: float = 30.0  # seconds
+    BACKEND_HTTP2: bool = True  # used when the h2 package is installed
+
     # File settings
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_EXTENSIONS: Set[str] = {"json", "txt", "csv", "pdf"}
 
+    # Background import jobs
+    IMPORT_BATCH_SIZE: int = 1000  # words pushed to the backend per request
+    IMPORT_JOB_DIR: str | None = None  # where uploads are spooled, default tmp
+    IMPORT_JOB_HISTORY: int = 100  # finished jobs kept for status lookups
+
     # Service settings
     LOG_LEVEL: str = "INFO"
     WORKERS: int = 4
     TIMEOUT: int = 60
-    RATE_LIMIT: int = 100  # requests per minute
+    RATE_LIMIT: int = 100  # requests per window
+    RATE_LIMIT_WINDOW: int = 60  # seconds
+    RATE_LIMIT_MAX_CLIENTS: int = 100_000  # clients tracked with memory://
+    # memory://, sqlite:///limits.db or redis://host:6379/0; a redis:// URI
+    # can be shared with the backend's RATELIMIT_STORAGE_URI
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
 
     # LLM settings
     LLM_ENABLED: bool = False
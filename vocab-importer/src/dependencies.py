@@ -1,13 +1,12 @@
-from typing import AsyncGenerator
-
 from httpx import AsyncClient
 
 from .config import Settings
+from .services.http_client import get_client
 
 
-async def get_http_client() -> AsyncGenerator[AsyncClient, None]:
-    async with AsyncClient() as client:
-        yield client
+async def get_http_client() -> AsyncClient:
+    """Inject the app-wide pooled backend client."""
+    return get_client()
 
 
 async def get_settings() -> Settings:
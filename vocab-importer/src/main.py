@@ -1,19 +1,32 @@
 import json
 import logging
 import os
-import tempfile
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict
-
-from fastapi import FastAPI, File, HTTPException, Request, UploadFile, status
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import (
+    BackgroundTasks,
+    FastAPI,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from openai import AsyncOpenAI
 
 from .config import Settings
 from .errors.exceptions import FileProcessingError, VocabImporterError
-from .services.backend_service import get_vocabulary, save_vocabulary
+from .middleware.rate_limit import RateLimiter
+from .monitoring import MetricsMiddleware, metrics_endpoint, track_llm_call
+from .services import http_client
+from .services.backend_service import save_vocabulary, stream_vocabulary
 from .services.file_processor import process_file
+from .services.import_jobs import ImportJobManager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,12 +42,31 @@ def get_openai_client():
 
 def create_app() -> FastAPI:
     settings = Settings()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # One pooled client for all backend calls, kept alive across requests
+        app.state.http_client = await http_client.open_client(settings)
+        await rate_limiter.start()
+        yield
+        await http_client.close_client()
+        await rate_limiter.close()
+
     app = FastAPI(
         title="Vocab Importer Service",
         description="Microservice for importing vocabulary files",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
+    import_jobs = ImportJobManager(settings)
+    app.state.import_jobs = import_jobs
+
+    rate_limiter = RateLimiter(settings)
+    app.middleware("http")(rate_limiter)
+    # Outside the rate limiter, so refused requests are counted too
+    app.middleware("http")(MetricsMiddleware())
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[settings.FRONTEND_URL],
@@ -52,20 +84,29 @@ def create_app() -> FastAPI:
             status_code=500, content={"detail": "Internal server error"}
         )
 
+    app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
+
     @app.get("/health")
     async def health_check() -> Dict[str, str]:
         return {"status": "healthy"}
 
     @app.post("/import", status_code=status.HTTP_201_CREATED)
     async def import_vocabulary(
+        background_tasks: BackgroundTasks,
         file: UploadFile = File(
             default=None,
             description="Vocabulary file to import (.json, .txt, .csv, .pdf)",
-        )
+        ),
+        background: bool = Query(
+            False, description="Import as a background job and return its id"
+        ),
     ) -> Dict[str, str]:
         """
         Import vocabulary from file.
 
+        With ``background=true`` the file is queued as an import job and the
+        response (202) carries the job id to poll at ``/import/{job_id}``.
+
         Raises:
             400: Invalid file or format
             413: File too large
@@ -107,6 +148,15 @@ def create_app() -> FastAPI:
                     status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
                 )
 
+            if background:
+                job = await import_jobs.create_job(file)
+                background_tasks.add_task(import_jobs.run_job, job.id)
+                logger.info(f"Queued import job {job.id} for {file.filename}")
+                return JSONResponse(
+                    status_code=status.HTTP_202_ACCEPTED,
+                    content={"job_id": job.id, "status_url": f"/import/{job.id}"},
+                )
+
             # Validate file size
             try:
                 file_size = 0
@@ -164,77 +214,60 @@ def create_app() -> FastAPI:
                 detail="Internal server error during import",
             )
 
+    @app.get("/import/{job_id}")
+    async def get_import_job(job_id: str) -> Dict[str, Any]:
+        """Get the progress of a background import job."""
+        job = import_jobs.get_job(job_id)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Import job {job_id} not found",
+            )
+        return job.model_dump(mode="json")
+
+    @app.post("/import/{job_id}/resume", status_code=status.HTTP_202_ACCEPTED)
+    async def resume_import_job(
+        job_id: str, background_tasks: BackgroundTasks
+    ) -> Dict[str, Any]:
+        """Resume a failed import job from its last committed batch."""
+        try:
+            job = import_jobs.resume_job(job_id)
+        except VocabImporterError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+        background_tasks.add_task(import_jobs.run_job, job.id)
+        return job.model_dump(mode="json")
+
     @app.get("/export")
-    async def export_vocabulary() -> FileResponse:
-        """Export vocabulary as JSON file."""
-        temp_file = None
+    async def export_vocabulary() -> StreamingResponse:
+        """Export vocabulary as newline-delimited JSON.
+
+        The backend export is piped through as it arrives, so nothing is
+        buffered in memory or written to disk.
+        """
         try:
-            # Get vocabulary from backend
             try:
-                vocabulary_data = await get_vocabulary()
-                if not vocabulary_data:
-                    raise VocabImporterError("No data received from backend")
+                chunks = await stream_vocabulary()
             except VocabImporterError as e:
-                raise e
-            except Exception as e:
                 raise VocabImporterError(
-                    f"Error fetching from backend: {str(e)}",
-                    status_code=status.HTTP_502_BAD_GATEWAY,
+                    str(e.detail), status_code=status.HTTP_502_BAD_GATEWAY
                 )
 
-            # Create temporary file
-            try:
-                temp_file = tempfile.NamedTemporaryFile(
-                    mode="w+", suffix=".json", delete=False, encoding="utf-8"
-                )
+            # Generate filename with timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"vocabulary_export_{timestamp}.ndjson"
 
-                # Ensure data is serializable
-                if not isinstance(vocabulary_data, (dict, list)):
-                    raise FileProcessingError(
-                        "Invalid data format received from backend",
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    )
-
-                # Write data to file
-                json.dump(vocabulary_data, temp_file, indent=2, ensure_ascii=False)
-                temp_file.flush()
-                os.fsync(temp_file.fileno())  # Ensure data is written to disk
-                temp_file.close()
-
-                # Generate filename with timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"vocabulary_export_{timestamp}.json"
-
-                # Create async cleanup function
-                async def cleanup_file():
-                    try:
-                        if os.path.exists(temp_file.name):
-                            os.unlink(temp_file.name)
-                    except Exception as e:
-                        logger.error(f"Error cleaning up temp file: {e}")
-
-                return FileResponse(
-                    path=temp_file.name,
-                    filename=filename,
-                    media_type="application/json",
-                    background=cleanup_file,  # Pass the async function directly
-                )
-
-            except Exception as e:
-                if temp_file and os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
-                raise FileProcessingError(
-                    f"Error creating export file: {str(e)}",
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
+            return StreamingResponse(
+                chunks,
+                media_type="application/x-ndjson",
+                headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            )
 
         except VocabImporterError as e:
             logger.error(f"Export error: {e.status_code}: {str(e)}")
             raise HTTPException(status_code=e.status_code, detail=str(e))
         except Exception as e:
             logger.error(f"Unexpected export error: {str(e)}", exc_info=True)
-            if temp_file and os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Internal server error during export",
@@ -246,7 +279,7 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-def generate_vocab_with_openai(prompt=None):
+async def generate_vocab_with_openai(prompt=None):
     """Generate vocabulary with OpenAI."""
     try:
         if os.getenv("DEVELOPMENT_MODE") == "true":
@@ -265,18 +298,21 @@ def generate_vocab_with_openai(prompt=None):
                 "a list of words. Return the output in valid JSON format."
             )
 
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an assistant that generates vocabulary groups.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.7,
-            max_tokens=300,
-        )
+        with track_llm_call("generate_vocab"):
+            response = await client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": (
+                            "You are an assistant that generates vocabulary groups."
+                        ),
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.7,
+                max_tokens=300,
+            )
 
         try:
             return json.loads(response.choices[0].message.content)
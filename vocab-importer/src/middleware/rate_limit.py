@@ -1,35 +1,69 @@
-import asyncio
-import time
+from math import ceil
 from typing import Callable
+from urllib.parse import urlparse
 
-from fastapi import HTTPException, Request
+from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from ..config import Settings
-
-settings = Settings()
+from .rate_limit_storage import (
+    RateLimitResult,
+    SlidingWindowLimiter,
+    TokenBucketLimiter,
+    storage_from_uri,
+)
 
 
 class RateLimiter:
-    def __init__(self):
-        self.requests = {}
-        self.lock = asyncio.Lock()
+    """Per-client request limit.
+
+    With the default ``memory://`` storage each process keeps a bounded set
+    of token buckets. With a shared ``RATE_LIMIT_STORAGE_URI`` every worker
+    process draws from the same sliding window quota instead.
+    """
+
+    def __init__(self, settings: Settings | None = None):
+        settings = settings or Settings()
+        uri = settings.RATE_LIMIT_STORAGE_URI
+        if urlparse(uri).scheme == "memory":
+            self.limiter = TokenBucketLimiter(
+                limit=settings.RATE_LIMIT,
+                window=settings.RATE_LIMIT_WINDOW,
+                max_clients=settings.RATE_LIMIT_MAX_CLIENTS,
+            )
+        else:
+            self.limiter = SlidingWindowLimiter(
+                storage_from_uri(uri),
+                limit=settings.RATE_LIMIT,
+                window=settings.RATE_LIMIT_WINDOW,
+            )
 
     async def __call__(self, request: Request, call_next: Callable) -> JSONResponse:
-        client_ip = request.client.host
-
-        async with self.lock:
-            now = time.time()
-            if client_ip in self.requests:
-                last_time, count = self.requests[client_ip]
-                if now - last_time < 60:  # 1 minute window
-                    if count >= settings.RATE_LIMIT:
-                        raise HTTPException(status_code=429, detail="Too many requests")
-                    self.requests[client_ip] = (last_time, count + 1)
-                else:
-                    self.requests[client_ip] = (now, 1)
-            else:
-                self.requests[client_ip] = (now, 1)
+        client_ip = request.client.host if request.client else "unknown"
+
+        result = await self.limiter.hit(client_ip)
+        if not result.allowed:
+            headers = self._headers(result)
+            headers["Retry-After"] = str(max(1, ceil(result.retry_after)))
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests"},
+                headers=headers,
+            )
 
         response = await call_next(request)
+        response.headers.update(self._headers(result))
         return response
+
+    @staticmethod
+    def _headers(result: RateLimitResult) -> dict:
+        return {
+            "X-RateLimit-Limit": str(result.limit),
+            "X-RateLimit-Remaining": str(result.remaining),
+        }
+
+    async def start(self) -> None:
+        await self.limiter.start()
+
+    async def close(self) -> None:
+        await self.limiter.close()
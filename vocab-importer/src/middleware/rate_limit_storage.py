@@ -0,0 +1,322 @@
+"""Rate limit counters and limiting algorithms.
+
+Counters are kept in a pluggable storage chosen by URI:
+
+- ``memory://``: per process, for tests and single-worker runs; kept as
+  :class:`TokenBucketLimiter` buckets rather than a storage
+- ``sqlite:///path/to/limits.db``: a file shared by the workers of one host;
+  flask-limiter has no such scheme, so the backend cannot share it
+- ``redis://host:6379/0``: any Redis-compatible server; the backend's
+  flask-limiter takes the same URI, so every worker of both services can
+  share one store (needs the ``redis`` package)
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from math import floor
+from typing import List, NamedTuple, Optional
+from urllib.parse import urlparse
+
+DEFAULT_SHARDS = 64
+SWEEP_EVERY = 1024  # counter updates between sweeps of expired keys
+DEFAULT_MAX_CLIENTS = 100_000  # keys tracked by the in-process token buckets
+EXPIRE_INTERVAL = 5.0  # seconds between background sweeps of idle buckets
+
+# DECR on a missing key would create it at -1 with no TTL, so only decrement
+# a live counter; DECR keeps the TTL of an existing key
+_REDIS_DECR = """
+if tonumber(redis.call('GET', KEYS[1]) or '0') > 0 then
+    redis.call('DECR', KEYS[1])
+end
+"""
+
+
+class RateLimitStorage(ABC):
+    """Counters that expire, keyed by string."""
+
+    @abstractmethod
+    async def incr(self, key: str, expiry: float) -> int:
+        """Add one to ``key``, starting it at 0 for ``expiry`` seconds if unset."""
+
+    @abstractmethod
+    async def decr(self, key: str) -> None:
+        """Take one from ``key`` if it is above 0."""
+
+    @abstractmethod
+    async def get(self, key: str) -> int:
+        """Current count of ``key``, 0 if unset or expired."""
+
+    async def close(self) -> None:
+        pass
+
+
+class SQLiteStorage(RateLimitStorage):
+    """Counters in a SQLite file, shared by the processes of one host.
+
+    Queries run in a worker thread so the event loop is not blocked while
+    SQLite waits for the file lock.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._updates = 0
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            "key TEXT PRIMARY KEY, count INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def _incr(self, key: str, expiry: float) -> int:
+        now = time.time()
+        with self._lock:
+            (count,) = self._db.execute(
+                "INSERT INTO rate_limits VALUES (?, 1, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "count = CASE WHEN expires_at <= ? THEN 1 ELSE count + 1 END, "
+                "expires_at = CASE WHEN expires_at <= ? "
+                "THEN excluded.expires_at ELSE expires_at END "
+                "RETURNING count",
+                (key, now + expiry, now, now),
+            ).fetchone()
+            self._updates += 1
+            if self._updates % SWEEP_EVERY == 0:
+                self._db.execute(
+                    "DELETE FROM rate_limits WHERE expires_at <= ?", (now,)
+                )
+            self._db.commit()
+        return count
+
+    def _decr(self, key: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE rate_limits SET count = count - 1 "
+                "WHERE key = ? AND count > 0",
+                (key,),
+            )
+            self._db.commit()
+
+    def _get(self, key: str) -> int:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else 0
+
+    async def incr(self, key: str, expiry: float) -> int:
+        return await asyncio.to_thread(self._incr, key, expiry)
+
+    async def decr(self, key: str) -> None:
+        await asyncio.to_thread(self._decr, key)
+
+    async def get(self, key: str) -> int:
+        return await asyncio.to_thread(self._get, key)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class RedisStorage(RateLimitStorage):
+    """Counters in a Redis-compatible server (Redis, Valkey, KeyDB, ...)."""
+
+    def __init__(self, uri: str):
+        try:
+            from redis import asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis package is required for redis:// rate limit storage"
+            ) from e
+        self._redis = redis.from_url(uri)
+        self._decr = self._redis.register_script(_REDIS_DECR)
+
+    async def incr(self, key: str, expiry: float) -> int:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            # Only a new key gets the expiry, so the window does not slide
+            pipe.set(key, 0, ex=max(1, int(expiry)), nx=True)
+            pipe.incr(key)
+            _, count = await pipe.execute()
+        return count
+
+    async def decr(self, key: str) -> None:
+        await self._decr(keys=[key])
+
+    async def get(self, key: str) -> int:
+        value = await self._redis.get(key)
+        return int(value) if value else 0
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def storage_from_uri(uri: str) -> RateLimitStorage:
+    """Create the storage for a ``sqlite://`` or ``redis://`` URI."""
+    scheme = urlparse(uri).scheme
+    if scheme == "sqlite":
+        # Like SQLAlchemy: sqlite:///relative.db, sqlite:////absolute.db
+        path = uri.removeprefix("sqlite:///")
+        if path == uri or not path:
+            raise ValueError(f"No database path in rate limit storage: {uri}")
+        return SQLiteStorage(path)
+    if scheme in ("redis", "rediss", "unix"):
+        return RedisStorage(uri)
+    raise ValueError(f"Unsupported rate limit storage: {uri}")
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # seconds until a refused key may try again
+
+
+class SlidingWindowLimiter:
+    """Sliding window counter: ``limit`` hits per ``window`` seconds per key.
+
+    Each key has a counter per fixed window. A hit is allowed if the current
+    window's count plus the previous window's count, weighted by how much
+    of the previous window still overlaps the sliding window, stays within
+    the limit. This is the ``sliding-window-counter`` strategy of the
+    ``limits`` package: two counters per key, no per-request timestamps.
+    """
+
+    def __init__(
+        self,
+        storage: RateLimitStorage,
+        limit: int,
+        window: float = 60,
+        prefix: str = "vocab-importer",
+    ):
+        self.storage = storage
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+
+    async def hit(self, key: str) -> RateLimitResult:
+        now = time.time()
+        index = int(now // self.window)
+        current_key = f"{self.prefix}/{key}/{index}"
+        previous_key = f"{self.prefix}/{key}/{index - 1}"
+        elapsed = now - index * self.window
+
+        previous = await self.storage.get(previous_key)
+        weighted = previous * (1 - elapsed / self.window)
+        current = await self.storage.get(current_key)
+        if floor(weighted + current) + 1 > self.limit:
+            return self._refused(previous, current, elapsed)
+
+        current = await self.storage.incr(current_key, 2 * self.window)
+        used = floor(weighted + current)
+        if used > self.limit:
+            # Another worker took the last slot between the check and the hit
+            await self.storage.decr(current_key)
+            return self._refused(previous, current - 1, elapsed)
+        return RateLimitResult(True, self.limit, self.limit - used, 0.0)
+
+    def _refused(self, previous: int, current: int, elapsed: float) -> RateLimitResult:
+        if current < self.limit and previous:
+            # Wait until the previous window's share drops below the room left
+            overlap = (self.limit - current) / previous
+            retry_after = (1 - overlap) * self.window - elapsed
+        else:
+            retry_after = self.window - elapsed
+        return RateLimitResult(False, self.limit, 0, max(retry_after, 0.0))
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        await self.storage.close()
+
+
+class TokenBucketLimiter:
+    """Token bucket per key, kept in process memory.
+
+    Each bucket holds up to ``limit`` tokens and refills at ``limit /
+    window`` tokens a second; a hit takes one token. Keys are hashed to
+    ``shards`` LRU dicts that together track at most ``max_clients`` keys,
+    evicting the least recently seen key when a shard is full. A background
+    task drops buckets idle for a whole window, since a full bucket is the
+    same as none.
+
+    Buckets are only read and written on the event loop and never across an
+    ``await``, so no lock is needed and clients never wait on each other.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: float = 60,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        shards: int = DEFAULT_SHARDS,
+        expire_interval: float = EXPIRE_INTERVAL,
+    ):
+        self.limit = limit
+        self.window = window
+        self.rate = limit / window
+        self.expire_interval = expire_interval
+        self.evictions = 0
+        self._shards: List[OrderedDict] = [OrderedDict() for _ in range(shards)]
+        self._shard_size = max(1, max_clients // shards)
+        self._expiry_task: Optional[asyncio.Task] = None
+
+    async def hit(self, key: str) -> RateLimitResult:
+        return self.take(key, time.monotonic())
+
+    def take(self, key: str, now: float) -> RateLimitResult:
+        """Take a token from ``key``'s bucket at time ``now``."""
+        shard = self._shards[hash(key) % len(self._shards)]
+        bucket = shard.get(key)
+        if bucket is None:
+            tokens = float(self.limit)
+            if len(shard) >= self._shard_size:
+                shard.popitem(last=False)
+                self.evictions += 1
+        else:
+            tokens, updated = bucket
+            tokens = min(self.limit, tokens + (now - updated) * self.rate)
+            shard.move_to_end(key)
+
+        if tokens < 1:
+            shard[key] = (tokens, now)
+            return RateLimitResult(False, self.limit, 0, (1 - tokens) / self.rate)
+        tokens -= 1
+        shard[key] = (tokens, now)
+        return RateLimitResult(True, self.limit, int(tokens), 0.0)
+
+    def expire(self, now: Optional[float] = None) -> None:
+        """Drop the buckets of keys idle for at least a window."""
+        now = time.monotonic() if now is None else now
+        for shard in self._shards:
+            # Shards are in order of last use, so stop at the first recent key
+            while shard:
+                key, (_, updated) = next(iter(shard.items()))
+                if now - updated < self.window:
+                    break
+                del shard[key]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    async def _expire_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.expire_interval)
+            self.expire()
+
+    async def start(self) -> None:
+        """Start expiring idle buckets in the background."""
+        if self._expiry_task is None:
+            self._expiry_task = asyncio.create_task(self._expire_forever())
+
+    async def close(self) -> None:
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+            self._expiry_task = None
@@ -1,6 +1,19 @@
 import time
+from contextlib import contextmanager
+from typing import Iterator
 
-from prometheus_client import Counter, Histogram
+from fastapi import Request, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from starlette.routing import Match
+
+# Label for requests that matched no route, so unknown paths share one series
+UNMATCHED = "unmatched"
 
 REQUEST_COUNT = Counter(
     "vocab_importer_requests_total",
@@ -14,20 +27,93 @@ REQUEST_LATENCY = Histogram(
     ["method", "endpoint"],
 )
 
+REQUESTS_IN_PROGRESS = Gauge(
+    "vocab_importer_requests_in_progress",
+    "Requests currently being handled",
+)
+
+PARSE_LATENCY = Histogram(
+    "vocab_importer_parse_seconds",
+    "Time spent parsing uploaded files in seconds",
+    ["content_type"],
+)
+
+BACKEND_CALL_LATENCY = Histogram(
+    "vocab_importer_backend_call_seconds",
+    "Backend call time in seconds, until the response headers arrive",
+    ["method", "endpoint", "status"],
+)
+
+LLM_CALL_LATENCY = Histogram(
+    "vocab_importer_llm_call_seconds",
+    "LLM call time in seconds",
+    ["operation"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+
+LLM_CALLS_IN_PROGRESS = Gauge(
+    "vocab_importer_llm_calls_in_progress",
+    "LLM calls currently waiting for a reply",
+    ["operation"],
+)
+
+BACKEND_POOL_IN_USE = Gauge(
+    "vocab_importer_backend_pool_connections_in_use",
+    "Backend requests currently holding a pooled connection",
+)
+
+BACKEND_POOL_SATURATION = Gauge(
+    "vocab_importer_backend_pool_saturation",
+    "Share of the backend connection pool in use (0-1)",
+)
+
+
+@contextmanager
+def track_llm_call(operation: str) -> Iterator[None]:
+    """Time an LLM call and count it as in progress while it runs."""
+    with LLM_CALLS_IN_PROGRESS.labels(operation=operation).track_inprogress():
+        with LLM_CALL_LATENCY.labels(operation=operation).time():
+            yield
+
+
+def metrics_endpoint() -> Response:
+    """Expose all metrics in the Prometheus text format."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+def _endpoint(request: Request) -> str:
+    route = request.scope.get("route")
+    if route is None:
+        # Refused before routing (e.g. rate limited): match the route here
+        for candidate in request.app.router.routes:
+            if candidate.matches(request.scope)[0] == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", UNMATCHED)
+
 
 class MetricsMiddleware:
-    async def __call__(self, request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
+    """Count and time requests by route template.
+
+    The route is read after the request is handled, so ``/import/{job_id}``
+    is one series however many jobs are polled.
+    """
 
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code,
-        ).inc()
+    async def __call__(self, request: Request, call_next):
+        start_time = time.perf_counter()
+        status = 500
+        with REQUESTS_IN_PROGRESS.track_inprogress():
+            try:
+                response = await call_next(request)
+                status = response.status_code
+                return response
+            finally:
+                endpoint = _endpoint(request)
 
-        REQUEST_LATENCY.labels(
-            method=request.method, endpoint=request.url.path
-        ).observe(time.time() - start_time)
+                REQUEST_COUNT.labels(
+                    method=request.method, endpoint=endpoint, status=status
+                ).inc()
 
-        return response
+                REQUEST_LATENCY.labels(
+                    method=request.method, endpoint=endpoint
+                ).observe(time.perf_counter() - start_time)
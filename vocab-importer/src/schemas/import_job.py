@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+ImportJobStatus = Literal["queued", "running", "completed", "failed"]
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ImportJob(BaseModel):
+    id: str
+    filename: str
+    content_type: str
+    status: ImportJobStatus = "queued"
+    size_bytes: int = 0
+    batch_size: int
+    batches_committed: int = 0
+    words_committed: int = 0
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
@@ -1,10 +1,11 @@
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Optional
 
 import httpx
 from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 
 from ..config import Settings
 from ..errors.exceptions import VocabImporterError
+from .http_client import get_client
 
 settings = Settings()
 
@@ -14,16 +15,17 @@ settings = Settings()
     wait=wait_exponential(multiplier=1, min=4, max=10),
     reraise=True,
 )
-async def get_vocabulary():
+async def get_vocabulary(client: Optional[httpx.AsyncClient] = None):
     """Get vocabulary from backend."""
+    client = client or get_client()
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{settings.BACKEND_URL}/api/vocabulary",
-                headers={"Accept": "application/json"},
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await client.get(
+            f"{settings.BACKEND_URL}/api/vocabulary",
+            headers={"Accept": "application/json"},
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         raise VocabImporterError(f"Error fetching from backend: {str(e)}")
     except Exception as e:
@@ -35,16 +37,57 @@ async def get_vocabulary():
     wait=wait_exponential(multiplier=1, min=4, max=10),
     reraise=True,
 )
-async def save_vocabulary(vocabulary_data: dict):
+async def save_vocabulary(
+    vocabulary_data: dict, client: Optional[httpx.AsyncClient] = None
+):
     """Save vocabulary to backend."""
+    client = client or get_client()
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.BACKEND_URL}/api/vocabulary", json=vocabulary_data
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await client.post(
+            f"{settings.BACKEND_URL}/api/vocabulary", json=vocabulary_data
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPError as e:
         raise VocabImporterError(f"Error saving to backend: {str(e)}")
     except Exception as e:
         raise VocabImporterError(f"Unexpected error: {str(e)}")
+
+
+async def stream_vocabulary(
+    client: Optional[httpx.AsyncClient] = None,
+) -> AsyncIterator[bytes]:
+    """Stream the vocabulary export from backend as NDJSON chunks.
+
+    The connection is opened and the status checked before returning, so
+    backend errors surface here rather than halfway through the response.
+    """
+    client = client or get_client()
+    try:
+        request = client.build_request(
+            "GET",
+            f"{settings.BACKEND_URL}/api/vocabulary/export",
+            headers={"Accept": "application/x-ndjson"},
+            timeout=httpx.Timeout(settings.TIMEOUT, read=None),
+        )
+        response = await client.send(request, stream=True)
+    except httpx.HTTPError as e:
+        raise VocabImporterError(f"Error fetching from backend: {str(e)}")
+    except Exception as e:
+        raise VocabImporterError(f"Unexpected error: {str(e)}")
+
+    try:
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        await response.aclose()
+        raise VocabImporterError(f"Error fetching from backend: {str(e)}")
+
+    async def iter_chunks() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+        finally:
+            # Returns the connection to the shared pool
+            await response.aclose()
+
+    return iter_chunks()
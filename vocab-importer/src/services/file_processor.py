@@ -1,11 +1,13 @@
+import asyncio
 import csv
+import io
 import json
 import logging
-from io import StringIO
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
 
 from fastapi import HTTPException, UploadFile
 
+from ..monitoring import PARSE_LATENCY
 from ..schemas.vocabulary import VocabularyGroup, VocabularyImport
 
 logger = logging.getLogger(__name__)
@@ -21,7 +23,21 @@ async def process_file(file: UploadFile) -> Dict[str, List[Dict[str, Any]]]:
         FileProcessingError: If file processing fails
         JSONDecodeError: If JSON is invalid
     """
+    with PARSE_LATENCY.labels(content_type=file.content_type).time():
+        return await _process_file(file)
+
+
+async def _process_file(file: UploadFile) -> Dict[str, List[Dict[str, Any]]]:
     try:
+        if file.content_type == "text/csv":
+            # Process CSV - assume group,word format, parsed chunk by chunk
+            return {
+                "groups": [
+                    {"group": group, "words": words}
+                    for group, words in (await process_csv_content(file)).items()
+                ]
+            }
+
         content = await file.read()
 
         if file.content_type == "application/json":
@@ -51,15 +67,6 @@ async def process_file(file: UploadFile) -> Dict[str, List[Dict[str, Any]]]:
                 ]
             }
 
-        elif file.content_type == "text/csv":
-            # Process CSV - assume group,word format
-            return {
-                "groups": [
-                    {"group": group, "words": words}
-                    for group, words in process_csv_content(content).items()
-                ]
-            }
-
         elif file.content_type == "application/pdf":
             # TODO: Implement PDF processing
             raise NotImplementedError("PDF processing not yet implemented")
@@ -78,32 +85,125 @@ async def process_file(file: UploadFile) -> Dict[str, List[Dict[str, Any]]]:
         raise HTTPException(status_code=500, detail="File processing failed")
 
 
-def process_csv_content(content: bytes) -> Dict[str, List[str]]:
-    """Process CSV content with proper validation and error handling."""
-    lines = content.decode().splitlines()
-    if not lines:
+def _check_csv_header(header: List[str] | None) -> None:
+    if header is None:
         raise ValueError("Empty CSV file")
+    if len(header) != 2 or header != ["group", "word"]:
+        raise ValueError("Invalid CSV format. Expected header: group,word")
 
-    groups = {}
-    reader = csv.reader(StringIO("\n".join(lines)))
 
-    header = next(reader, None)
-    if not header or len(header) != 2 or header != ["group", "word"]:
-        raise ValueError("Invalid CSV format. Expected header: group,word")
+def _check_csv_row(row: List[str], row_num: int) -> Tuple[str, str] | None:
+    """Validate a data row, returning ``None`` for empty lines."""
+    if not row:  # Skip empty lines
+        return None
+    if len(row) != 2:
+        raise ValueError(f"Invalid row format at line {row_num}: {','.join(row)}")
+
+    group, word = row
+    group = group.strip()
+    word = word.strip()
+
+    if not group or not word:
+        raise ValueError(f"Empty group or word at line {row_num}")
+
+    return group, word
+
+
+def iter_csv_pairs(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yield validated ``(group, word)`` pairs from CSV lines."""
+    reader = csv.reader(lines)
+    _check_csv_header(next(reader, None))
 
     for row_num, row in enumerate(reader, start=2):
-        if not row:  # Skip empty lines
-            continue
-        if len(row) != 2:
-            raise ValueError(f"Invalid row format at line {row_num}: {','.join(row)}")
+        pair = _check_csv_row(row, row_num)
+        if pair:
+            yield pair
 
-        group, word = row
-        group = group.strip()
-        word = word.strip()
 
-        if not group or not word:
-            raise ValueError(f"Empty group or word at line {row_num}")
+def iter_csv_upload(file: UploadFile) -> Iterator[Tuple[str, str]]:
+    """Yield validated ``(group, word)`` pairs from an uploaded CSV.
 
-        groups.setdefault(group, []).append(word)
+    The spooled upload is decoded through a buffered text wrapper, so only
+    the buffer is held in memory alongside the caller's output.
+    """
+    lines = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        yield from iter_csv_pairs(lines)
+    finally:
+        # Leave the upload open for its owner to close
+        lines.detach()
 
+
+def _group_pairs(pairs: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    groups: Dict[str, List[str]] = {}
+    for group, word in pairs:
+        groups.setdefault(group, []).append(word)
     return groups
+
+
+async def process_csv_content(file: UploadFile) -> Dict[str, List[str]]:
+    """Process an uploaded CSV into words grouped by their group column.
+
+    The spooled upload is read with blocking calls (it may be on disk), so
+    it is parsed in a worker thread to keep the event loop free.
+    """
+    return await asyncio.to_thread(_group_pairs, iter_csv_upload(file))
+
+
+# Content types that can be imported in batches, see iter_vocabulary_batches
+BATCH_CONTENT_TYPES = ("application/json", "text/plain", "text/csv")
+
+
+def _iter_pairs(fileobj: BinaryIO, content_type: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(group, word)`` pairs from a file without loading it whole.
+
+    JSON has no incremental parser in our dependencies, so it is loaded in
+    full and validated before its pairs are yielded.
+    """
+    if content_type == "application/json":
+        data = json.load(fileobj)
+        if isinstance(data, list):
+            data = {"groups": data}
+        elif not isinstance(data, dict):
+            raise ValueError("Invalid data structure")
+        for group in VocabularyImport(**data).groups:
+            for word in group.words:
+                yield group.group, word
+
+    elif content_type == "text/plain":
+        lines = io.TextIOWrapper(fileobj, encoding="utf-8")
+        for line in lines:
+            word = line.strip()
+            if word:
+                yield "Imported Words", word
+
+    elif content_type == "text/csv":
+        lines = io.TextIOWrapper(fileobj, encoding="utf-8", newline="")
+        yield from iter_csv_pairs(lines)
+
+    else:
+        raise ValueError(f"Processing {content_type} files not implemented")
+
+
+def iter_vocabulary_batches(
+    fileobj: BinaryIO, content_type: str, batch_size: int
+) -> Iterator[Dict[str, List[Dict[str, Any]]]]:
+    """Parse a file into vocabulary documents of at most ``batch_size`` words.
+
+    Each batch has the same format as ``process_file`` output, so it can be
+    sent to the backend on its own. Batches are produced in file order, which
+    makes them stable across runs and lets an import resume by skipping the
+    batches that were already committed.
+    """
+    groups: Dict[str, List[str]] = {}
+    count = 0
+    for group, word in _iter_pairs(fileobj, content_type):
+        groups.setdefault(group, []).append(word)
+        count += 1
+        if count >= batch_size:
+            yield {"groups": [{"group": g, "words": w} for g, w in groups.items()]}
+            groups = {}
+            count = 0
+
+    if groups:
+        yield {"groups": [{"group": g, "words": w} for g, w in groups.items()]}
@@ -0,0 +1,144 @@
+import logging
+import time
+from typing import AsyncIterator, Callable, Optional
+
+import httpx
+
+from ..config import Settings
+from ..monitoring import (
+    BACKEND_CALL_LATENCY,
+    BACKEND_POOL_IN_USE,
+    BACKEND_POOL_SATURATION,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that reports when its pooled connection is released."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class PoolMetricsTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that tracks how much of the connection pool is busy.
+
+    It also times each backend call until its response headers arrive.
+
+    A request holds a connection from when it is sent until its response body
+    is closed, which for streamed responses can be long after the headers
+    arrive, so the count is released from the response stream.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_connections: int):
+        self._transport = transport
+        self.max_connections = max_connections
+        self.in_use = 0
+
+    def _set_in_use(self, delta: int) -> None:
+        self.in_use += delta
+        BACKEND_POOL_IN_USE.set(self.in_use)
+        BACKEND_POOL_SATURATION.set(min(self.in_use / self.max_connections, 1.0))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._set_in_use(1)
+        start_time = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._set_in_use(-1)
+            self._observe(request, "error", start_time)
+            raise
+        self._observe(request, response.status_code, start_time)
+        if response.is_closed:
+            # Fully buffered bodies never hold the connection past this point
+            self._set_in_use(-1)
+            return response
+        response.stream = _ReleasingStream(
+            response.stream, lambda: self._set_in_use(-1)
+        )
+        return response
+
+    @staticmethod
+    def _observe(request: httpx.Request, status, start_time: float) -> None:
+        # Backend paths carry no ids, so the path is a bounded label
+        BACKEND_CALL_LATENCY.labels(
+            method=request.method, endpoint=request.url.path, status=status
+        ).observe(time.perf_counter() - start_time)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def create_client(settings: Settings) -> httpx.AsyncClient:
+    """Create a pooled client for calls to the backend."""
+    limits = httpx.Limits(
+        max_connections=settings.BACKEND_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.BACKEND_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.BACKEND_KEEPALIVE_EXPIRY,
+    )
+    http2 = settings.BACKEND_HTTP2 and HTTP2_AVAILABLE
+    transport = PoolMetricsTransport(
+        httpx.AsyncHTTPTransport(limits=limits, http2=http2),
+        max_connections=settings.BACKEND_MAX_CONNECTIONS,
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.TIMEOUT),
+        transport=transport,
+    )
+
+
+async def open_client(settings: Settings) -> httpx.AsyncClient:
+    """Create the shared backend client, called on application startup."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+    _client = create_client(settings)
+    logger.info(
+        f"Backend client pool opened (max {settings.BACKEND_MAX_CONNECTIONS} "
+        f"connections, http2={settings.BACKEND_HTTP2 and HTTP2_AVAILABLE})"
+    )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared backend client, called on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared backend client.
+
+    Outside the app lifespan (scripts, tests) the client is created lazily.
+    """
+    global _client
+    if _client is None:
+        _client = create_client(Settings())
+    return _client
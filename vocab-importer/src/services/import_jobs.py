@@ -0,0 +1,210 @@
+import asyncio
+import glob
+import itertools
+import logging
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from fastapi import UploadFile, status
+
+from ..config import Settings
+from ..errors.exceptions import FileProcessingError, VocabImporterError
+from ..schemas.import_job import ImportJob, utcnow
+from .backend_service import save_vocabulary
+from .file_processor import BATCH_CONTENT_TYPES, iter_vocabulary_batches
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024  # 64KB chunks when spooling uploads
+CHECKPOINT_SUFFIX = ".json"  # job state saved next to its spooled upload
+
+
+class ImportJobManager:
+    """Runs imports in the background in checkpointed batches.
+
+    Uploads are spooled to disk once, then parsed as a stream and pushed to
+    the backend ``IMPORT_BATCH_SIZE`` words at a time. ``batches_committed``
+    is advanced only after the backend accepts a batch, so a failed job can
+    be resumed from the first batch that did not go through. The backend
+    import is idempotent, which makes replaying a partially applied batch safe.
+
+    Each job's state is saved next to its upload on every change, and the
+    jobs of uploads still on disk are restored on startup, so a job can be
+    resumed after a restart too.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+        self.paths: Dict[str, str] = {}
+        self._restore_jobs()
+
+    async def create_job(self, file: UploadFile) -> ImportJob:
+        """Spool the upload to disk, enforcing the size limit, and queue a job."""
+        if file.content_type not in BATCH_CONTENT_TYPES:
+            raise FileProcessingError(
+                f"Background import of {file.content_type} files is not supported",
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+
+        job_id = uuid.uuid4().hex
+        fd, path = tempfile.mkstemp(
+            prefix=f"import_{job_id}_", dir=self.settings.IMPORT_JOB_DIR
+        )
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := await file.read(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.settings.MAX_FILE_SIZE:
+                        max_mb = self.settings.MAX_FILE_SIZE / 1024 / 1024
+                        raise FileProcessingError(
+                            f"File too large. Maximum size is {max_mb:.1f}MB",
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        )
+                    await asyncio.to_thread(out.write, chunk)
+        except BaseException:
+            os.unlink(path)
+            raise
+
+        job = ImportJob(
+            id=job_id,
+            filename=file.filename,
+            content_type=file.content_type,
+            size_bytes=size,
+            batch_size=self.settings.IMPORT_BATCH_SIZE,
+        )
+        self.jobs[job_id] = job
+        self.paths[job_id] = path
+        self._save_checkpoint(job)
+        self._evict_finished()
+        return job
+
+    def get_job(self, job_id: str) -> Optional[ImportJob]:
+        return self.jobs.get(job_id)
+
+    def resume_job(self, job_id: str) -> ImportJob:
+        """Re-queue a failed job so it continues after its last checkpoint."""
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise VocabImporterError(
+                f"Import job {job_id} not found", status_code=status.HTTP_404_NOT_FOUND
+            )
+        if job.status != "failed":
+            raise VocabImporterError(
+                f"Only failed jobs can be resumed (job is {job.status})",
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        self._update(job, status="queued", error=None)
+        return job
+
+    async def run_job(self, job_id: str) -> None:
+        """Push the job's batches to the backend, skipping committed ones."""
+        job = self.jobs[job_id]
+        path = self.paths[job_id]
+        self._update(job, status="running")
+
+        try:
+            with open(path, "rb") as fileobj:
+                batches = iter_vocabulary_batches(
+                    fileobj, job.content_type, job.batch_size
+                )
+                # Parsing reads the spooled file, so it runs off the event loop
+                for index in itertools.count():
+                    batch = await asyncio.to_thread(next, batches, None)
+                    if batch is None:
+                        break
+                    if index < job.batches_committed:
+                        continue
+                    await save_vocabulary(batch)
+                    self._update(
+                        job,
+                        batches_committed=job.batches_committed + 1,
+                        words_committed=job.words_committed
+                        + sum(len(g["words"]) for g in batch["groups"]),
+                    )
+        except Exception as e:
+            logger.warning(
+                f"Import job {job_id} failed after "
+                f"{job.batches_committed} batches: {str(e)}"
+            )
+            self._update(job, status="failed", error=str(e))
+            return
+
+        self._update(job, status="completed")
+        self._discard_file(job_id)
+        logger.info(
+            f"Import job {job_id} imported {job.words_committed} words "
+            f"from {job.filename}"
+        )
+
+    def _update(self, job: ImportJob, **changes) -> None:
+        for field, value in changes.items():
+            setattr(job, field, value)
+        job.updated_at = utcnow()
+        self._save_checkpoint(job)
+
+    def _save_checkpoint(self, job: ImportJob) -> None:
+        path = self.paths.get(job.id)
+        if path is None:
+            return
+        checkpoint = path + CHECKPOINT_SUFFIX
+        # Written aside and renamed, so a crash never leaves a torn checkpoint
+        with open(checkpoint + ".tmp", "w", encoding="utf-8") as out:
+            out.write(job.model_dump_json())
+        os.replace(checkpoint + ".tmp", checkpoint)
+
+    def _restore_jobs(self) -> None:
+        """Load the jobs whose uploads are still spooled in ``IMPORT_JOB_DIR``.
+
+        A job that was queued or running when the process stopped is marked
+        failed, so it can be resumed from its last checkpoint.
+        """
+        directory = self.settings.IMPORT_JOB_DIR or tempfile.gettempdir()
+        jobs = []
+        for checkpoint in glob.glob(
+            os.path.join(directory, f"import_*{CHECKPOINT_SUFFIX}")
+        ):
+            path = checkpoint.removesuffix(CHECKPOINT_SUFFIX)
+            try:
+                with open(checkpoint, encoding="utf-8") as f:
+                    job = ImportJob.model_validate_json(f.read())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable import checkpoint: {e}")
+                continue
+            if os.path.exists(path):
+                jobs.append((job, path))
+
+        for job, path in sorted(jobs, key=lambda item: item[0].created_at):
+            self.jobs[job.id] = job
+            self.paths[job.id] = path
+            if job.status in ("queued", "running"):
+                self._update(job, status="failed", error="Interrupted by a restart")
+        if jobs:
+            logger.info(f"Restored {len(jobs)} import jobs from {directory}")
+
+    def _discard_file(self, job_id: str) -> None:
+        path = self.paths.pop(job_id, None)
+        if path is None:
+            return
+        for leftover in (path, path + CHECKPOINT_SUFFIX):
+            if os.path.exists(leftover):
+                try:
+                    os.unlink(leftover)
+                except OSError as e:
+                    logger.error(f"Error cleaning up import file: {e}")
+
+    def _evict_finished(self) -> None:
+        """Forget the oldest finished jobs beyond ``IMPORT_JOB_HISTORY``."""
+        finished = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job.status in ("completed", "failed")
+        ]
+        excess = len(finished) - self.settings.IMPORT_JOB_HISTORY
+        for job_id in finished[: max(excess, 0)]:
+            self._discard_file(job_id)
+            del self.jobs[job_id]
@@ -0,0 +1,73 @@
+import io
+
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from src.services.file_processor import (
+    iter_csv_upload,
+    process_csv_content,
+    process_file,
+)
+
+
+def _upload(content: bytes, content_type: str = "text/csv") -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename="words.csv",
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_csv_content_groups_words():
+    content = "group,word\nFruits,măr\nColours,roșu\n\nFruits, pară \n".encode()
+
+    groups = await process_csv_content(_upload(content))
+
+    assert groups == {"Fruits": ["măr", "pară"], "Colours": ["roșu"]}
+
+
+def test_iter_csv_upload_reads_multiline_records():
+    # Multi-byte characters, CRLF endings and a quoted field with a newline
+    content = 'group,word\r\nFruits,măr\r\n"Two\r\nlines",țară\r\n'.encode()
+    upload = _upload(content)
+
+    pairs = list(iter_csv_upload(upload))
+
+    assert pairs == [("Fruits", "măr"), ("Two\r\nlines", "țară")]
+    assert not upload.file.closed
+
+
+@pytest.mark.asyncio
+async def test_process_csv_content_keeps_stray_quotes():
+    # A quote inside an unquoted field is text, not the start of a record
+    content = b'group,word\nFood,5" pizza\nFood,apple\n'
+
+    groups = await process_csv_content(_upload(content))
+
+    assert groups == {"Food": ['5" pizza', "apple"]}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content,message",
+    [
+        (b"", "Empty CSV file"),
+        (b"word,group\nFruits,apple\n", "Expected header: group,word"),
+        (b"group,word\nFruits,apple\nFruits\n", "Invalid row format at line 3"),
+        (b"group,word\nFruits,\n", "Empty group or word at line 2"),
+    ],
+)
+async def test_process_csv_content_validation(content, message):
+    with pytest.raises(ValueError, match=message):
+        await process_csv_content(_upload(content))
+
+
+@pytest.mark.asyncio
+async def test_process_file_csv():
+    content = b"group,word\nFruits,apple\nFruits,pear\n"
+
+    result = await process_file(_upload(content))
+
+    assert result == {"groups": [{"group": "Fruits", "words": ["apple", "pear"]}]}
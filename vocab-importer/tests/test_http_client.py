@@ -0,0 +1,65 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import create_app
+from src.monitoring import BACKEND_POOL_IN_USE, BACKEND_POOL_SATURATION
+from src.services import http_client
+from src.services.backend_service import save_vocabulary, stream_vocabulary
+from src.services.http_client import PoolMetricsTransport
+
+
+class _StreamedBody(httpx.AsyncByteStream):
+    def __init__(self, content: bytes):
+        self.content = content
+
+    async def __aiter__(self):
+        yield self.content
+
+
+def _backend(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/vocabulary/export":
+        return httpx.Response(200, stream=_StreamedBody(b'{"type": "group"}\n'))
+    return httpx.Response(201, json={"success": True})
+
+
+def _client(max_connections: int = 4) -> httpx.AsyncClient:
+    transport = PoolMetricsTransport(httpx.MockTransport(_backend), max_connections)
+    return httpx.AsyncClient(transport=transport)
+
+
+def test_lifespan_opens_and_closes_shared_client():
+    app = create_app()
+
+    with TestClient(app):
+        client = app.state.http_client
+        assert http_client.get_client() is client
+        assert not client.is_closed
+
+    assert client.is_closed
+    assert http_client._client is None
+
+
+@pytest.mark.asyncio
+async def test_save_vocabulary_uses_injected_client():
+    async with _client() as client:
+        result = await save_vocabulary({"groups": []}, client=client)
+
+    assert result == {"success": True}
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_track_streamed_responses():
+    async with _client(max_connections=4) as client:
+        chunks = await stream_vocabulary(client=client)
+
+        # The connection is held until the streamed body is consumed
+        assert client._transport.in_use == 1
+        assert BACKEND_POOL_IN_USE._value.get() == 1
+        assert BACKEND_POOL_SATURATION._value.get() == 0.25
+
+        body = b"".join([chunk async for chunk in chunks])
+
+    assert body == b'{"type": "group"}\n'
+    assert client._transport.in_use == 0
+    assert BACKEND_POOL_SATURATION._value.get() == 0
@@ -0,0 +1,139 @@
+import io
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from src.main import create_app
+from src.services.file_processor import iter_vocabulary_batches
+
+CSV_CONTENT = (
+    "group,word\n"
+    "Fruits,măr\n"
+    "Fruits,pară\n"
+    "Colours,roșu\n"
+    "Colours,verde\n"
+    "Animals,pisică\n"
+).encode()
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    monkeypatch.setenv("IMPORT_BATCH_SIZE", "2")
+    monkeypatch.setenv("IMPORT_JOB_DIR", str(tmp_path))
+    return create_app()
+
+
+async def _start_job(ac):
+    response = await ac.post(
+        "/import?background=true",
+        files={"file": ("words.csv", CSV_CONTENT, "text/csv")},
+    )
+    assert response.status_code == 202
+    return response.json()["job_id"]
+
+
+def test_iter_vocabulary_batches_limits_batch_size():
+    batches = list(iter_vocabulary_batches(io.BytesIO(CSV_CONTENT), "text/csv", 2))
+
+    assert batches == [
+        {"groups": [{"group": "Fruits", "words": ["măr", "pară"]}]},
+        {"groups": [{"group": "Colours", "words": ["roșu", "verde"]}]},
+        {"groups": [{"group": "Animals", "words": ["pisică"]}]},
+    ]
+
+
+def test_iter_vocabulary_batches_validates_csv():
+    content = b"group,word\nFruits,\n"
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_vocabulary_batches(io.BytesIO(content), "text/csv", 2))
+
+
+@pytest.mark.asyncio
+async def test_background_import_completes(app, tmp_path):
+    mock_save = AsyncMock(return_value={"success": True})
+
+    with patch("src.services.import_jobs.save_vocabulary", mock_save):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            job_id = await _start_job(ac)
+            response = await ac.get(f"/import/{job_id}")
+
+    job = response.json()
+    assert job["status"] == "completed"
+    assert job["batches_committed"] == 3
+    assert job["words_committed"] == 5
+    assert mock_save.await_count == 3
+    # The spooled upload is removed once the job is done
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_failed_import_resumes_from_checkpoint(app):
+    mock_save = AsyncMock(
+        side_effect=[{"success": True}, Exception("Backend unavailable")]
+    )
+
+    with patch("src.services.import_jobs.save_vocabulary", mock_save):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            job_id = await _start_job(ac)
+            job = (await ac.get(f"/import/{job_id}")).json()
+            assert job["status"] == "failed"
+            assert job["batches_committed"] == 1
+            assert "Backend unavailable" in job["error"]
+
+            mock_save.reset_mock(side_effect=True)
+            mock_save.return_value = {"success": True}
+            response = await ac.post(f"/import/{job_id}/resume")
+            assert response.status_code == 202
+
+            job = (await ac.get(f"/import/{job_id}")).json()
+
+    assert job["status"] == "completed"
+    assert job["words_committed"] == 5
+    # Only the two batches after the checkpoint were sent again
+    sent = [call.args[0]["groups"][0]["group"] for call in mock_save.await_args_list]
+    assert sent == ["Colours", "Animals"]
+
+
+@pytest.mark.asyncio
+async def test_import_job_not_found(app):
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        assert (await ac.get("/import/missing")).status_code == 404
+        assert (await ac.post("/import/missing/resume")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_failed_import_resumes_after_restart(app):
+    mock_save = AsyncMock(
+        side_effect=[{"success": True}, Exception("Backend unavailable")]
+    )
+    with patch("src.services.import_jobs.save_vocabulary", mock_save):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            job_id = await _start_job(ac)
+
+    # A new process picks the job up from the checkpoint beside the upload
+    mock_save = AsyncMock(return_value={"success": True})
+    with patch("src.services.import_jobs.save_vocabulary", mock_save):
+        async with AsyncClient(app=create_app(), base_url="http://test") as ac:
+            job = (await ac.get(f"/import/{job_id}")).json()
+            assert job["status"] == "failed"
+            assert job["batches_committed"] == 1
+
+            await ac.post(f"/import/{job_id}/resume")
+            job = (await ac.get(f"/import/{job_id}")).json()
+
+    assert job["status"] == "completed"
+    assert job["words_committed"] == 5
+    assert mock_save.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_background_import_rejects_unsupported_types(app, tmp_path):
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.post(
+            "/import?background=true",
+            files={"file": ("words.pdf", b"%PDF-1.4", "application/pdf")},
+        )
+
+    assert response.status_code == 415
+    assert list(tmp_path.iterdir()) == []
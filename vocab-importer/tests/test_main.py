@@ -5,19 +5,22 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
+from src.errors.exceptions import VocabImporterError
 from src.main import create_app, generate_vocab_with_openai
 
 
-def test_generate_vocab_with_openai_development_mode():
+@pytest.mark.asyncio
+async def test_generate_vocab_with_openai_development_mode():
     with patch.dict("os.environ", {"DEVELOPMENT_MODE": "true"}):
-        result = generate_vocab_with_openai()
+        result = await generate_vocab_with_openai()
         assert "groups" in result
         assert len(result["groups"]) == 2
         assert result["groups"][0]["group"] == "Basic Greetings"
 
 
 @patch("src.main.get_openai_client")
-def test_generate_vocab_with_openai_api_call(mock_client):
+@pytest.mark.asyncio
+async def test_generate_vocab_with_openai_api_call(mock_client):
     # Create mock response
     mock_response = MagicMock()
     mock_response.choices = [
@@ -27,9 +30,11 @@ def test_generate_vocab_with_openai_api_call(mock_client):
             )
         )
     ]
-    mock_client.return_value.chat.completions.create.return_value = mock_response
+    mock_client.return_value.chat.completions.create = AsyncMock(
+        return_value=mock_response
+    )
 
-    result = generate_vocab_with_openai()
+    result = await generate_vocab_with_openai()
 
     # Verify result
     assert "groups" in result
@@ -38,18 +43,20 @@ def test_generate_vocab_with_openai_api_call(mock_client):
 
 
 @patch("src.main.get_openai_client")
-def test_generate_vocab_with_openai_error_handling(mock_client):
-    mock_client.return_value.chat.completions.create.side_effect = Exception(
-        "API Error"
+@pytest.mark.asyncio
+async def test_generate_vocab_with_openai_error_handling(mock_client):
+    mock_client.return_value.chat.completions.create = AsyncMock(
+        side_effect=Exception("API Error")
     )
 
-    result = generate_vocab_with_openai()
+    result = await generate_vocab_with_openai()
     assert "error" in result
     assert "API Error" in result["error"]
 
 
 @patch("src.main.get_openai_client")
-def test_generate_vocab_with_custom_prompt(mock_client):
+@pytest.mark.asyncio
+async def test_generate_vocab_with_custom_prompt(mock_client):
     custom_prompt = "Generate vocabulary for animals"
 
     # Create mock response
@@ -61,34 +68,40 @@ def test_generate_vocab_with_custom_prompt(mock_client):
             )
         )
     ]
-    mock_client.return_value.chat.completions.create.return_value = mock_response
+    mock_client.return_value.chat.completions.create = AsyncMock(
+        return_value=mock_response
+    )
 
-    result = generate_vocab_with_openai(prompt=custom_prompt)
+    result = await generate_vocab_with_openai(prompt=custom_prompt)
 
     assert "groups" in result
     assert result["groups"][0]["group"] == "Animals"
 
 
 @patch("src.main.get_openai_client")
-def test_generate_vocab_with_rate_limit(mock_client):
-    mock_client.return_value.chat.completions.create.side_effect = Exception(
-        "Rate limit exceeded"
+@pytest.mark.asyncio
+async def test_generate_vocab_with_rate_limit(mock_client):
+    mock_client.return_value.chat.completions.create = AsyncMock(
+        side_effect=Exception("Rate limit exceeded")
     )
 
-    result = generate_vocab_with_openai()
+    result = await generate_vocab_with_openai()
 
     assert "error" in result
     assert "Rate limit exceeded" in result["error"]
 
 
 @patch("src.main.get_openai_client")
-def test_generate_vocab_with_invalid_json(mock_client):
+@pytest.mark.asyncio
+async def test_generate_vocab_with_invalid_json(mock_client):
     # Create mock response with invalid JSON
     mock_response = MagicMock()
     mock_response.choices = [MagicMock(message=MagicMock(content="Invalid JSON"))]
-    mock_client.return_value.chat.completions.create.return_value = mock_response
+    mock_client.return_value.chat.completions.create = AsyncMock(
+        return_value=mock_response
+    )
 
-    result = generate_vocab_with_openai()
+    result = await generate_vocab_with_openai()
 
     assert "error" in result
     assert "Invalid JSON response" in result["error"]
@@ -96,27 +109,49 @@ def test_generate_vocab_with_invalid_json(mock_client):
 
 @pytest.mark.asyncio
 async def test_export_vocabulary():
-    """Test the export vocabulary endpoint."""
+    """Test the export vocabulary endpoint streams NDJSON from the backend."""
     app = create_app()
 
     # Mock data
-    mock_data = {"groups": [{"group": "Test Group", "words": ["test1", "test2"]}]}
+    lines = [
+        {"type": "group", "data": {"id": 1, "name": "Test Group"}},
+        {"type": "word", "data": {"id": 1, "romanian": "test1", "groupIds": [1]}},
+    ]
+
+    async def mock_chunks():
+        for line in lines:
+            yield (json.dumps(line) + "\n").encode()
 
     # Create mock using AsyncMock
-    mock_get = AsyncMock()
-    mock_get.return_value = mock_data
+    mock_stream = AsyncMock()
+    mock_stream.return_value = mock_chunks()
 
     # Patch at the correct level
-    with patch("src.main.get_vocabulary", mock_get):
+    with patch("src.main.stream_vocabulary", mock_stream):
         async with AsyncClient(app=app, base_url="http://test") as ac:
             response = await ac.get("/export")
 
             assert response.status_code == 200
-            assert response.headers["content-type"] == "application/json"
+            assert response.headers["content-type"] == "application/x-ndjson"
             assert "vocabulary_export_" in response.headers["content-disposition"]
 
-            content = response.json()
-            assert content == mock_data
+            content = [json.loads(line) for line in response.text.splitlines()]
+            assert content == lines
 
     # Verify mock was called
-    mock_get.assert_awaited_once()
+    mock_stream.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_export_vocabulary_backend_error():
+    """Test backend failures before streaming starts map to 502."""
+    app = create_app()
+
+    mock_stream = AsyncMock(side_effect=VocabImporterError("Backend unavailable"))
+
+    with patch("src.main.stream_vocabulary", mock_stream):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/export")
+
+            assert response.status_code == 502
+            assert "Backend unavailable" in response.json()["detail"]
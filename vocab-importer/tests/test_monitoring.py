@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+import httpx
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from src.main import create_app
+from src.services.http_client import PoolMetricsTransport
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_requests_are_labelled_with_route_template():
+    labels = {"method": "GET", "endpoint": "/import/{job_id}", "status": "404"}
+    before = _sample("vocab_importer_requests_total", **labels)
+
+    with TestClient(create_app()) as client:
+        client.get("/import/first")
+        client.get("/import/second")
+        client.get("/no/such/page")
+
+    assert _sample("vocab_importer_requests_total", **labels) == before + 2
+    assert _sample(
+        "vocab_importer_requests_total",
+        method="GET",
+        endpoint="unmatched",
+        status="404",
+    )
+    assert _sample("vocab_importer_requests_in_progress") == 0
+
+
+def test_rate_limited_requests_are_counted():
+    labels = {"method": "GET", "endpoint": "/health", "status": "429"}
+    before = _sample("vocab_importer_requests_total", **labels)
+    with patch.dict("os.environ", {"RATE_LIMIT": "1"}):
+        app = create_app()
+
+    with TestClient(app) as client:
+        client.get("/health")
+        client.get("/health")
+
+    assert _sample("vocab_importer_requests_total", **labels) == before + 1
+
+
+def test_metrics_endpoint():
+    with TestClient(create_app()) as client:
+        client.get("/health")
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert b"vocab_importer_requests_total" in response.content
+
+
+async def test_backend_calls_are_timed():
+    labels = {"method": "POST", "endpoint": "/api/vocabulary", "status": "201"}
+    before = _sample("vocab_importer_backend_call_seconds_count", **labels)
+    transport = PoolMetricsTransport(
+        httpx.MockTransport(lambda request: httpx.Response(201, json={})),
+        max_connections=10,
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.post("http://backend/api/vocabulary", json={})
+
+    assert _sample("vocab_importer_backend_call_seconds_count", **labels) == before + 1
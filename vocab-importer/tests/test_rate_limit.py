@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import create_app
+from src.middleware.rate_limit_storage import (
+    SlidingWindowLimiter,
+    SQLiteStorage,
+    TokenBucketLimiter,
+    storage_from_uri,
+)
+
+NOW = 1_700_000_080.0  # 40s into a 60s window
+
+
+@pytest.fixture
+def clock():
+    with patch("src.middleware.rate_limit_storage.time.time", return_value=NOW) as t:
+        yield t
+
+
+async def _hits(limiter, key, count):
+    return [(await limiter.hit(key)).allowed for _ in range(count)]
+
+
+async def test_sliding_window_allows_limit_per_key(clock):
+    limiter = SlidingWindowLimiter(SQLiteStorage(":memory:"), limit=3, window=60)
+
+    assert await _hits(limiter, "1.2.3.4", 4) == [True, True, True, False]
+    assert (await limiter.hit("5.6.7.8")).remaining == 2
+    # Full for this window: retry when it ends
+    assert (await limiter.hit("1.2.3.4")).retry_after == pytest.approx(20)
+
+
+async def test_previous_window_is_weighted(clock):
+    limiter = SlidingWindowLimiter(SQLiteStorage(":memory:"), limit=10, window=60)
+    clock.return_value = NOW - 60
+    assert all(await _hits(limiter, "client", 9))
+
+    # A third of the previous window still overlaps: 9 * 1/3 = 3 hits used
+    clock.return_value = NOW
+    assert await _hits(limiter, "client", 8) == [True] * 7 + [False]
+
+    # Refused only until the previous window's share shrinks
+    clock.return_value = NOW + 3
+    assert (await limiter.hit("client")).allowed
+
+
+async def test_sqlite_storage_is_shared_between_workers(tmp_path, clock):
+    path = str(tmp_path / "limits.db")
+    workers = [
+        SlidingWindowLimiter(SQLiteStorage(path), limit=4, window=60) for _ in range(2)
+    ]
+
+    allowed = [(await workers[i % 2].hit("client")).allowed for i in range(6)]
+
+    assert allowed == [True] * 4 + [False] * 2
+    for worker in workers:
+        await worker.storage.close()
+
+
+def test_token_bucket_refills_over_time():
+    limiter = TokenBucketLimiter(limit=2, window=60)
+
+    assert [limiter.take("client", 0).allowed for _ in range(3)] == [
+        True,
+        True,
+        False,
+    ]
+    refused = limiter.take("client", 0)
+    assert refused.retry_after == pytest.approx(30)
+    assert limiter.take("client", 30).allowed
+    assert not limiter.take("client", 30).allowed
+
+
+def test_token_bucket_tracks_bounded_clients():
+    limiter = TokenBucketLimiter(limit=5, window=60, max_clients=100, shards=4)
+
+    for i in range(10_000):
+        limiter.take(f"10.0.{i // 256}.{i % 256}", now=i / 1000)
+
+    assert len(limiter) <= 100
+    assert limiter.evictions >= 9_900
+
+    limiter.expire(now=70)
+    assert len(limiter) == 0
+
+
+async def test_token_bucket_expires_idle_clients_in_background():
+    limiter = TokenBucketLimiter(limit=5, window=0.01, expire_interval=0.01)
+    await limiter.hit("client")
+    await limiter.start()
+
+    await asyncio.sleep(0.05)
+
+    assert len(limiter) == 0
+    await limiter.close()
+
+
+def test_storage_from_uri(tmp_path):
+    assert isinstance(storage_from_uri(f"sqlite:///{tmp_path}/x.db"), SQLiteStorage)
+    # memory:// is served by TokenBucketLimiter, without a storage
+    for uri in ("memory://", "mongodb://localhost", "sqlite://", "sqlite:///"):
+        with pytest.raises(ValueError):
+            storage_from_uri(uri)
+
+
+def test_middleware_returns_429_when_limited():
+    with patch.dict("os.environ", {"RATE_LIMIT": "2"}):
+        app = create_app()
+
+    with TestClient(app) as client:
+        responses = [client.get("/health") for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert responses[0].headers["X-RateLimit-Remaining"] == "1"
+    assert responses[2].headers["Retry-After"] == "30"
+    assert responses[2].json() == {"detail": "Too many requests"}